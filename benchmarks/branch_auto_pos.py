@@ -0,0 +1,44 @@
+"""
+Benchmark of placing branches with automatic spline positions.
+
+Builds a chain of nodes on a grid and then adds all paths between the
+neighbours of a hub, as eliminating a node does, where every new branch
+has to be moved away from the branches it overlaps.
+
+Run with: python benchmarks/branch_auto_pos.py
+"""
+from time import perf_counter
+from signalflowgrapher.commands.command_handler import CommandHandler
+from signalflowgrapher.controllers.main_controller import MainController
+from signalflowgrapher.model.model import Model, ObservableGraph
+
+NODES = 1500
+HUB_NEIGHBOURS = 12
+
+
+def main():
+    model = Model()
+    controller = MainController(model, CommandHandler())
+    model.graph = ObservableGraph()
+
+    nodes = [controller.create_node(60 * (i % 50), 60 * (i // 50))
+             for i in range(NODES)]
+    start = perf_counter()
+    for start_node, end_node in zip(nodes, nodes[1:]):
+        controller.create_branch_auto_pos(start_node, end_node, "a")
+    chain = perf_counter() - start
+
+    ingoing = nodes[600:600 + HUB_NEIGHBOURS]
+    outgoing = nodes[640:640 + HUB_NEIGHBOURS]
+    start = perf_counter()
+    for start_node in ingoing:
+        for end_node in outgoing:
+            controller.create_branch_auto_pos(start_node, end_node, "b")
+    paths = perf_counter() - start
+
+    print("%s chain branches  %8.4f s" % (NODES - 1, chain))
+    print("%s hub paths       %8.4f s" % (HUB_NEIGHBOURS ** 2, paths))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark of the branch widget geometry of a graph with 500 branches.
+
+Measures panning the graph, dragging all nodes at once, which translates
+every branch, and dragging a single node, which changes the shape of its
+branches. Without a display, run with QT_QPA_PLATFORM=offscreen.
+
+Run with: python benchmarks/branch_geometry.py
+"""
+from time import perf_counter
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication
+from signalflowgrapher.commands.command_handler import CommandHandler
+from signalflowgrapher.controllers.main_controller import MainController
+from signalflowgrapher.gui.graph_field import GraphField
+from signalflowgrapher.model.model import (
+    Model, ObservableGraph, PositionedNode, CurvedBranch)
+
+BRANCHES = 500
+MOVES = 20
+
+
+def ring_graph(nodes: int) -> ObservableGraph:
+    # Ring of nodes on a grid, one branch per node
+    graph = ObservableGraph()
+    node_list = [PositionedNode(graph, 60 * (i % 25), 60 * (i // 25), 0, 20)
+                 for i in range(nodes)]
+    for start, end in zip(node_list, node_list[1:] + node_list[:1]):
+        CurvedBranch(start, end,
+                     start.x + 20, start.y + 10, end.x - 20, end.y + 10,
+                     0, -20, "a")
+    return graph
+
+
+def mouse_event(event_type, position: QPointF) -> QMouseEvent:
+    return QMouseEvent(event_type, position, position, Qt.LeftButton,
+                       Qt.LeftButton, Qt.NoModifier)
+
+
+def timed(name: str, function):
+    start = perf_counter()
+    for i in range(MOVES):
+        function(1 if i % 2 else -1)
+    QApplication.processEvents()
+    print("%-22s %8.4f s" % (name, perf_counter() - start))
+
+
+def main():
+    app = QApplication([])
+    model = Model()
+    command_handler = CommandHandler()
+    controller = MainController(model, command_handler)
+    graph_field = GraphField(controller, model, command_handler)
+    graph_field.show()
+
+    model.graph = ring_graph(BRANCHES)
+    app.processEvents()
+    nodes = list(model.graph.nodes)
+
+    def pan(delta):
+        # Drag on the empty graph field
+        graph_field.mousePressEvent(
+            mouse_event(QEvent.MouseButtonPress, QPointF(0, 0)))
+        graph_field.mouseMoveEvent(
+            mouse_event(QEvent.MouseMove, QPointF(3 * delta, 2 * delta)))
+        graph_field.mouseReleaseEvent(
+            mouse_event(QEvent.MouseButtonRelease,
+                        QPointF(3 * delta, 2 * delta)))
+
+    def drag_all(delta):
+        model.begin_batch()
+        for node in nodes:
+            controller.move_node(node, 3 * delta, 2 * delta)
+        model.end_batch()
+
+    def drag_one(delta):
+        controller.move_node(nodes[0], 3 * delta, 2 * delta)
+
+    print("%s branches, %s moves" % (BRANCHES, MOVES))
+    timed("Pan graph", pan)
+    timed("Drag all nodes", drag_all)
+    timed("Drag one node", drag_one)
+
+
+if __name__ == '__main__':
+    main()
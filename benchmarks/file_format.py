@@ -0,0 +1,54 @@
+"""
+Benchmark of the graph file formats.
+
+Saves a generated graph with 20,000 branches as .sfg file and as compact
+.sfgc file and compares the file sizes and the time to write and read
+them. Reading the .sfg file includes the schema validation.
+
+Run with: python benchmarks/file_format.py
+"""
+import os
+import tempfile
+from time import perf_counter
+from signalflowgrapher.io.columnar import ColumnarExport, ColumnarImport
+from signalflowgrapher.io.json import JSONExport, JSONImport
+from graph_load import grid_graph
+
+
+def main():
+    builder = grid_graph()
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "graph.sfg")
+        columnar_path = os.path.join(directory, "graph.sfgc")
+
+        start = perf_counter()
+        JSONExport().write_as_json(builder, (0, 0), json_path)
+        json_write = perf_counter() - start
+
+        start = perf_counter()
+        json_data = JSONImport().read_from_json(json_path)
+        json_read = perf_counter() - start
+
+        start = perf_counter()
+        ColumnarExport().write_as_columnar(builder, (0, 0), columnar_path)
+        columnar_write = perf_counter() - start
+
+        start = perf_counter()
+        columnar_data = ColumnarImport().read_from_columnar(columnar_path)
+        columnar_read = perf_counter() - start
+
+        assert json_data == columnar_data
+        json_size = os.path.getsize(json_path)
+        columnar_size = os.path.getsize(columnar_path)
+
+    print("%s nodes, %s branches" % (len(json_data["nodes"]),
+                                     len(json_data["branches"])))
+    print("         %10s %10s %10s" % ("size", "write", "read"))
+    print(".sfg     %7.2f MB %8.4f s %8.4f s"
+          % (json_size / 1e6, json_write, json_read))
+    print(".sfgc    %7.2f MB %8.4f s %8.4f s"
+          % (columnar_size / 1e6, columnar_write, columnar_read))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark of loading a graph file with 20,000 branches.
+
+Generates a grid graph with the graph builder, writes it as .sfg file
+and measures building the graph, reading the file and creating the graph
+from it.
+
+Run with: python benchmarks/graph_load.py
+"""
+import os
+import tempfile
+from time import perf_counter
+from signalflowgrapher.io.json import JSONExport, JSONImport
+from signalflowgrapher.model.model import GraphBuilder, ObservableGraph
+
+COLUMNS = 100
+NODES = 10000
+
+
+def grid_graph() -> GraphBuilder:
+    # Grid of nodes, each connected to its right and lower neighbour
+    builder = GraphBuilder()
+    node_list = [builder.add_node(60 * (i % COLUMNS), 60 * (i // COLUMNS))
+                 for i in range(NODES)]
+    for i, start in enumerate(node_list):
+        for end in (node_list[(i + 1) % NODES],
+                    node_list[(i + COLUMNS) % NODES]):
+            builder.add_branch(start, end, "a")
+    return builder
+
+
+def main():
+    start = perf_counter()
+    graph = grid_graph().build()
+    build = perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.sfg")
+        JSONExport().write_as_json(graph, (0, 0), path)
+
+        start = perf_counter()
+        data = JSONImport().read_from_json(path)
+        read = perf_counter() - start
+
+        del data["grid_pos"]
+        start = perf_counter()
+        loaded = ObservableGraph.from_dict(data)
+        create = perf_counter() - start
+
+    print("%s nodes, %s branches" % (len(loaded.nodes),
+                                     len(loaded.branches)))
+    print("Build graph    %8.4f s" % build)
+    print("Read file      %8.4f s" % read)
+    print("Create graph   %8.4f s" % create)
+
+
+if __name__ == '__main__':
+    main()
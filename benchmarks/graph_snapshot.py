@@ -0,0 +1,33 @@
+"""
+Benchmark of graph snapshots.
+
+Loads a generated graph with 20,000 branches with and without persistent
+store and compares taking a snapshot with copying the graph.
+
+Run with: python benchmarks/graph_snapshot.py
+"""
+from time import perf_counter
+from timeit import timeit
+from signalflowgrapher.model.model import ObservableGraph
+from graph_load import grid_graph
+
+SNAPSHOTS = 10
+
+
+def main():
+    data = grid_graph().to_dict()
+    for persistent in (False, True):
+        start = perf_counter()
+        graph = ObservableGraph.from_dict(data, persistent=persistent)
+        load = perf_counter() - start
+
+        snapshot = timeit(graph.snapshot, number=SNAPSHOTS) / SNAPSHOTS
+        print("persistent=%-5s load %8.4f s  snapshot %10.6f s"
+              % (persistent, load, snapshot))
+
+    copy = timeit(graph.copy, number=1)
+    print("copy                                      %10.6f s" % copy)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark of the graph field and the graphics scene based graph view.
+
+Measures loading a ring graph, dragging all nodes at once and repainting
+the view for both backends, and for the graph view also with a graph too
+large for the graph field. Without a display, run with
+QT_QPA_PLATFORM=offscreen.
+
+Run with: python benchmarks/graph_view.py
+"""
+from time import perf_counter
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication, QWidget
+from signalflowgrapher.commands.command_handler import CommandHandler
+from signalflowgrapher.controllers.main_controller import MainController
+from signalflowgrapher.gui.graph_field import GraphField
+from signalflowgrapher.gui.graph_view import GraphView
+from signalflowgrapher.model.model import (
+    Model, ObservableGraph, PositionedNode, CurvedBranch)
+
+BRANCHES = (500,)
+LARGE_BRANCHES = 10000
+MOVES = 10
+
+
+def ring_graph(nodes: int) -> ObservableGraph:
+    # Ring of nodes on a grid, one branch per node
+    graph = ObservableGraph()
+    node_list = [PositionedNode(graph, 60 * (i % 50), 60 * (i // 50), 0, 20)
+                 for i in range(nodes)]
+    for start, end in zip(node_list, node_list[1:] + node_list[:1]):
+        CurvedBranch(start, end,
+                     start.x + 20, start.y + 10, end.x - 20, end.y + 10,
+                     0, -20, "a")
+    return graph
+
+
+def measure(app: QApplication, backend, branches: int):
+    model = Model()
+    command_handler = CommandHandler()
+    controller = MainController(model, command_handler)
+    view = backend(controller, model, command_handler)
+    view.show()
+    app.processEvents()
+
+    start = perf_counter()
+    model.graph = ring_graph(branches)
+    app.processEvents()
+    load = perf_counter() - start
+
+    nodes = list(model.graph.nodes)
+    start = perf_counter()
+    for i in range(MOVES):
+        delta = 1 if i % 2 else -1
+        model.begin_batch()
+        for node in nodes:
+            controller.move_node(node, 3 * delta, 2 * delta)
+        model.end_batch()
+        app.processEvents()
+    drag = perf_counter() - start
+
+    pixmap = QPixmap(view.size())
+    start = perf_counter()
+    for _ in range(MOVES):
+        QWidget.render(view, pixmap)
+    paint = perf_counter() - start
+
+    print("%-10s %6s branches  load %8.4f s  drag all %8.4f s  "
+          "paint %8.4f s" % (backend.__name__, branches, load, drag, paint))
+    view.close()
+    view.deleteLater()
+    app.processEvents()
+
+
+def main():
+    app = QApplication([])
+    print("%s moves and paints" % MOVES)
+    for branches in BRANCHES:
+        measure(app, GraphField, branches)
+        measure(app, GraphView, branches)
+    measure(app, GraphView, LARGE_BRANCHES)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark of loading a graph with 2,000 elements into the graph field.
+
+Compares the font loading of every label, which registered the font file
+for each label, with the shared label font, and measures the time until
+the widgets of the graph are shown. Without a display, run with
+QT_QPA_PLATFORM=offscreen.
+
+Run with: python benchmarks/gui_load.py
+"""
+from time import perf_counter
+from timeit import timeit
+from PySide6.QtGui import QFont, QFontDatabase
+from PySide6.QtWidgets import QApplication
+from signalflowgrapher.commands.command_handler import CommandHandler
+from signalflowgrapher.controllers.main_controller import MainController
+from signalflowgrapher.gui.graph_field import GraphField
+from signalflowgrapher.gui.label_widget import (
+    label_font, _roman_font_path, LABEL_FONT_SIZE)
+from signalflowgrapher.model.model import (
+    Model, ObservableGraph, PositionedNode, CurvedBranch)
+
+ELEMENTS = 2000
+
+
+def chain_graph(nodes: int) -> ObservableGraph:
+    # Chain of nodes on a grid, one branch per node
+    graph = ObservableGraph()
+    node_list = [PositionedNode(graph, 60 * (i % 40), 60 * (i // 40), 0, 20)
+                 for i in range(nodes)]
+    for start, end in zip(node_list, node_list[1:] + node_list[:1]):
+        CurvedBranch(start, end,
+                     start.x + 20, start.y + 10, end.x - 20, end.y + 10,
+                     0, -20, "a")
+    return graph
+
+
+def font_per_label() -> QFont:
+    # Previous font loading of every label
+    font_database = QFontDatabase()
+    font_id = font_database.addApplicationFont(_roman_font_path())
+    font_name = QFontDatabase.applicationFontFamilies(font_id)[0]
+    return QFont(font_name, LABEL_FONT_SIZE)
+
+
+def main():
+    app = QApplication([])
+
+    for name, load_font in (("per label", font_per_label),
+                            ("shared", label_font)):
+        seconds = timeit(load_font, number=ELEMENTS)
+        print("Font of %s labels, %-9s %8.4f s" % (ELEMENTS, name, seconds))
+
+    model = Model()
+    command_handler = CommandHandler()
+    graph_field = GraphField(MainController(model, command_handler),
+                             model, command_handler)
+    graph_field.show()
+
+    graph = chain_graph(ELEMENTS // 2)
+    start = perf_counter()
+    model.graph = graph
+    app.processEvents()
+    print("Load graph with %s elements %8.4f s"
+          % (ELEMENTS, perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
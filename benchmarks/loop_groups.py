@@ -0,0 +1,36 @@
+"""
+Benchmark of the loop group methods of find_loop_groups.
+
+Run with: python benchmarks/loop_groups.py
+"""
+from timeit import timeit
+from signalflowgrapher.algorithms.graph import Graph, Branch, Node
+from signalflowgrapher.algorithms.loop_group import find_loop_groups
+
+
+def ladder_loops(stages: int):
+    # Chain of nodes with a feedback branch and a self loop per stage,
+    # neighbouring loops touch each other
+    graph = Graph()
+    nodes = [Node(graph) for _ in range(stages + 1)]
+    loops = []
+    for i in range(stages):
+        loops.append([Branch(nodes[i], nodes[i + 1], "a%s" % i),
+                      Branch(nodes[i + 1], nodes[i], "b%s" % i)])
+        loops.append([Branch(nodes[i], nodes[i], "c%s" % i)])
+    return loops
+
+
+def main():
+    for stages in (8, 12, 14):
+        loops = ladder_loops(stages)
+        groups = len(find_loop_groups(loops))
+        print("%s loops, %s loop groups" % (len(loops), groups))
+        for method in ("list", "bitset"):
+            seconds = timeit(lambda: find_loop_groups(loops, method),
+                             number=3) / 3
+            print("  %-6s %8.4f s" % (method, seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark of mason on a graph with 200 branches.
+
+Compares the lookup of the original branches of the loops by scanning
+all branches of the graph with the lookup through an index by id.
+
+Run with: python benchmarks/mason.py
+"""
+from timeit import timeit
+from signalflowgrapher.algorithms.graph import Graph, Branch, Node
+from signalflowgrapher.algorithms.johnson import simple_cycles
+from signalflowgrapher.algorithms.mason import mason
+
+
+def feedback_chain(stages: int):
+    # Chain with a feedback branch from every node to the first node
+    graph = Graph()
+    nodes = [Node(graph) for _ in range(stages + 1)]
+    for i, (start, end) in enumerate(zip(nodes, nodes[1:])):
+        Branch(start, end, "a%s" % i)
+        Branch(end, nodes[0], "b%s" % i)
+    return graph, nodes[0], nodes[-1]
+
+
+def scan_lookup(graph, loops):
+    # Previous lookup, scan all branches for every branch of every loop
+    result = []
+    for loop in loops:
+        new_loop = []
+        for loop_branch in loop:
+            branch_iter = iter(graph.branches)
+            existing_branch = next(branch_iter)
+            while not existing_branch.id == loop_branch.id:
+                existing_branch = next(branch_iter)
+            new_loop.append(existing_branch)
+        result.append(new_loop)
+    return result
+
+
+def index_lookup(graph, loops):
+    branches_by_id = {branch.id: branch for branch in graph.branches}
+    return [[branches_by_id[branch.id] for branch in loop]
+            for loop in loops]
+
+
+def main():
+    graph, start, end = feedback_chain(100)
+    loops = list(simple_cycles(graph))
+    print("%s branches, %s loops" % (len(graph.branches), len(loops)))
+
+    for name, lookup in (("scan", scan_lookup), ("index", index_lookup)):
+        seconds = timeit(lambda: lookup(graph, loops), number=3) / 3
+        print("  lookup %-6s %8.4f s" % (name, seconds))
+
+    seconds = timeit(lambda: mason(graph, start, end), number=1)
+    print("  mason         %8.4f s" % seconds)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark of the application startup.
+
+Reports the slowest imports of the GUI modules (using python -X importtime)
+and the time until the main window is shown. Every measurement runs in a
+fresh interpreter. Without a display, run with QT_QPA_PLATFORM=offscreen.
+
+Run with: python benchmarks/startup.py
+"""
+import subprocess
+import sys
+from statistics import median
+
+RUNS = 5
+SLOWEST_IMPORTS = 15
+
+FIRST_WINDOW = """
+from time import perf_counter
+start = perf_counter()
+from PySide6.QtWidgets import QApplication
+app = QApplication([])
+from signalflowgrapher.containers import MainWindows
+window = MainWindows.main_window()
+window.show()
+app.processEvents()
+print(perf_counter() - start)
+"""
+
+
+def import_times():
+    # Cumulative import time in microseconds per module
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         "import signalflowgrapher.containers"],
+        capture_output=True, text=True, check=True).stderr
+
+    times = dict()
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def first_window_time() -> float:
+    output = subprocess.run([sys.executable, "-c", FIRST_WINDOW],
+                            capture_output=True, text=True, check=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    times = import_times()
+    print("Import of signalflowgrapher.containers: %8.1f ms"
+          % (times["signalflowgrapher.containers"] / 1000))
+    print("SymPy imported at startup: %s" % ("sympy" in times))
+    print()
+    print("Slowest imports (cumulative):")
+    for module, time in sorted(times.items(), key=lambda t: -t[1])[
+            :SLOWEST_IMPORTS]:
+        print("  %8.1f ms  %s" % (time / 1000, module))
+    print()
+
+    window_times = [first_window_time() for _ in range(RUNS)]
+    print("Time to first window (median of %s): %8.1f ms"
+          % (RUNS, median(window_times) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,13 @@
 import logging
 import logging.config
-import argparse
 from os import path
 import sys
 from importlib import resources
 from PySide6.QtWidgets import QApplication
 from PySide6 import QtCore
-from signalflowgrapher.containers import MainWindows
 from signalflowgrapher.utils.icon import set_app_icon
+from signalflowgrapher.utils.arguments import (argument_parser,
+                                               STARTUP_FILE_EXTENSIONS)
 
 def main():
     # Instantiate ApplicationContext
@@ -26,14 +26,7 @@ def main():
     logger.info("Starting application")
 
     # Parse command line arguments
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--language', type=str, help='Optional language name')
-    parser.add_argument(
-        'input_file',
-        nargs='?',
-        type=str,
-        help='Optional path to a .sfg or .json file to open at startup'
-    )
+    parser = argument_parser()
     args = parser.parse_args()
 
     app = QApplication([])
@@ -61,6 +54,11 @@ def main():
                 print("Language file %s not found" % language_file)
                 exit(2)
 
+    # The GUI modules are imported after the command line is parsed, so
+    # e.g. --help does not wait for them
+    from signalflowgrapher.containers import MainWindows, Views
+    if args.renderer == 'scene':
+        Views.graph_field.override(Views.graph_view)
     window = MainWindows.main_window()
 
     # Open file specified on command line / startup. If this file cannot be
@@ -70,7 +68,7 @@ def main():
         input_file = args.input_file
         file_ext = path.splitext(input_file)[1].lower()
 
-        if file_ext not in ('.sfg', '.json'):
+        if file_ext not in STARTUP_FILE_EXTENSIONS:
             logger.warning("Unsupported startup file type: %s", input_file)
         elif not path.exists(input_file):
             logger.warning("Startup file not found: %s", input_file)
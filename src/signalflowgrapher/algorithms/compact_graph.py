@@ -0,0 +1,128 @@
+from array import array
+from typing import Dict, Tuple, Union
+from signalflowgrapher.algorithms.graph import (
+    Graph, GraphSnapshot, Node, Branch)
+
+
+class CompactGraph(object):
+    """
+    Immutable, integer indexed snapshot of a graph for algorithms.
+    Nodes are numbered 0..n-1 and branches 0..m-1. Outgoing and ingoing
+    branches of every node are stored in compressed sparse row format,
+    so traversing the graph does not copy any sets. Start, end and weight
+    of the branches are taken from the snapshot if a GraphSnapshot is
+    given.
+    """
+
+    def __init__(self, graph: Union[Graph, GraphSnapshot]):
+        super().__init__()
+        self.__nodes: Tuple[Node, ...] = tuple(graph.nodes)
+        self.__branches: Tuple[Branch, ...] = tuple(graph.branches)
+        self.__node_index: Dict[Node, int] = {
+            node: index for index, node in enumerate(self.__nodes)}
+        self.__branch_index: Dict[Branch, int] = {
+            branch: index for index, branch in enumerate(self.__branches)}
+
+        if isinstance(graph, GraphSnapshot):
+            states = [graph.branch_state(branch)
+                      for branch in self.__branches]
+        else:
+            states = [(branch.start, branch.end, branch.weight)
+                      for branch in self.__branches]
+
+        self.__weights: Tuple[str, ...] = tuple(
+            weight for _, _, weight in states)
+        self.__starts = array('l', (self.__node_index[start]
+                                    for start, _, _ in states))
+        self.__ends = array('l', (self.__node_index[end]
+                                  for _, end, _ in states))
+
+        self.__out_offsets, self.__out_branches = \
+            self.__build_adjacency(self.__starts)
+        self.__in_offsets, self.__in_branches = \
+            self.__build_adjacency(self.__ends)
+
+    def __getstate__(self):
+        # Only the integer structure and the weights are pickled, e.g. to
+        # send the snapshot to worker processes. The original nodes and
+        # branches are not available in the unpickled snapshot.
+        state = self.__dict__.copy()
+        state["_CompactGraph__nodes"] = None
+        state["_CompactGraph__branches"] = None
+        state["_CompactGraph__node_index"] = None
+        state["_CompactGraph__branch_index"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def __build_adjacency(self, owners: array) -> Tuple[array, array]:
+        # Counting sort of the branch indices by owning node
+        offsets = array('l', [0]) * (len(self.__nodes) + 1)
+        for owner in owners:
+            offsets[owner + 1] += 1
+        for i in range(len(self.__nodes)):
+            offsets[i + 1] += offsets[i]
+
+        position = array('l', offsets)
+        branches = array('l', [0]) * len(owners)
+        for branch, owner in enumerate(owners):
+            branches[position[owner]] = branch
+            position[owner] += 1
+
+        return offsets, branches
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the snapshot."""
+        return len(self.__out_offsets) - 1
+
+    @property
+    def branch_count(self) -> int:
+        """Number of branches in the snapshot."""
+        return len(self.__starts)
+
+    @property
+    def nodes(self) -> Tuple[Node, ...]:
+        """Original nodes, the position is the node index."""
+        return self.__nodes
+
+    @property
+    def branches(self) -> Tuple[Branch, ...]:
+        """Original branches, the position is the branch index."""
+        return self.__branches
+
+    @property
+    def weights(self) -> Tuple[str, ...]:
+        """Weights of the branches, the position is the branch index."""
+        return self.__weights
+
+    @property
+    def starts(self) -> memoryview:
+        """Index of the start node per branch index."""
+        return memoryview(self.__starts).toreadonly()
+
+    @property
+    def ends(self) -> memoryview:
+        """Index of the end node per branch index."""
+        return memoryview(self.__ends).toreadonly()
+
+    def node_index(self, node: Node) -> int:
+        """Get index of the given node."""
+        return self.__node_index[node]
+
+    def branch_index(self, branch: Branch) -> int:
+        """Get index of the given branch."""
+        return self.__branch_index[branch]
+
+    def outgoing(self, node: int) -> memoryview:
+        """Indices of the outgoing branches of the node with given index."""
+        return memoryview(self.__out_branches)[
+            self.__out_offsets[node]:self.__out_offsets[node + 1]
+        ].toreadonly()
+
+    def ingoing(self, node: int) -> memoryview:
+        """Indices of the ingoing branches of the node with given index."""
+        return memoryview(self.__in_branches)[
+            self.__in_offsets[node]:self.__in_offsets[node + 1]
+        ].toreadonly()
@@ -1,36 +1,78 @@
-from typing import List
+from typing import Iterator, List
 from signalflowgrapher.algorithms.graph import Node, Branch
-import uuid
+from signalflowgrapher.algorithms.compact_graph import CompactGraph
 
 
-def find_paths(start: Node, end: Node) -> List[List[Branch]]:
+def find_paths(start: Node,
+               end: Node,
+               graph: CompactGraph = None) -> List[List[Branch]]:
     """Returns list with all simple paths \
-    between start node and end node"""
-    return __find_paths_inner(start, end, [])
-
-
-def __find_paths_inner(start: Node,
-                       end: Node,
-                       visited: List[uuid.UUID]) -> List[List[Branch]]:
-    results = []
-    visited.append(start.id)
-
-    for branch in start.outgoing:
-        target = branch.end
-        # Target found, append result
-        if target.id == end.id:
-            path: List[Branch] = [branch]
-            results.append(path)
+    between start node and end node. A snapshot of the graph \
+    can be given to avoid building it again."""
+    return list(iter_paths(start, end, graph))
+
+
+def iter_paths(start: Node,
+               end: Node,
+               graph: CompactGraph = None) -> Iterator[List[Branch]]:
+    """Yields all simple paths between start node and end node."""
+    if graph is None:
+        graph = CompactGraph(start.graph)
+
+    branches = graph.branches
+    for path in find_path_indices(graph,
+                                  graph.node_index(start),
+                                  graph.node_index(end)):
+        yield [branches[branch] for branch in path]
+
+
+def find_path_indices(graph: CompactGraph,
+                      start: int,
+                      end: int) -> Iterator[List[int]]:
+    """Yields all simple paths between the nodes \
+    with the given indices as lists of branch indices"""
+    ends = graph.ends
+
+    # Only nodes that can reach the end node are visited
+    reaches_end = __reaches(graph, end)
+    if not reaches_end[start]:
+        return
+
+    visited = bytearray(graph.node_count)
+    visited[start] = 1
+    path: List[int] = []
+    stack = [iter(graph.outgoing(start))]
+
+    while stack:
+        for branch in stack[-1]:
+            target = ends[branch]
+            # Target found, yield result
+            if target == end:
+                yield path + [branch]
+            elif not visited[target] and reaches_end[target]:
+                visited[target] = 1
+                path.append(branch)
+                stack.append(iter(graph.outgoing(target)))
+                break
         else:
-            if target.id not in visited:
-                paths = __find_paths_inner(target, end, visited)
-                # Add found paths
-                for path in paths:
-                    pathNew = []
-                    pathNew.append(branch)
-                    pathNew.extend(path)
-                    results.append(pathNew)
-
-    # Remove self from visited, to allow visit again in other path
-    visited.remove(start.id)
-    return results
+            # Remove node from visited, to allow visit again in other path
+            stack.pop()
+            if path:
+                visited[ends[path.pop()]] = 0
+
+
+def __reaches(graph: CompactGraph, end: int) -> bytearray:
+    # Flag all nodes from which end can be reached (reverse search)
+    starts = graph.starts
+    reaches = bytearray(graph.node_count)
+    reaches[end] = 1
+    queue = [end]
+    while queue:
+        node = queue.pop()
+        for branch in graph.ingoing(node):
+            source = starts[branch]
+            if not reaches[source]:
+                reaches[source] = 1
+                queue.append(source)
+
+    return reaches
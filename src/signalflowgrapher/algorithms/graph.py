@@ -1,7 +1,9 @@
 from __future__ import annotations
 from signalflowgrapher.common.json_dict import JSONDict
+from pyrsistent import pmap, pset
+from pyrsistent.typing import PMap, PSet
 import uuid
-from typing import Dict, Set
+from typing import Dict, Set, Tuple
 
 
 class GraphMember(object):
@@ -60,6 +62,8 @@ class Branch(GraphMember, JSONDict):
     @weight.setter
     def weight(self, value):
         self._weight = value
+        if self._graph is not None:
+            self._graph._update_branch(self)
 
     @property
     def start(self) -> Node:
@@ -194,13 +198,13 @@ class Node(GraphMember, JSONDict):
         set.add(branch)
 
     def remove_outgoing_branch(self, branch: Branch):
-        if branch not in self.outgoing:
+        if branch not in self.__outgoing:
             raise ValueError("Branch is not connected to this node.")
 
         self.__outgoing.remove(branch)
 
     def remove_ingoing_branch(self, branch: Branch):
-        if branch not in self.ingoing:
+        if branch not in self.__ingoing:
             raise ValueError("Branch is not connected to node.")
 
         self.__ingoing.remove(branch)
@@ -214,11 +218,49 @@ class Node(GraphMember, JSONDict):
         raise NotImplementedError()
 
 
+class GraphSnapshot(object):
+    """
+    Immutable version of the structure of a graph: its nodes and the
+    start, end and weight of its branches. Later changes of the graph do
+    not change the snapshot, it can be analysed in another thread.
+    """
+
+    def __init__(self,
+                 nodes: PSet[Node],
+                 branches: PMap[Branch, Tuple[Node, Node, str]]):
+        super().__init__()
+        self.__nodes = nodes
+        self.__branches = branches
+
+    @property
+    def nodes(self) -> PSet[Node]:
+        return self.__nodes
+
+    @property
+    def branches(self) -> PSet[Branch]:
+        return self.__branches.keys()
+
+    def branch_state(self, branch: Branch) -> Tuple[Node, Node, str]:
+        """Get start, end and weight of the branch in the snapshot."""
+        return self.__branches[branch]
+
+
 class Graph(JSONDict):
-    def __init__(self, graph: Graph = None):
+    def __init__(self, graph: Graph = None, persistent: bool = False):
+        """
+        Create a graph, a copy of the given graph if any. A persistent
+        graph also keeps its structure in persistent maps, which share
+        their data between versions, so snapshot takes constant time.
+        """
         super().__init__()
         self._nodes: Set[Node] = set()
         self._branches: Set[Branch] = set()
+        self.__persistent_nodes: PSet[Node] = None
+        self.__persistent_branches: PMap[Branch,
+                                         Tuple[Node, Node, str]] = None
+        if persistent:
+            self.__persistent_nodes = pset()
+            self.__persistent_branches = pmap()
 
         # Copy from given graph if any
         if graph is not None:
@@ -244,13 +286,14 @@ class Graph(JSONDict):
         if node.graph is not self:
             raise ValueError("Node is already part of another graph.")
 
-        if node in self.nodes:
+        if node in self._nodes:
             raise ValueError("Node has already been added to the graph.")
 
         if len(node.ingoing) > 0 or len(node.outgoing) > 0:
             raise ValueError("Cannot add connected node to graph.")
 
         self._nodes.add(node)
+        self.__store_node(node)
 
     def add_branch(self, branch: Branch):
         if branch.start is None or branch.end is None:
@@ -266,6 +309,7 @@ class Graph(JSONDict):
             raise ValueError("Branch is already part of this graph.")
 
         self._branches.add(branch)
+        self.__store_branch(branch)
 
     def remove_node(self, node: Node):
         """
@@ -278,6 +322,7 @@ class Graph(JSONDict):
             raise ValueError("Node is still connected to branches.")
 
         self._nodes.remove(node)
+        self.__discard_node(node)
 
     def remove_branch(self, branch: Branch):
         """Remove a not connected branch from the graph."""
@@ -289,40 +334,69 @@ class Graph(JSONDict):
                              "To remove a branch call remove() on the branch.")
 
         self._branches.remove(branch)
+        self.__discard_branch(branch)
 
     def __attach_node(self, node: Node):
         if node.graph is not None:
             raise ValueError("Node is already part of another graph.")
 
-        if node in self.nodes:
+        if node in self._nodes:
             raise ValueError("Node is already part of this graph.")
 
         node.graph = self
         self._nodes.add(node)
+        self.__store_node(node)
 
     def __detach_node(self, node: Node):
-        if node not in self.nodes:
+        if node not in self._nodes:
             raise ValueError("Node is not part of this graph.")
 
         node.graph = None
         self._nodes.remove(node)
+        self.__discard_node(node)
 
     def __attach_branch(self, branch: Branch):
         if branch.graph is not None:
             raise ValueError("Branch is already part of another graph.")
 
-        if branch in self.branches:
+        if branch in self._branches:
             raise ValueError("Branch is already part of this graph.")
 
         branch.graph = self
         self._branches.add(branch)
+        self.__store_branch(branch)
 
     def __detach_branch(self, branch: Branch):
-        if branch not in self.branches:
+        if branch not in self._branches:
             raise ValueError("Branch is not part of this graph.")
 
         branch.graph = None
         self._branches.remove(branch)
+        self.__discard_branch(branch)
+
+    def _update_branch(self, branch: Branch):
+        """Update the stored state of a branch after its weight changed."""
+        if self.__persistent_branches is not None and \
+                branch in self.__persistent_branches:
+            self.__store_branch(branch)
+
+    def __store_node(self, node: Node):
+        if self.__persistent_nodes is not None:
+            self.__persistent_nodes = self.__persistent_nodes.add(node)
+
+    def __discard_node(self, node: Node):
+        if self.__persistent_nodes is not None:
+            self.__persistent_nodes = self.__persistent_nodes.discard(node)
+
+    def __store_branch(self, branch: Branch):
+        if self.__persistent_branches is not None:
+            self.__persistent_branches = self.__persistent_branches.set(
+                branch, (branch.start, branch.end, branch.weight))
+
+    def __discard_branch(self, branch: Branch):
+        if self.__persistent_branches is not None:
+            self.__persistent_branches = \
+                self.__persistent_branches.discard(branch)
 
     @property
     def nodes(self) -> Set[Node]:
@@ -332,10 +406,29 @@ class Graph(JSONDict):
     def branches(self) -> Set[Branch]:
         return self._branches.copy()
 
+    @property
+    def persistent(self) -> bool:
+        return self.__persistent_nodes is not None
+
     def copy(self):
         """Make a deep copy of the graph. IDs will stay the same."""
         return Graph(self)
 
+    def snapshot(self) -> GraphSnapshot:
+        """
+        Get the current structure of the graph as immutable snapshot. Takes
+        constant time for a persistent graph, otherwise the structure is
+        copied.
+        """
+        if self.persistent:
+            return GraphSnapshot(self.__persistent_nodes,
+                                 self.__persistent_branches)
+
+        return GraphSnapshot(
+            pset(self._nodes),
+            pmap({branch: (branch.start, branch.end, branch.weight)
+                  for branch in self._branches}))
+
     def to_dict(self) -> Dict:
         return {**super().to_dict(),
                 "nodes": [node.to_dict() for node in self._nodes],
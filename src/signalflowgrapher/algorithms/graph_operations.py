@@ -1,8 +1,6 @@
 from typing import Set, List
 from signalflowgrapher.algorithms.graph import Node, Branch
 from signalflowgrapher.algorithms.johnson import simple_cycles
-import sympy.simplify as simplify
-from sympy import Mul, Add, Pow, Integer
 from signalflowgrapher.common.utils import parse_weight, parse_factor
 
 
@@ -40,6 +38,7 @@ class ChainingOperation(object):
         Get the new weight of two branches after applying
         the chainging operation
         """
+        from sympy import Mul, simplify
         return str(simplify(Mul(parse_weight(branch_1.weight,
                                            branch_1),
                                 parse_weight(branch_2.weight,
@@ -61,6 +60,7 @@ class CombineParallelOperation(object):
         """ Get the new weight of two branches after applying the
         combine parallel operation
         """
+        from sympy import Add, simplify
         return str(simplify(Add(parse_weight(branch_1.weight,
                                            branch_1),
                                 parse_weight(branch_2.weight,
@@ -79,6 +79,8 @@ class EliminateNodeOperation(object):
         Returns set of tuples with each tuple containing the target node
         and the weight for the self loop.
         """
+        from sympy import Mul, simplify
+
         results = set()
 
         # Find all cycles that contain the given nodes
@@ -141,6 +143,7 @@ class EliminateSelfLoopOperation(object):
         Get new weight that has to be applied to the affected branch after
         remove of the self loop.
         """
+        from sympy import Add, Integer, Mul, Pow, simplify
         denominator = Add(Integer(1),
                           Mul(parse_weight(self_loop.weight, self_loop),
                               Integer(-1)))
@@ -165,6 +168,7 @@ class InvertPathOperation(object):
 
     def get_new_branch_weight(self, branch_to_invert: Branch) -> str:
         """Get the new weight to invert a branch."""
+        from sympy import Integer, Mul, Pow, simplify
         denominator = parse_weight(branch_to_invert.weight, branch_to_invert)
         return str(simplify(Mul(Integer(1), Pow(denominator, Integer(-1)))))
 
@@ -175,6 +179,7 @@ class InvertPathOperation(object):
         """
         Get the new weight for branch that is affected by the branch inversion.
         """
+        from sympy import Integer, Mul, simplify
         return str(simplify(
             Mul(Mul(Integer(-1), parse_weight(affected_branch.weight,
                                             affected_branch)),
@@ -205,6 +210,7 @@ class ScalePathOperation(object):
 
     def get_ingoing_branch_weight(self, branch: Branch, factor: str) -> str:
         """Get scaled weight of ingoing branch"""
+        from sympy import Integer, Mul, Pow, simplify
         # Divide by factor
         return str(simplify(Mul(Pow(parse_factor(factor),
                                     Integer(-1)),
@@ -212,6 +218,7 @@ class ScalePathOperation(object):
 
     def get_outgoing_branch_weight(self, branch: Branch, factor: str) -> str:
         """Get scaled weight of outgoing branch"""
+        from sympy import Mul, simplify
         # Multiply with factor
         return str(simplify(Mul(parse_factor(factor),
                                 parse_weight(branch.weight, branch))))
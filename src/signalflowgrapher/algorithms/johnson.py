@@ -8,22 +8,37 @@
 # Original paper: Donald B Johnson. "Finding all the elementary circuits of a
 # directed graph." SIAM Journal on Computing. 1975.
 
+from array import array
 from collections import defaultdict
-from typing import List
+from typing import Iterator, List, Union
 from signalflowgrapher.algorithms.graph import Graph, Branch
-from signalflowgrapher.algorithms.tarjan import strongly_connected_components
+from signalflowgrapher.algorithms.compact_graph import CompactGraph
+from signalflowgrapher.algorithms.tarjan import (  # noqa: F401
+    SccSearch, strongly_connected_components,
+    strongly_connected_component_indices)
 
 
-def simple_cycles(g: Graph) -> List[List[Branch]]:
+def simple_cycles(g: Union[Graph, CompactGraph]) -> Iterator[List[Branch]]:
     """Find all simple cycles in a graph"""
-    # Make copy because the graph gets altered during the algorithm
-    graph_copy = g.copy()
-    branch_map = {}
-    copy_result = list()
+    if not isinstance(g, CompactGraph):
+        g = CompactGraph(g)
 
-    # Create map to allow returning original branches
-    for branch in g.branches:
-        branch_map[branch.id] = branch
+    branches = g.branches
+    for cycle in simple_cycle_indices(g):
+        yield [branches[branch] for branch in cycle]
+
+
+def simple_cycle_indices(graph: CompactGraph) -> Iterator[List[int]]:
+    """Find all simple cycles in a compact graph as lists of branch indices.
+    The graph is not copied, nodes that have been processed are marked
+    as removed instead."""
+    ends = graph.ends
+
+    # Component marker per node, a node belongs to the current subgraph
+    # if its marker equals the marker of the current component
+    REMOVED = -1
+    marker = array('l', [REMOVED]) * graph.node_count
+    current_marker = 0
 
     # Yield every elementary cycle in python graph G exactly once
     # Expects a dictionary mapping from vertices to iterables of vertices
@@ -35,52 +50,59 @@ def simple_cycles(g: Graph) -> List[List[Branch]]:
                 blocked.remove(node)
                 stack.update(B[node])
                 B[node].clear()
-    sccs = [(graph_copy, scc) for scc in
-            strongly_connected_components(graph_copy)]
+
+    def _outgoing(node):
+        # Outgoing branches within the current component
+        return [branch for branch in graph.outgoing(node)
+                if marker[ends[branch]] == current_marker]
+
+    # Tarjan's bookkeeping is shared by the searches in the components
+    scc_search = SccSearch(graph)
+    sccs = scc_search.components()
     while sccs:
-        current_graph, scc = sccs.pop()
+        scc = sccs.pop()
+        current_marker += 1
+        for node in scc:
+            marker[node] = current_marker
+
         startnode = scc.pop()
-        path = [startnode.id]
+        path = [startnode]
         pathBranches = []
         blocked = set()
         closed = set()
-        blocked.add(startnode.id)
+        blocked.add(startnode)
         B = defaultdict(set)
-        stack = [(startnode, list(startnode.outgoing))]
+        stack = [(startnode, _outgoing(startnode))]
         while stack:
             thisnode, nbrs = stack[-1]
             if nbrs:
                 branch = nbrs.pop()
-                nextnode = branch.end
-                if nextnode.id == startnode.id:
+                nextnode = ends[branch]
+                if nextnode == startnode:
                     result = pathBranches[:]
                     result.append(branch)
-                    copy_result.append(result)
+                    yield result
                     closed.update(path)
-                elif nextnode.id not in blocked:
-                    path.append(nextnode.id)
+                elif nextnode not in blocked:
+                    path.append(nextnode)
                     pathBranches.append(branch)
-                    stack.append((nextnode,
-                                  list(nextnode.outgoing)))
-                    closed.discard(nextnode.id)
-                    blocked.add(nextnode.id)
+                    stack.append((nextnode, _outgoing(nextnode)))
+                    closed.discard(nextnode)
+                    blocked.add(nextnode)
                     continue
             if not nbrs:
-                if thisnode.id in closed:
-                    _unblock(thisnode.id, blocked, B)
+                if thisnode in closed:
+                    _unblock(thisnode, blocked, B)
                 else:
-                    for nbr in map(lambda x: x.end,
-                                   thisnode.outgoing):
-                        if thisnode.id not in B[nbr.id]:
-                            B[nbr.id].add(thisnode.id)
+                    for branch in _outgoing(thisnode):
+                        nbr = ends[branch]
+                        if thisnode not in B[nbr]:
+                            B[nbr].add(thisnode)
                 stack.pop()
                 path.pop()
                 if (pathBranches):
                     pathBranches.pop()
-        startnode.remove()
-        subgraph = current_graph.subgraph(set(scc))
-        new_scc = strongly_connected_components(subgraph)
-        sccs.extend([(subgraph, scc) for scc in new_scc])
 
-    for loop in copy_result:
-        yield list(map(lambda b: branch_map[b.id], loop))
+        # Remove start node and search the remaining components
+        marker[startnode] = REMOVED
+        sccs.extend(scc_search.components(scc))
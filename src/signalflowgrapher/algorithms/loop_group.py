@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from signalflowgrapher.algorithms.graph import Branch, Node
 
 
@@ -19,9 +19,70 @@ class LoopGroup(object):
                          next_nodes)
 
 
-def find_loop_groups(loops: List[List[Branch]]) -> List[LoopGroup]:
-    """Build all groups of loops with no nodes in common"""
-    return list(__find_loop_groups(LoopGroup(), loops[:]))
+def find_loop_groups(loops: List[List[Branch]],
+                     method: str = "bitset") -> List[LoopGroup]:
+    """Build all groups of loops with no nodes in common.
+       The method "bitset" tests for common nodes using bitmasks,
+       "list" compares the node lists of the loops.
+    """
+    if method == "bitset":
+        return list(__find_loop_groups_bitset(loops))
+    elif method == "list":
+        return list(__find_loop_groups(LoopGroup(), loops[:]))
+    else:
+        raise ValueError("Unknown loop group method '%s'." % method)
+
+
+def __find_loop_groups_bitset(loops: List[List[Branch]]):
+    # Assign a bit to every node and build node mask of every loop
+    node_bits: Dict[Node, int] = dict()
+    loop_masks: List[int] = []
+    loop_nodes: List[List[Node]] = []
+    for loop in loops:
+        mask = 0
+        nodes: List[Node] = []
+        for branch in loop:
+            for node in (branch.start, branch.end):
+                nodes.append(node)
+                mask |= 1 << node_bits.setdefault(node, len(node_bits))
+        loop_masks.append(mask)
+        loop_nodes.append(nodes)
+
+    # Bitmask of all following loops that do not touch a loop
+    compatible: List[int] = []
+    for i, mask in enumerate(loop_masks):
+        candidates = 0
+        for j in range(i + 1, len(loops)):
+            if not mask & loop_masks[j]:
+                candidates |= 1 << j
+        compatible.append(candidates)
+
+    yield from __extend_loop_group(LoopGroup(),
+                                   (1 << len(loops)) - 1,
+                                   loops,
+                                   loop_nodes,
+                                   compatible)
+
+
+def __extend_loop_group(loop_group: LoopGroup,
+                        candidates: int,
+                        loops: List[List[Branch]],
+                        loop_nodes: List[List[Node]],
+                        compatible: List[int]):
+    # Candidates contains all loops that touch no loop of the group
+    while candidates:
+        lowest = candidates & -candidates
+        candidates ^= lowest
+        index = lowest.bit_length() - 1
+
+        next_group = loop_group.append_loop([loops[index]],
+                                            loop_nodes[index])
+        yield next_group
+        yield from __extend_loop_group(next_group,
+                                       candidates & compatible[index],
+                                       loops,
+                                       loop_nodes,
+                                       compatible)
 
 
 def __find_loop_groups(loop_group: LoopGroup,
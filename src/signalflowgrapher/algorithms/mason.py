@@ -1,12 +1,17 @@
-from typing import Set, List
-from sympy import Expr, Mul, Symbol, Integer, Add, Pow
-from signalflowgrapher.common.utils import parse_weight
-from signalflowgrapher.algorithms.graph import Graph, Branch, Node
-from signalflowgrapher.algorithms.johnson import simple_cycles
-from signalflowgrapher.algorithms.loop_group import (
-    LoopGroup, find_loop_groups)
-from signalflowgrapher.algorithms.find_paths import find_paths
-from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import (
+    TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple, Union)
+from signalflowgrapher.common.utils import parse_branch_weight
+from signalflowgrapher.algorithms.graph import (
+    Graph, GraphSnapshot, Branch, Node)
+from signalflowgrapher.algorithms.johnson import simple_cycle_indices
+from signalflowgrapher.algorithms.loop_group import find_loop_groups
+from signalflowgrapher.algorithms.find_paths import find_path_indices
+from signalflowgrapher.algorithms.compact_graph import CompactGraph
+
+if TYPE_CHECKING:
+    from sympy import Expr, Symbol
 
 
 class MasonResult(object):
@@ -19,7 +24,9 @@ class MasonResult(object):
         self.transfer_function: List[(Symbol, Expr)] = list()
 
 
-def mason(graph: Graph, start: Node, end: Node) -> MasonResult:
+def mason(graph: Union[Graph, GraphSnapshot],
+          start: Node,
+          end: Node) -> MasonResult:
     # mason = (sum(path[i] * delta[i])) / (delta)
     # delta = 1 - sum of all loops
     #         + sum of products of two loops
@@ -29,161 +36,271 @@ def mason(graph: Graph, start: Node, end: Node) -> MasonResult:
     # delta: determinante
     # paths[i]: forward path i
     # delta_per_path[i]: delta without loops that touch the forward path i
-
-    result = MasonResult()
-
-    delta = Integer(1)  # Initialize determinante with 1
+    return mason_many(graph, start, [end], max_workers=1)[end]
+
+
+def mason_many(graph: Union[Graph, GraphSnapshot],
+               start: Node,
+               ends: List[Node],
+               max_workers: int = None) -> Dict[Node, MasonResult]:
+    """
+    Apply mason rule from start to every node in ends. Loops, loop groups
+    and the determinant are calculated once for all ends. The forward
+    paths and their determinants are calculated per end in a pool of
+    max_workers processes (default: number of processors). With
+    max_workers = 1 everything is calculated in the current process.
+    Weights are only read from the given graph or snapshot, so a snapshot
+    can be analysed while the graph is changed.
+    """
+    # SymPy is imported on first use to keep the application startup fast
+    from sympy import Add, Integer, Mul, Pow, Symbol
+
+    # Snapshot of the graph used by the graph algorithms
+    compact_graph = CompactGraph(graph)
 
     # Loops with their corresponding symbol
     loops: List[List[Branch]] = list()
     loop_symbols: List[Symbol] = list()
-
-    # Create a sorted list of simple cycles
-    simple_cycle_list = sorted(simple_cycles(graph),
-                               key=lambda L: '%s' % (loop_to_expression(L),))
-    # Find loops and replace the branch copies with the original branch
-    for loop_index, loop in enumerate(simple_cycle_list, start=0):
-        new_loop = list()
-        for loop_branch in loop:
-            branch_iter = iter(graph.branches)
-            existing_branch = next(branch_iter)
-            while not existing_branch.id == loop_branch.id:
-                existing_branch = next(branch_iter)
-
-            new_loop.append(existing_branch)
-
-        loops.append(new_loop)
+    result_loops: List[(Symbol, Expr)] = list()
+
+    # Create a sorted list of simple cycles with their expression
+    nodes = compact_graph.nodes
+    branches = compact_graph.branches
+    weights = compact_graph.weights
+    starts = compact_graph.starts
+    branch_ends = compact_graph.ends
+    simple_cycle_list = sorted(
+        ((__product_expression((weights[branch], nodes[starts[branch]],
+                                nodes[branch_ends[branch]])
+                               for branch in cycle), cycle)
+         for cycle in simple_cycle_indices(compact_graph)),
+        key=lambda e: '%s' % (e[0],))
+    # Find loops and map the branch indices to the original branches
+    for loop_index, (expression, cycle) in enumerate(simple_cycle_list,
+                                                     start=0):
+        loops.append([branches[branch] for branch in cycle])
         loop_symbols.append(Symbol("L" + str(loop_index + 1)))
 
-    for i, loop in enumerate(loops):
-        # Add to delta
-        delta = Add(delta, Mul(Integer(-1), loop_symbols[i]))
         # Append to loops in result
-        result.loops.append((loop_symbols[i], loop_to_expression(loops[i])))
-
-    # Add or substract sum of product of two, three, ... loops
-    loop_groups = sorted(find_loop_groups(loops), key=attrgetter('loop_count'))
-
-    for loop_group in loop_groups:
-        if loop_group.loop_count > 1:  # Skip loop groups with one member
-            expr = Integer(1)
-
-            i = 0
-            while i < len(loop_group.loops):
-                loop_index = loops.index(loop_group.loops[i])
-                expr = Mul(expr, loop_symbols[loop_index])
-                i += 1
-
-            # Insert negative sign if necessary
-            if loop_group.loop_count % 2 == 1:
-                expr = Mul(Integer(-1), expr)
-
-            delta = Add(delta, expr)
-
-    # Summation of products of paths and its determinantes
-    paths = find_paths(start, end)
-
-    numerator: Expr = Integer(0)
-
-    # Create a sorted list of paths
-    path_list = sorted(paths,
-                       key=lambda L: '%s' % (loop_to_expression(L),))
-    for i, path in enumerate(path_list, start=1):
-        # Create symbol and append to paths in result
-        path_symbol = Symbol("P" + str(i))
-        result.paths.append((path_symbol, loop_to_expression(path)))
-
-        dpp_symbol = Symbol("D" + str(i))
-        dpp = __get_delta_per_path(loops,
-                                   loop_symbols,
-                                   loop_groups, path)
-        # Append to paths in result
-        result.paths.append((dpp_symbol, dpp))
-        # Add delta_per_path to sum
-        numerator = Add(numerator, Mul(path_symbol, dpp_symbol))
-
-    delta_symbol = Symbol("Delta")
-    result.determinant = [(delta_symbol, delta)]
-
-    numerator_symbol = Symbol("T_num")
-    result.numerator = [(numerator_symbol, numerator)]
-
-    denominator_symbol = Symbol("T_den")
-    result.denominator = [(denominator_symbol, delta_symbol)]
-
-    transfer_function_symbol = Symbol("T_io")
-    transfer_function = Mul(numerator_symbol, Pow(
-        denominator_symbol, Integer(-1)))  # Division
-    result.transfer_function = [(transfer_function_symbol, transfer_function)]
-
-    return result
-
-
-def loop_to_expression(loop: List[Branch]) -> Expr:
+        result_loops.append((loop_symbols[loop_index], expression))
+
+    # Index of the loops, loop groups reference the same loop lists
+    loop_indices: Dict[int, int] = {
+        id(loop): index for index, loop in enumerate(loops)}
+
+    # Bitmask of the loops touching every node
+    node_loop_masks: List[int] = [0] * compact_graph.node_count
+    for loop_index, (_, cycle) in enumerate(simple_cycle_list):
+        for branch in cycle:
+            node_loop_masks[starts[branch]] |= 1 << loop_index
+
+    # Add or substract sum of loops and products of two, three, ... loops.
+    # Every term is kept with the bitmask of its loops to find the terms
+    # of the delta of every path.
+    group_terms: List[(int, Expr)] = list()
+    for loop_group in find_loop_groups(loops):
+        group_mask = 0
+        symbols: List[Symbol] = list()
+        for loop in loop_group.loops:
+            loop_index = loop_indices[id(loop)]
+            group_mask |= 1 << loop_index
+            symbols.append(loop_symbols[loop_index])
+
+        expr = Mul(*symbols)
+        # Insert negative sign if necessary
+        if loop_group.loop_count % 2 == 1:
+            expr = Mul(Integer(-1), expr)
+
+        group_terms.append((group_mask, expr))
+
+    delta = Add(Integer(1), *[expr for _, expr in group_terms])
+
+    context = _PathContext(compact_graph,
+                           node_loop_masks,
+                           group_terms,
+                           __parse_path_weights(compact_graph, start, ends))
+    start_index = compact_graph.node_index(start)
+    end_indices = [compact_graph.node_index(end) for end in ends]
+
+    if max_workers == 1 or len(ends) < 2:
+        path_results = [__path_results(context, start_index, end_index)
+                        for end_index in end_indices]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=__init_worker,
+                                 initargs=(context,)) as executor:
+            path_results = list(executor.map(__worker_path_results,
+                                             repeat(start_index),
+                                             end_indices))
+
+    results: Dict[Node, MasonResult] = dict()
+    for end, end_path_results in zip(ends, path_results):
+        result = MasonResult()
+        result.loops = list(result_loops)
+
+        # Summation of products of paths and its determinantes
+        numerator: Expr = Integer(0)
+
+        for i, (path_expression, dpp) in enumerate(end_path_results,
+                                                   start=1):
+            # Create symbol and append to paths in result
+            path_symbol = Symbol("P" + str(i))
+            result.paths.append((path_symbol, path_expression))
+
+            dpp_symbol = Symbol("D" + str(i))
+            # Append to paths in result
+            result.paths.append((dpp_symbol, dpp))
+            # Add delta_per_path to sum
+            numerator = Add(numerator, Mul(path_symbol, dpp_symbol))
+
+        delta_symbol = Symbol("Delta")
+        result.determinant = [(delta_symbol, delta)]
+
+        numerator_symbol = Symbol("T_num")
+        result.numerator = [(numerator_symbol, numerator)]
+
+        denominator_symbol = Symbol("T_den")
+        result.denominator = [(denominator_symbol, delta_symbol)]
+
+        transfer_function_symbol = Symbol("T_io")
+        transfer_function = Mul(numerator_symbol, Pow(
+            denominator_symbol, Integer(-1)))  # Division
+        result.transfer_function = [(transfer_function_symbol,
+                                     transfer_function)]
+
+        results[end] = result
+
+    return results
+
+
+def loop_to_expression(loop: List[Branch]) -> "Expr":
     """Create an expression from a loop. Raises clean error messages
        on invalid branch weight expressions."""
     if len(loop) < 1:
         raise Exception('A loop must contain at least one branch.')
 
-    # Parse first branch weight
-    expression = parse_weight(loop[0].weight, loop[0])
-
-    # Multiply by every remaining branch weight
-    for branch in loop[1:]:
-        expression = Mul(expression, parse_weight(branch.weight, branch))
-
-    return expression
-
-
-def __get_delta_per_path(
-        loops: List[List[Branch]],
-        loop_symbols: List[Symbol],
-        loop_groups: List[LoopGroup],
-        path: List[Branch]):
-
-    delta = Integer(1)  # Initialize subdeterminante with 1
+    return __product_expression((branch.weight, branch.start, branch.end)
+                                for branch in loop)
 
-    for index, loop in enumerate(loops):
-        if not __loop_touches_path(loop, path):
-            delta = Add(delta, Mul(Integer(-1), loop_symbols[index]))
 
-    for loop_group in loop_groups:
-        if loop_group.loop_count > 1:  # Skip loop groups with one member
-            expr = Integer(1)
+def __product_expression(
+        weights: Iterable[Tuple[str, Node, Node]]) -> "Expr":
+    # Multiply the parsed weights, the start and end nodes of the branches
+    # are used in error messages
+    from sympy import Mul
 
-            i = 0
-            not_touches = True
-            while i < len(loop_group.loops):
-                loop = loop_group.loops[i]
-                if not __loop_touches_path(loop, path):
-                    loop_index = loops.index(loop)
-                    expr = Mul(expr, loop_symbols[loop_index])
-                else:
-                    not_touches = False
+    weights = iter(weights)
 
-                i += 1
-
-            # Insert negative sign if necessary
-            if loop_group.loop_count % 2 == 1:
-                expr = Mul(Integer(-1), expr)
-
-            if not_touches:
-                delta = Add(delta, expr)
-
-    return delta
-
-
-def __loop_touches_path(loop: List[Branch], path: List[Branch]) -> bool:
-    loop_nodes: Set[Node] = set()
+    # Parse first branch weight
+    weight, start, end = next(weights)
+    expression = parse_branch_weight(weight, start, end)
 
-    for cbranch in loop:
-        loop_nodes.add(cbranch.start)
-        loop_nodes.add(cbranch.end)
+    # Multiply by every remaining branch weight
+    for weight, start, end in weights:
+        expression = Mul(expression, parse_branch_weight(weight, start, end))
 
-    path_nodes: Set[Node] = set()
+    return expression
 
-    for pbranch in path:
-        path_nodes.add(pbranch.start)
-        path_nodes.add(pbranch.end)
 
-    return len(path_nodes.intersection(loop_nodes)) > 0
+class _PathContext(object):
+    """
+    Data shared by the path search of all ends, can be sent to worker
+    processes.
+    """
+
+    def __init__(self,
+                 graph: CompactGraph,
+                 node_loop_masks: List[int],
+                 group_terms: List[Tuple[int, "Expr"]],
+                 weights: List[Optional["Expr"]]):
+        self.graph = graph
+        self.node_loop_masks = node_loop_masks
+        self.group_terms = group_terms
+        self.weights = weights
+
+
+def __parse_path_weights(graph: CompactGraph,
+                         start: Node,
+                         ends: List[Node]) -> List[Optional["Expr"]]:
+    # Parse weights of the branches that can be part of a forward path
+    # in the current process, where the nodes are known for error messages
+    reachable = __reachable(graph, graph.node_index(start), graph.outgoing,
+                            graph.ends)
+    reaches_end = bytearray(graph.node_count)
+    for end in ends:
+        for node in __reachable(graph, graph.node_index(end), graph.ingoing,
+                                graph.starts):
+            reaches_end[node] = 1
+
+    weights: List[Optional[Expr]] = [None] * graph.branch_count
+    nodes = graph.nodes
+    starts = graph.starts
+    ends = graph.ends
+    for index in range(graph.branch_count):
+        if starts[index] in reachable and reaches_end[ends[index]]:
+            weights[index] = parse_branch_weight(
+                graph.weights[index], nodes[starts[index]],
+                nodes[ends[index]])
+
+    return weights
+
+
+def __reachable(graph: CompactGraph, node: int, branches, targets) -> Set:
+    visited = {node}
+    stack = [node]
+    while stack:
+        for branch in branches(stack.pop()):
+            target = targets[branch]
+            if target not in visited:
+                visited.add(target)
+                stack.append(target)
+
+    return visited
+
+
+def __path_results(context: _PathContext,
+                   start: int,
+                   end: int) -> List[Tuple["Expr", "Expr"]]:
+    from sympy import Add, Integer, Mul
+
+    # Find the paths from start to end and their determinant, sorted by
+    # the expression of the path
+    graph = context.graph
+    starts = graph.starts
+    ends = graph.ends
+    node_loop_masks = context.node_loop_masks
+
+    path_results: List[Tuple[Expr, Expr]] = list()
+    for path in find_path_indices(graph, start, end):
+        # Loops touching the path
+        touching_mask = 0
+        for branch in path:
+            touching_mask |= node_loop_masks[starts[branch]] | \
+                node_loop_masks[ends[branch]]
+
+        # A loop group is part of the delta of a path (delta_per_path) if
+        # no loop of the group touches the path.
+        dpp = Add(Integer(1), *[expr for group_mask, expr
+                                in context.group_terms
+                                if not group_mask & touching_mask])
+
+        path_expression = Mul(*[context.weights[branch] for branch in path])
+        path_results.append((path_expression, dpp))
+
+    # Sort paths by their expression
+    path_results.sort(key=lambda r: '%s' % (r[0],))
+    return path_results
+
+
+# Context of a worker process, set once by __init_worker
+__worker_context: _PathContext = None
+
+
+def __init_worker(context: _PathContext):
+    global __worker_context
+    __worker_context = context
+
+
+def __worker_path_results(start: int,
+                          end: int) -> List[Tuple["Expr", "Expr"]]:
+    return __path_results(__worker_context, start, end)
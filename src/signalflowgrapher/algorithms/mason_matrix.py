@@ -0,0 +1,155 @@
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple, Union
+from signalflowgrapher.common.utils import parse_branch_weight
+from signalflowgrapher.algorithms.compact_graph import CompactGraph
+from signalflowgrapher.algorithms.graph import Graph, GraphSnapshot, Node
+from signalflowgrapher.algorithms.mason import MasonResult
+from signalflowgrapher.algorithms.tarjan import strongly_connected_components
+
+if TYPE_CHECKING:
+    from sympy import Expr, SparseMatrix
+
+
+def mason_matrix(graph: Union[Graph, GraphSnapshot],
+                 start: Node,
+                 end: Node) -> MasonResult:
+    """
+    Calculate the transfer function from start to end without enumerating
+    loops. The graph is written as the linear system (I - A) x = e_start,
+    where A holds the summed branch weights. The determinant of (I - A) is
+    the graph determinant of Mason's rule and the numerator is obtained by
+    Cramer's rule, so the result equals the one of mason(), but the work is
+    polynomial in the number of nodes instead of exponential in the number
+    of loops.
+
+    The determinant is calculated per strongly connected component because
+    (I - A) is block triangular in topological order of the components.
+    The numerator only depends on the nodes on a path from start to end.
+    Like mason(), a snapshot of the graph can be given.
+    """
+    # SymPy is imported on first use to keep the application startup fast
+    from sympy import Integer, Mul, Pow, Symbol
+
+    result = MasonResult()
+
+    compact_graph = CompactGraph(graph)
+    nodes = compact_graph.nodes
+    starts = compact_graph.starts
+    ends = compact_graph.ends
+
+    # Sum of weights of all (parallel) branches per pair of nodes
+    weights: Dict[Tuple[Node, Node], Expr] = dict()
+    for index in range(compact_graph.branch_count):
+        key = (nodes[starts[index]], nodes[ends[index]])
+        weight = parse_branch_weight(compact_graph.weights[index], *key)
+        weights[key] = weights[key] + weight if key in weights else weight
+
+    # Nodes that are reachable from start and can reach end
+    relevant = __reachable(compact_graph, start, True) & \
+        __reachable(compact_graph, end, False)
+
+    # Graph determinant, split into relevant and remaining components
+    delta_relevant = Integer(1)
+    delta_remaining = Integer(1)
+    for component in strongly_connected_components(compact_graph):
+        if len(component) == 1 and \
+                (component[0], component[0]) not in weights:
+            continue  # Determinant of a node without self loop is one
+
+        determinant = __determinant(component, weights)
+        if component[0] in relevant:
+            delta_relevant = Mul(delta_relevant, determinant)
+        else:
+            delta_remaining = Mul(delta_remaining, determinant)
+
+    # Cramer's rule: replace column of end with e_start
+    if relevant:
+        numerator = Mul(__cramer_numerator(list(relevant), weights,
+                                           start, end),
+                        delta_remaining)
+    else:
+        numerator = Integer(0)
+
+    delta_symbol = Symbol("Delta")
+    result.determinant = [(delta_symbol,
+                           Mul(delta_relevant, delta_remaining))]
+
+    numerator_symbol = Symbol("T_num")
+    result.numerator = [(numerator_symbol, numerator)]
+
+    denominator_symbol = Symbol("T_den")
+    result.denominator = [(denominator_symbol, delta_symbol)]
+
+    transfer_function_symbol = Symbol("T_io")
+    transfer_function = Mul(numerator_symbol, Pow(
+        denominator_symbol, Integer(-1)))  # Division
+    result.transfer_function = [(transfer_function_symbol, transfer_function)]
+
+    return result
+
+
+def __system_matrix(nodes: List[Node],
+                    weights: Dict[Tuple[Node, Node], "Expr"]
+                    ) -> "SparseMatrix":
+    from sympy import Integer, SparseMatrix
+
+    # Build (I - A)^T restricted to the given nodes, row i is the
+    # equation of node i
+    index = {node: i for i, node in enumerate(nodes)}
+    entries = dict()
+    for i in range(len(nodes)):
+        entries[(i, i)] = Integer(1)
+
+    for (branch_start, branch_end), weight in weights.items():
+        if branch_start in index and branch_end in index:
+            key = (index[branch_end], index[branch_start])
+            entries[key] = entries.get(key, Integer(0)) - weight
+
+    return SparseMatrix(len(nodes), len(nodes), entries)
+
+
+def __determinant(nodes: List[Node],
+                  weights: Dict[Tuple[Node, Node], "Expr"]) -> "Expr":
+    return __domain_determinant(__system_matrix(nodes, weights))
+
+
+def __domain_determinant(matrix: "SparseMatrix") -> "Expr":
+    from sympy.polys.matrices import DomainMatrix
+
+    # Eliminate in the polynomial ring (or field) spanned by the weights,
+    # which is much faster than elimination on general sympy expressions
+    domain_matrix = DomainMatrix.from_Matrix(matrix)
+    return domain_matrix.domain.to_sympy(domain_matrix.det())
+
+
+def __cramer_numerator(nodes: List[Node],
+                       weights: Dict[Tuple[Node, Node], "Expr"],
+                       start: Node,
+                       end: Node) -> "Expr":
+    from sympy import Integer
+
+    matrix = __system_matrix(nodes, weights)
+    column = nodes.index(end)
+    row = nodes.index(start)
+    for i in range(len(nodes)):
+        matrix[i, column] = Integer(1) if i == row else Integer(0)
+
+    return __domain_determinant(matrix)
+
+
+def __reachable(graph: CompactGraph,
+                node: Node,
+                forward: bool) -> Set[Node]:
+    # Nodes reachable from node, following branches forward or backward
+    branches = graph.outgoing if forward else graph.ingoing
+    targets = graph.ends if forward else graph.starts
+    visited = {graph.node_index(node)}
+    stack = list(visited)
+    while stack:
+        for branch in branches(stack.pop()):
+            neighbour = targets[branch]
+            if neighbour not in visited:
+                visited.add(neighbour)
+                stack.append(neighbour)
+
+    nodes = graph.nodes
+    return {nodes[index] for index in visited}
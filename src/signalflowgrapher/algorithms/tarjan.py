@@ -1,51 +1,137 @@
-from typing import List
+from array import array
+from typing import List, Sequence, Union
 from signalflowgrapher.algorithms.graph import Graph, Node
+from signalflowgrapher.algorithms.compact_graph import CompactGraph
 
 # EXTERNAL CODE
 # Implementation from
 # http://www.logarithmic.net/pfh/blog/01208083168
 
 
-def strongly_connected_components(graph: Graph) -> List[List[Node]]:
+def strongly_connected_components(
+        graph: Union[Graph, CompactGraph]) -> List[List[Node]]:
     """Find and reutrn all sccs in a graph"""
-    # Tarjan's algorithm for finding SCC's
-    # Robert Tarjan. "Depth-first search and linear graph algorithms."
-    # SIAM journal on computing. 1972.
-    # Code by Dries Verdegem, November 2012
-    # Downloaded from http://www.logarithmic.net/pfh/blog/01208083168
-
-    index_counter = [0]
-    stack = []
-    lowlink = {}
-    index = {}
-    result = []
-
-    def _strong_connect(node: Node):
-        index[node] = index_counter[0]
-        lowlink[node] = index_counter[0]
-        index_counter[0] += 1
-        stack.append(node)
-
-        successors = node.outgoing
-        for successor in successors:
-            if successor.end not in index:
-                _strong_connect(successor.end)
-                lowlink[node] = min(lowlink[node], lowlink[successor.end])
-            elif successor.end in stack:
-                lowlink[node] = min(lowlink[node], index[successor.end])
-
-        if lowlink[node] == index[node]:
-            connected_component = []
-
-            while True:
-                successor = stack.pop()
-                connected_component.append(successor)
-                if successor == node:
-                    break
-            result.append(connected_component[:])
-
-    for node in graph.nodes:
-        if node not in index:
-            _strong_connect(node)
-
-    return result
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph(graph)
+
+    nodes = graph.nodes
+    return [[nodes[node] for node in component]
+            for component in strongly_connected_component_indices(graph)]
+
+
+def strongly_connected_component_indices(
+        graph: CompactGraph,
+        nodes: Sequence[int] = None) -> List[List[int]]:
+    """Find and return all sccs in a compact graph as lists of node indices.
+    If nodes are given, only the subgraph induced by these nodes is used."""
+    return SccSearch(graph).components(nodes)
+
+
+class SccSearch(object):
+    """
+    Search for sccs in subgraphs of a compact graph. The bookkeeping of
+    Tarjan's algorithm is allocated once, every search only resets the
+    entries of its nodes, so repeated searches in small subgraphs do not
+    cost time proportional to the whole graph.
+    """
+
+    UNVISITED = -1
+
+    def __init__(self, graph: CompactGraph):
+        super().__init__()
+        self.__graph = graph
+        self.__index = array('l', [self.UNVISITED]) * graph.node_count
+        self.__lowlink = array('l', [0]) * graph.node_count
+        self.__on_stack = bytearray(graph.node_count)
+        self.__included = bytearray(graph.node_count)
+
+    def components(self, nodes: Sequence[int] = None) -> List[List[int]]:
+        """Find and return all sccs as lists of node indices. If nodes are
+        given, only the subgraph induced by these nodes is used."""
+        if nodes is None:
+            nodes = range(self.__graph.node_count)
+
+        included = self.__included
+        for node in nodes:
+            included[node] = 1
+        try:
+            return self.__search(nodes)
+        finally:
+            # Only included nodes are visited, the stack is empty after a
+            # complete search and lowlinks are set on visit
+            index = self.__index
+            for node in nodes:
+                included[node] = 0
+                index[node] = self.UNVISITED
+                self.__on_stack[node] = 0
+
+    def __search(self, nodes: Sequence[int]) -> List[List[int]]:
+        # Tarjan's algorithm for finding SCC's
+        # Robert Tarjan. "Depth-first search and linear graph algorithms."
+        # SIAM journal on computing. 1972.
+        # Based on the recursive version by Dries Verdegem, November 2012
+        # Downloaded from http://www.logarithmic.net/pfh/blog/01208083168
+        # The recursion is replaced by an explicit stack of branch
+        # iterators to support long chains of nodes.
+
+        UNVISITED = self.UNVISITED
+        graph = self.__graph
+        index_counter = 0
+        index = self.__index
+        lowlink = self.__lowlink
+        on_stack = self.__on_stack
+        included = self.__included
+        stack = []
+        result = []
+        ends = graph.ends
+
+        for root in nodes:
+            if index[root] != UNVISITED:
+                continue
+
+            index[root] = lowlink[root] = index_counter
+            index_counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            call_stack = [(root, iter(graph.outgoing(root)))]
+
+            while call_stack:
+                node, successors = call_stack[-1]
+                for successor in successors:
+                    successor_end = ends[successor]
+                    if not included[successor_end]:
+                        continue
+                    if index[successor_end] == UNVISITED:
+                        # Descend into successor
+                        index[successor_end] = index_counter
+                        lowlink[successor_end] = index_counter
+                        index_counter += 1
+                        stack.append(successor_end)
+                        on_stack[successor_end] = 1
+                        call_stack.append(
+                            (successor_end,
+                             iter(graph.outgoing(successor_end))))
+                        break
+                    elif on_stack[successor_end]:
+                        lowlink[node] = min(lowlink[node],
+                                            index[successor_end])
+                else:
+                    # All successors done, return to predecessor
+                    call_stack.pop()
+                    if call_stack:
+                        predecessor = call_stack[-1][0]
+                        lowlink[predecessor] = min(lowlink[predecessor],
+                                                   lowlink[node])
+
+                    if lowlink[node] == index[node]:
+                        connected_component = []
+
+                        while True:
+                            successor = stack.pop()
+                            on_stack[successor] = 0
+                            connected_component.append(successor)
+                            if successor == node:
+                                break
+                        result.append(connected_component)
+
+        return result
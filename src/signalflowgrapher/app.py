@@ -1,10 +1,11 @@
 from PySide6.QtWidgets import QApplication
-from signalflowgrapher.containers import MainWindows
+from signalflowgrapher.containers import MainWindows, Views
 from PySide6 import QtCore
 from signalflowgrapher.utils.icon import set_app_icon
+from signalflowgrapher.utils.arguments import (argument_parser,
+                                               STARTUP_FILE_EXTENSIONS)
 import logging
 import logging.config
-import argparse
 from os import path
 
 
@@ -16,14 +17,7 @@ def run(argv):
     logger.info("Starting application")
 
     # Parse command line arguments
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--language', type=str, help='Optional language name')
-    parser.add_argument(
-        'input_file',
-        nargs='?',
-        type=str,
-        help='Optional path to a .sfg or .json file to open at startup'
-    )
+    parser = argument_parser()
     args = parser.parse_args()
 
     app = QApplication([])
@@ -47,6 +41,8 @@ def run(argv):
             print("Language file %s not found" % language_file)
             exit(2)
 
+    if args.renderer == 'scene':
+        Views.graph_field.override(Views.graph_view)
     window = MainWindows.main_window()
 
     # Open file specified on command line / startup. If this file cannot be
@@ -56,7 +52,7 @@ def run(argv):
         input_file = args.input_file
         file_ext = path.splitext(input_file)[1].lower()
 
-        if file_ext not in ('.sfg', '.json'):
+        if file_ext not in STARTUP_FILE_EXTENSIONS:
             logger.warning("Unsupported startup file type: %s", input_file)
         elif not path.exists(input_file):
             logger.warning("Startup file not found: %s", input_file)
@@ -0,0 +1,113 @@
+import math
+from typing import Dict, Hashable, Iterator, List, Set, Tuple
+
+# Rectangle as (left, top, right, bottom)
+Rect = Tuple[float, float, float, float]
+
+
+class GridIndex(object):
+    """
+    Spatial index of objects by their bounding rectangles on a uniform
+    grid. Every object is registered in the cells its rectangle overlaps,
+    a query only visits the cells of the queried rectangle.
+    """
+
+    def __init__(self, cell_size: float = 128):
+        super().__init__()
+        self.__cell_size = cell_size
+        self.__cells: Dict[Tuple[int, int], Set[Hashable]] = dict()
+        self.__rects: Dict[Hashable, Rect] = dict()
+        # Insertion order of the objects, query results keep it
+        self.__order: Dict[Hashable, int] = dict()
+        self.__count = 0
+
+    def __len__(self):
+        return len(self.__rects)
+
+    def __contains__(self, obj: Hashable):
+        return obj in self.__rects
+
+    def get_rect(self, obj: Hashable) -> Rect:
+        """Get the rectangle of an object."""
+        return self.__rects[obj]
+
+    def insert(self, obj: Hashable, rect: Rect):
+        """
+        Add an object with its rectangle or move an object to a new
+        rectangle.
+        """
+        old_rect = self.__rects.get(obj)
+        if old_rect is not None:
+            if old_rect == rect:
+                return
+            self.__remove_from_cells(obj, old_rect)
+        else:
+            self.__order[obj] = self.__count
+            self.__count += 1
+
+        self.__rects[obj] = rect
+        for cell in self.__cells_of(rect):
+            self.__cells.setdefault(cell, set()).add(obj)
+
+    def remove(self, obj: Hashable):
+        """Remove an object, ignored if it is not in the index."""
+        rect = self.__rects.pop(obj, None)
+        if rect is not None:
+            self.__remove_from_cells(obj, rect)
+            del self.__order[obj]
+
+    def clear(self):
+        """Remove all objects."""
+        self.__cells.clear()
+        self.__rects.clear()
+        self.__order.clear()
+
+    def query(self, rect: Rect) -> List[Hashable]:
+        """
+        Get the objects whose rectangles intersect the rectangle, in
+        insertion order.
+        """
+        left, top, right, bottom = rect
+        found = set()
+        for objects in self.__objects_in_cells(rect):
+            for obj in objects:
+                if obj in found:
+                    continue
+                obj_left, obj_top, obj_right, obj_bottom = self.__rects[obj]
+                if obj_left <= right and left <= obj_right and \
+                        obj_top <= bottom and top <= obj_bottom:
+                    found.add(obj)
+        return sorted(found, key=self.__order.__getitem__)
+
+    def __remove_from_cells(self, obj: Hashable, rect: Rect):
+        for cell in self.__cells_of(rect):
+            objects = self.__cells[cell]
+            objects.discard(obj)
+            if not objects:
+                del self.__cells[cell]
+
+    def __objects_in_cells(self, rect: Rect) -> Iterator[Set[Hashable]]:
+        # Visit the occupied cells instead of all cells of the rectangle
+        # if the rectangle covers more cells than are occupied
+        columns, rows = self.__cell_ranges(rect)
+        if len(columns) * len(rows) <= len(self.__cells):
+            for cell in self.__cells_of(rect):
+                objects = self.__cells.get(cell)
+                if objects is not None:
+                    yield objects
+        else:
+            for (column, row), objects in self.__cells.items():
+                if column in columns and row in rows:
+                    yield objects
+
+    def __cell_ranges(self, rect: Rect) -> Tuple[range, range]:
+        left, top, right, bottom = rect
+        size = self.__cell_size
+        return (range(math.floor(left / size), math.floor(right / size) + 1),
+                range(math.floor(top / size), math.floor(bottom / size) + 1))
+
+    def __cells_of(self, rect: Rect) -> Iterator[Tuple[int, int]]:
+        columns, rows = self.__cell_ranges(rect)
+        for column in columns:
+            for row in rows:
+                yield column, row
@@ -1,5 +1,36 @@
-from sympy.parsing.sympy_parser import parse_expr
-from sympy.abc import _clash
+from functools import lru_cache
+
+# Maximum number of parsed expressions kept in the parse cache
+PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_expression(expression: str) -> "Expr":
+    """
+    Parse a string into a SymPy expression.
+
+    Parsing is pure and SymPy expressions are immutable, so results are
+    kept in a bounded LRU cache shared by all callers. Exceptions of
+    parse_expr are raised unchanged and are not cached.
+
+    Args:
+        expression: The string to parse.
+
+    Returns:
+        sympy.Expr: Parsed SymPy expression.
+    """
+    # SymPy is imported on first use to keep the application startup fast
+    from sympy.parsing.sympy_parser import parse_expr
+    from sympy.abc import _clash
+    return parse_expr(expression, local_dict=_clash)
+
+
+def parse_cache_info():
+    """
+    Get hits, misses, maximum and current size of the parse cache.
+    """
+    return parse_expression.cache_info()
+
 
 def parse_weight(weight: str, branch) -> "Expr":
     """
@@ -12,15 +43,35 @@ def parse_weight(weight: str, branch) -> "Expr":
     Returns:
         sympy.Expr: Parsed SymPy expression.
 
+    Raises:
+        ValueError: If parsing fails, with branch info included.
+    """
+    return parse_branch_weight(weight, branch.start, branch.end)
+
+
+def parse_branch_weight(weight: str, start, end) -> "Expr":
+    """
+    Safely parse a branch weight into a SymPy expression, like
+    parse_weight, with the nodes of the branch given explicitly, e.g. as
+    recorded in a snapshot of the graph.
+
+    Args:
+        weight: The string weight of the branch.
+        start: Start node of the branch (used for error message).
+        end: End node of the branch (used for error message).
+
+    Returns:
+        sympy.Expr: Parsed SymPy expression.
+
     Raises:
         ValueError: If parsing fails, with branch info included.
     """
     try:
-        return parse_expr(weight, local_dict=_clash)
+        return parse_expression(weight)
     except Exception as e:
         raise ValueError(
             f"Invalid expression '{weight}' in branch "
-            f"{branch.start.name} → {branch.end.name}"
+            f"{start.name} → {end.name}"
         ) from e
     
 def parse_factor(factor: str) -> "Expr":
@@ -37,7 +88,7 @@ def parse_factor(factor: str) -> "Expr":
         ValueError: If parsing fails.
     """
     try:
-        return parse_expr(factor, local_dict=_clash)
+        return parse_expression(factor)
     except Exception as e:
         raise ValueError(f"Invalid expression '{factor}' as factor used") from e
 
@@ -55,6 +106,6 @@ def parse_nodename(nodename: str) -> "Expr":
         ValueError: If parsing fails.
     """
     try:
-        return parse_expr(nodename, local_dict=_clash)
+        return parse_expression(nodename)
     except Exception as e:
         raise ValueError(f"Invalid expression '{nodename}' as node name used") from e
\ No newline at end of file
@@ -1,6 +1,7 @@
 from dependency_injector import providers, containers
 from signalflowgrapher.gui.main_window import MainWindow
 from signalflowgrapher.gui.graph_field import GraphField
+from signalflowgrapher.gui.graph_view import GraphView
 from signalflowgrapher.controllers.main_controller import MainController
 from signalflowgrapher.controllers.io_controller import IOController
 from signalflowgrapher.controllers.operation_controller import \
@@ -36,6 +37,12 @@ class Views(containers.DeclarativeContainer):
                                       Controllers.main_controller,
                                       Models.model,
                                       CommandHandlers.command_handler)
+    # Alternative graph field for large graphs, replaces graph_field if
+    # selected at startup
+    graph_view = providers.Singleton(GraphView,
+                                     Controllers.main_controller,
+                                     Models.model,
+                                     CommandHandlers.command_handler)
 
 
 class SideWidgets(containers.DeclarativeContainer):
@@ -1,8 +1,11 @@
 from signalflowgrapher.io.json import JSONExport, JSONImport
+from signalflowgrapher.io.columnar import (ColumnarExport, ColumnarImport,
+                                           is_columnar_file)
 from signalflowgrapher.io.tikz import TikZExport
 from signalflowgrapher.model.model import ObservableGraph, Model
 from signalflowgrapher.algorithms.graph import Graph, Node
 from signalflowgrapher.algorithms.mason import MasonResult, mason
+from signalflowgrapher.algorithms.mason_matrix import mason_matrix
 from signalflowgrapher.commands.command_handler import CommandHandler
 import logging
 logger = logging.getLogger(__name__)
@@ -24,10 +27,17 @@ class IOController(object):
                           path)
 
     def save_graph(self, path: str):
-        """Save graph as json under the given path"""
+        """Save graph as json under the given path, or in the compact
+           columnar format if the path has the columnar file extension
+        """
         logger.info("Save graph to path: %s", path)
-        export = JSONExport()
-        export.write_as_json(self.__model.graph, self.__model.get_grid_position(), path)
+        if is_columnar_file(path):
+            export = ColumnarExport()
+            export.write_as_columnar(self.__model.graph,
+                                     self.__model.get_grid_position(), path)
+        else:
+            export = JSONExport()
+            export.write_as_json(self.__model.graph, self.__model.get_grid_position(), path)
         self.__command_handler.reset()
 
     def new_graph(self):
@@ -40,8 +50,11 @@ class IOController(object):
     def load_graph(self, path: str):
         """Load graph from the given path"""
         logger.info("Load graph from path: %s", path)
-        json_import = JSONImport()
-        dict = json_import.read_from_json(path)
+        if is_columnar_file(path):
+            dict = ColumnarImport().read_from_columnar(path)
+        else:
+            json_import = JSONImport()
+            dict = json_import.read_from_json(path)
         
         # extract grid position; default to (0,0) for backward compatibility
         grid_pos = tuple(dict.get("grid_pos", (0, 0)))
@@ -56,7 +69,17 @@ class IOController(object):
     def generate_mason(self,
                        graph: Graph,
                        start: Node,
-                       end: Node) -> MasonResult:
-        """Apply mason rule"""
-        logger.debug("Generate Mason")
-        return mason(graph, start, end)
+                       end: Node,
+                       method: str = "loops") -> MasonResult:
+        """Apply mason rule.
+           The method "loops" enumerates all loops and forward paths,
+           "matrix" calculates the transfer function by solving the linear
+           system of the graph, which scales to graphs with many loops.
+        """
+        logger.debug("Generate Mason using method %s", method)
+        if method == "loops":
+            return mason(graph, start, end)
+        elif method == "matrix":
+            return mason_matrix(graph, start, end)
+        else:
+            raise ValueError("Unknown mason method '%s'." % method)
@@ -1,6 +1,9 @@
 from typing import List
 from signalflowgrapher.model.model import (
-    CurvedBranch, LabeledObject, Model, PositionedNode)
+    BatchEvent, CurvedBranch, CurvedBranchAddedEvent,
+    CurvedBranchRemovedEvent, CurvedBranchTransformedEvent,
+    GraphChangedEvent, GraphMovedEvent, LabeledObject, Model,
+    PositionedNode, PositionedNodeMovedEvent)
 from signalflowgrapher.commands.create_node_command import CreateNodeCommand
 from signalflowgrapher.commands.remove_node_command import RemoveNodeCommand
 from signalflowgrapher.commands.move_node_command import MoveNodeCommand
@@ -14,6 +17,7 @@ from signalflowgrapher.commands.transform_branch_command import (
     TransformBranchCommand)
 import math
 from signalflowgrapher.common.geometry import rotate, move, distance, collinear
+from signalflowgrapher.common.spatial_index import GridIndex, Rect
 from signalflowgrapher.commands.change_node_name_command import (
     ChangeNodeNameCommand)
 from signalflowgrapher.commands.change_branch_weight_command import (
@@ -22,11 +26,22 @@ from signalflowgrapher.commands.move_label_command import MoveLabelCommand
 import logging
 logger = logging.getLogger(__name__)
 
+# Distance below which the positions of branches are similar, see
+# create_branch_auto_pos
+OVERLAP_DISTANCE = 40
+
+# Number of spline offsets create_branch_auto_pos tries to avoid overlaps
+MAX_SPLINE_OFFSET_TRIES = 20
+
 
 class MainController:
     def __init__(self, model: Model, command_handler: CommandHandler):
         self.__model = model
         self.__command_handler = command_handler
+        # Branches by the bounding rectangle of their nodes and splines,
+        # built on first use and kept up to date from the model events
+        self.__branch_index: GridIndex = None
+        self.__model.observe(self.__handle_model_change)
 
     def create_node(self, x_pos: int, y_pos: int) -> PositionedNode:
         """Create a new node at the given coordinates."""
@@ -70,22 +85,27 @@ class MainController:
     def move_node(self, node: PositionedNode, dx: int, dy: int):
         """Move node dx, dy pixels."""
         logger.debug("Move node, dx: %s, dy: %s", dx, dy)
-        self.__model.graph.move_node_relative(node, dx, dy)
-        for branch in node.ingoing:
-            self.__command_handler.add_command(TransformBranchCommand(
-                self.__model.graph,
-                branch,
-                0, 0,
-                dx, dy))
-            self.__model.graph.transform_branch(branch, 0, 0, dx, dy)
-
-        for branch in node.outgoing:
-            self.__command_handler.add_command(TransformBranchCommand(
-                self.__model.graph,
-                branch,
-                dx, dy,
-                0, 0))
-            self.__model.graph.transform_branch(branch, dx, dy, 0, 0)
+        # Notify the node move and the branch transformations at once
+        self.__model.begin_batch()
+        try:
+            self.__model.graph.move_node_relative(node, dx, dy)
+            for branch in node.ingoing:
+                self.__command_handler.add_command(TransformBranchCommand(
+                    self.__model.graph,
+                    branch,
+                    0, 0,
+                    dx, dy))
+                self.__model.graph.transform_branch(branch, 0, 0, dx, dy)
+
+            for branch in node.outgoing:
+                self.__command_handler.add_command(TransformBranchCommand(
+                    self.__model.graph,
+                    branch,
+                    dx, dy,
+                    0, 0))
+                self.__model.graph.transform_branch(branch, dx, dy, 0, 0)
+        finally:
+            self.__model.end_batch()
 
         command = MoveNodeCommand(node, dx, dy, self.__model.graph)
         self.__command_handler.add_command(command)
@@ -175,36 +195,17 @@ class MainController:
         if start_node is end_node:
             raise ValueError("Cannot create self loop, use dedicated method.")
 
+        new_start = [start_node.x, start_node.y]
+        new_end = [end_node.x, end_node.y]
+
         # Find Branches with similar start / end positions
         # or which are straight lines and are on the same line
-        # (collinear points)
-        overlap = list()
-        for branch in self.__model.graph.branches:
-            (exist_start,
-             exist_end,
-             exist_spline1,
-             exist_spline2) = self.__get_points_of_branch(branch)
-
-            new_start = [start_node.x, start_node.y]
-            new_end = [end_node.x, end_node.y]
-
-            # Add branch to overlap if it has similar start
-            # and end points (check both ways if one branch is flipped)
-            if ((distance(exist_start, new_start)
-                 + distance(exist_end, new_end) < 40)
-                or (distance(exist_start, new_end)
-                    + distance(exist_end, new_start) < 40)):
-                overlap.append(branch)
-
-            # Check if the existing branch is straight and
-            # is on the same line as the new branch
-            if (collinear([exist_spline1,
-                           exist_spline2,
-                           exist_start,
-                           exist_end,
-                           new_start,
-                           new_end])):
-                overlap.append(branch)
+        # (collinear points). Only branches near the new branch are
+        # candidates.
+        branch_index = self.__get_branch_index()
+        overlap = [branch for branch in branch_index.query(
+                       self.__rect_around([new_start, new_end]))
+                   if self.__is_overlapping(branch, new_start, new_end)]
 
         # Calculate inital spline positions (forming a straight line)
         max_x = max(start_node.x, end_node.x)
@@ -228,6 +229,8 @@ class MainController:
             use_left_side = (start_node.x < end_node.x)
             while (not all_far_away):
                 all_far_away = True
+                new_spline1 = [spline1_x, spline1_y]
+                new_spline2 = [spline2_x, spline2_y]
 
                 # Check all near branches for overlapping
                 for o in overlap:
@@ -236,17 +239,14 @@ class MainController:
                      exist_spline1,
                      exist_spline2) = self.__get_points_of_branch(o)
 
-                    new_spline1 = [spline1_x, spline1_y]
-                    new_spline2 = [spline2_x, spline2_y]
-                    new_start = [start_node.x, start_node.y]
-                    new_end = [end_node.x, end_node.y]
-
                     # Check if the splines have similar position which means
                     # that the branch have also a similar position
                     if ((distance(exist_spline1, new_spline1)
-                         + distance(exist_spline2, new_spline2) < 40)
+                         + distance(exist_spline2, new_spline2)
+                         < OVERLAP_DISTANCE)
                         or (distance(exist_spline1, new_spline2)
-                            + distance(exist_spline2, new_spline1) < 40)):
+                            + distance(exist_spline2, new_spline1)
+                            < OVERLAP_DISTANCE)):
                         all_far_away = False
 
                     # Check if all points are on the same line
@@ -264,6 +264,11 @@ class MainController:
 
                 # Increase spline position if any spline was to near
                 if (not all_far_away):
+                    if i == MAX_SPLINE_OFFSET_TRIES:
+                        logger.debug("No spline position without overlap "
+                                     "found")
+                        break
+
                     if use_left_side:
                         (spline1_x,
                          spline1_y,
@@ -351,6 +356,79 @@ class MainController:
                            spline_2x, spline_2y,
                            0, y_offset_label, weight)
 
+    def __is_overlapping(self,
+                         branch: CurvedBranch,
+                         new_start: List[int],
+                         new_end: List[int]) -> bool:
+        """
+        Check if a branch has similar start and end points as a new branch
+        or is straight and on the same line.
+        """
+        (exist_start,
+         exist_end,
+         exist_spline1,
+         exist_spline2) = self.__get_points_of_branch(branch)
+
+        # Similar start and end points (check both ways if one branch
+        # is flipped)
+        if ((distance(exist_start, new_start)
+             + distance(exist_end, new_end) < OVERLAP_DISTANCE)
+            or (distance(exist_start, new_end)
+                + distance(exist_end, new_start) < OVERLAP_DISTANCE)):
+            return True
+
+        # Existing branch is straight and on the same line
+        return collinear([exist_spline1,
+                          exist_spline2,
+                          exist_start,
+                          exist_end,
+                          new_start,
+                          new_end])
+
+    def __rect_around(self, points: List[List[int]]) -> Rect:
+        """
+        Get the bounding rectangle of points with a margin of the overlap
+        distance.
+        """
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        return (min(xs) - OVERLAP_DISTANCE, min(ys) - OVERLAP_DISTANCE,
+                max(xs) + OVERLAP_DISTANCE, max(ys) + OVERLAP_DISTANCE)
+
+    def __get_branch_index(self) -> GridIndex:
+        if self.__branch_index is None:
+            self.__branch_index = GridIndex()
+            for branch in self.__model.graph.branches:
+                self.__index_branch(branch)
+        return self.__branch_index
+
+    def __index_branch(self, branch: CurvedBranch):
+        points = self.__get_points_of_branch(branch)
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        self.__branch_index.insert(branch,
+                                   (min(xs), min(ys), max(xs), max(ys)))
+
+    def __handle_model_change(self, event):
+        # Keep the branch index up to date, it is built again on next use
+        # if the graph is replaced or moved
+        if self.__branch_index is None:
+            return
+
+        if isinstance(event, BatchEvent):
+            for batch_event in event.events:
+                self.__handle_model_change(batch_event)
+        elif isinstance(event, (CurvedBranchAddedEvent,
+                                CurvedBranchTransformedEvent)):
+            self.__index_branch(event.branch)
+        elif isinstance(event, CurvedBranchRemovedEvent):
+            self.__branch_index.remove(event.branch)
+        elif isinstance(event, PositionedNodeMovedEvent):
+            for branch in event.node.ingoing | event.node.outgoing:
+                self.__index_branch(branch)
+        elif isinstance(event, (GraphChangedEvent, GraphMovedEvent)):
+            self.__branch_index = None
+
     def __get_points_of_branch(self, branch: CurvedBranch) -> (List[int],
                                                                List[int],
                                                                List[int],
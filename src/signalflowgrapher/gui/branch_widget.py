@@ -7,9 +7,10 @@ from signalflowgrapher.gui.graph_item import (
     GraphItem, WidgetClickEvent, WidgetEvent)
 from signalflowgrapher.model.model import (
     CurvedBranch, PositionedNode, CurvedBranchTransformedEvent,
-    PositionedNodeMovedEvent, GraphMovedEvent)
+    PositionedNodeMovedEvent, GraphMovedEvent, BatchEvent)
 import math
-from signalflowgrapher.gui.geometry import rotate_pointF, rotate_point
+from signalflowgrapher.gui.geometry import (
+    rotate_point, arrow_path, bezier_middle, bezier_middle_angle, ViewOffset)
 
 
 class BranchWidget(GraphItem):
@@ -18,9 +19,13 @@ class BranchWidget(GraphItem):
                  spline1: QPoint,
                  spline2: QPoint,
                  *args,
+                 view_offset: ViewOffset = None,
                  ** kwargs):
         super().__init__(*args, **kwargs)
         self.__owner = owner
+        # Start, end and splines are in model coordinates, the geometry
+        # of the widget is mapped to the view by the view offset
+        self.__view_offset = view_offset or ViewOffset()
         self.__start = QPoint(int(owner.start.x), int(owner.start.y))
         self.__end = QPoint(int(owner.end.x), int(owner.end.y))
         self.__spline1 = spline1
@@ -41,10 +46,26 @@ class BranchWidget(GraphItem):
         self.__arrow_mask_height_offset = 5
         self.__arrow_mask = None
         self.__arrow = None
+        # Shape of the branch relative to its start and the position of
+        # start and widget of the last calculated geometry. The paths and
+        # the mask are relative to the widget, if only the position of the
+        # branch changes they are reused and the widget is moved.
+        self.__shape = None
+        self.__shape_start = None
+        self.__shape_position = None
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.updateGeometry()
 
     def updateGeometry(self):
+        shape = (self.__end - self.__start,
+                 self.__spline1 - self.__start,
+                 self.__spline2 - self.__start)
+        if shape == self.__shape:
+            # Pure translation, move the widget with the cached paths
+            self.move(self.__view_offset.to_view(
+                self.__shape_position + self.__start - self.__shape_start))
+            return
+
         # Calculate path absolute
         branch_abs = QPainterPath()
         branch_abs.moveTo(self.__start)
@@ -86,11 +107,11 @@ class BranchWidget(GraphItem):
 
         # Unite arrow mask bounds and branch bounds and set as geometry
         united = geo_branch.united(geo_arrow_mask)
-        self.setGeometry(united)
+        self.setGeometry(united.translated(self.__view_offset.get()))
         super().updateGeometry()
 
         # Translate absolute paths to relative paths for use in widget
-        offset = self.mapFromParent(QPoint())
+        offset = QPoint() - united.topLeft()
         path_rel = QPainterPath(branch_abs)
         path_rel.translate(offset)
         self.__branch = path_rel
@@ -115,6 +136,10 @@ class BranchWidget(GraphItem):
         self.setMask(region)
         self.update()
 
+        self.__shape = shape
+        self.__shape_start = QPoint(self.__start)
+        self.__shape_position = united.topLeft()
+
     def branch_transformed_event(self,
                                  event: CurvedBranchTransformedEvent):
         """
@@ -154,6 +179,30 @@ class BranchWidget(GraphItem):
                                 int(event.node.y))
             self.updateGeometry()
 
+    def batch_event(self, event: BatchEvent):
+        """
+        Triggered after a batch of changes that moved a node of the branch
+        or transformed the branch. Updates the geometry of the widget once.
+        """
+        # A removed branch has no nodes, its widget is deleted later
+        if self.__owner.graph is None:
+            return
+
+        start = QPoint(int(self.__owner.start.x), int(self.__owner.start.y))
+        end = QPoint(int(self.__owner.end.x), int(self.__owner.end.y))
+        spline1 = QPoint(int(self.__owner.spline1_x),
+                         int(self.__owner.spline1_y))
+        spline2 = QPoint(int(self.__owner.spline2_x),
+                         int(self.__owner.spline2_y))
+
+        if not (self.__start == start and self.__end == end and
+                self.__spline1 == spline1 and self.__spline2 == spline2):
+            self.__start = start
+            self.__end = end
+            self.__spline1 = spline1
+            self.__spline2 = spline2
+            self.updateGeometry()
+
     def graph_moved_event(self, event: GraphMovedEvent):
         """
         Triggered after the whole graph has been moved.
@@ -178,13 +227,15 @@ class BranchWidget(GraphItem):
             branch=self.__owner,
             node=self.__owner.start,
             origin=self.__start,
-            spline=self.__spline1)
+            spline=self.__spline1,
+            view_offset=self.__view_offset)
         handle2 = Spline2HandleWidget(
             parent=self.parent(),
             node=self.__owner.end,
             branch=self.__owner,
             origin=self.__end,
-            spline=self.__spline2)
+            spline=self.__spline2,
+            view_offset=self.__view_offset)
         return [handle1, handle2]
 
     def paintEvent(self, QPaintEvent):
@@ -222,84 +273,8 @@ class BranchWidget(GraphItem):
         Calculate the QPainterPath of an arrow consisting
         of three Bézier curves
         """
-
-        # Calculate the edge positions of the triangle
-        head_edge_not_rotated = QPointF(branch_middle.x()
-                                        + (arrow_length / 2),
-                                        branch_middle.y())
-
-        head_edge = rotate_pointF(branch_middle,
-                                  head_edge_not_rotated,
-                                  middle_angle)
-
-        top_edge = rotate_pointF(branch_middle,
-                                 QPointF(head_edge_not_rotated.x() -
-                                         arrow_length,
-                                         head_edge_not_rotated.y() -
-                                         arrow_height),
-                                 middle_angle)
-        bottom_edge = rotate_pointF(branch_middle,
-                                    QPointF(head_edge_not_rotated.x() -
-                                            arrow_length,
-                                            head_edge_not_rotated.y() +
-                                            arrow_height),
-                                    middle_angle)
-
-        # Calculate the angle of the top of the arrow
-        arrow_top_angle = math.tanh(arrow_height / arrow_length)
-
-        # Calculate the position of the splines for the sides
-        # The splines are positioned at the middle of the sides
-        # with a defined right-angled spacing
-        arrow_side_length = math.sqrt(math.pow(arrow_length, 2) +
-                                      math.pow(arrow_height, 2))
-        side_spline_angle = math.tanh(side_spline_depth /
-                                      (arrow_side_length / 2))
-        side_spline_length = (arrow_side_length / 2) / math.cos(
-            side_spline_angle)
-
-        # Rotate point arround heade_edge for reaching the calculated position
-        # then rotate it around the arrow angle
-        top_spline = rotate_pointF(branch_middle,
-                                   rotate_pointF(
-                                       head_edge_not_rotated,
-                                       QPointF(head_edge_not_rotated.x()
-                                               - side_spline_length,
-                                               head_edge_not_rotated.y()),
-                                       arrow_top_angle -
-                                       side_spline_angle),
-                                   middle_angle)
-
-        bottom_spline = rotate_pointF(branch_middle,
-                                      rotate_pointF(
-                                          head_edge_not_rotated,
-                                          QPointF(head_edge_not_rotated.x()
-                                                  - side_spline_length,
-                                                  head_edge_not_rotated.y()),
-                                          -(arrow_top_angle -
-                                            side_spline_angle)),
-                                      middle_angle)
-
-        back_spline = rotate_pointF(branch_middle,
-                                    QPointF(head_edge_not_rotated.x() -
-                                            arrow_length + back_spline_depth,
-                                            head_edge_not_rotated.y()),
-                                    middle_angle)
-
-        # Build path for drawing arrow
-        arrow = QPainterPath()
-        arrow.moveTo(head_edge)
-        arrow.cubicTo(top_spline,
-                      top_spline,
-                      top_edge)
-        arrow.cubicTo(back_spline,
-                      back_spline,
-                      bottom_edge)
-        arrow.cubicTo(bottom_spline,
-                      bottom_spline,
-                      head_edge)
-
-        return arrow
+        return arrow_path(branch_middle, middle_angle, arrow_height,
+                          arrow_length, side_spline_depth, back_spline_depth)
 
     def get_branch_middle(self) -> QPointF:
         """
@@ -312,9 +287,7 @@ class BranchWidget(GraphItem):
         """
         Get the point in the middle of a bezier curve.
         """
-        percent_middle = bezier.percentAtLength(
-            bezier.length() / 2)
-        return bezier.pointAtPercent(percent_middle)
+        return bezier_middle(bezier)
 
     def get_branch_middle_angle(self) -> float:
         """
@@ -326,10 +299,7 @@ class BranchWidget(GraphItem):
         """
         Get the angle in the middle of a bezier curve.
         """
-        percent_middle = bezier.percentAtLength(
-            bezier.length() / 2)
-        return -math.radians(
-            bezier.angleAtPercent(percent_middle))
+        return bezier_middle_angle(bezier)
 
     def get_center(self) -> QPointF:
         """
@@ -383,10 +353,13 @@ class SplineHandleWidget(GraphItem):
     def __init__(self, *args,
                  branch: CurvedBranch, node: PositionedNode,
                  origin: QPoint, spline: QPoint,
+                 view_offset: ViewOffset = None,
                  **kwargs):
         super().__init__(*args, **kwargs)
         self.__branch = branch
         self.__node = node
+        # Origin and spline are in model coordinates
+        self.__view_offset = view_offset or ViewOffset()
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self._origin_abs = origin
         self._spline_abs = spline
@@ -398,14 +371,18 @@ class SplineHandleWidget(GraphItem):
         self.updateGeometry()
 
     def updateGeometry(self):
+        # Absolute positions in view coordinates
+        origin_abs = self.__view_offset.to_view(self._origin_abs)
+        spline_abs = self.__view_offset.to_view(self._spline_abs)
+
         # Get absolute position of handle by spline
         __handle_pos_abs = rotate_point(
-            self._origin_abs,
-            self._spline_abs,
+            origin_abs,
+            spline_abs,
             math.radians(180))
 
         # Calculate bounding rect including circle and line
-        rect = QRect(self._origin_abs, __handle_pos_abs).normalized()  # Line
+        rect = QRect(origin_abs, __handle_pos_abs).normalized()  # Line
         circle_offset = QPoint(int(self.__circle_width + self.__radius),
                                int(self.__circle_width + self.__radius))
         circle_rect = QRect(__handle_pos_abs - circle_offset,  # Circle
@@ -414,8 +391,8 @@ class SplineHandleWidget(GraphItem):
         self.setGeometry(rect.united(circle_rect))
 
         self.__handle_pos = self.mapFromParent(__handle_pos_abs)
-        self._origin = self.mapFromParent(self._origin_abs)
-        self._spline = self.mapFromParent(self._spline_abs)
+        self._origin = self.mapFromParent(origin_abs)
+        self._spline = self.mapFromParent(spline_abs)
 
         # Create line
         self.line_path = QPainterPath()
@@ -444,8 +421,8 @@ class SplineHandleWidget(GraphItem):
 
     def get_center(self) -> QPointF:
         return rotate_point(
-            self._origin_abs,
-            self._spline_abs,
+            self.__view_offset.to_view(self._origin_abs),
+            self.__view_offset.to_view(self._spline_abs),
             math.radians(180))
 
     def get_node(self):
@@ -0,0 +1,130 @@
+import json
+from typing import Dict, List
+from PySide6.QtWidgets import QApplication
+from signalflowgrapher.commands.command_handler import CommandHandler
+from signalflowgrapher.controllers.main_controller import MainController
+from signalflowgrapher.model.model import (
+    CurvedBranch, LabeledObject, PositionedNode)
+
+
+def copy_to_clipboard(selection: List[LabeledObject]):
+    """
+    Copy the selected nodes and the selected branches between them to the
+    clipboard as JSON.
+    """
+    selected_nodes = []
+    selected_branches = []
+
+    # Collect nodes
+    for m in selection:
+        if isinstance(m, PositionedNode):
+            selected_nodes.append(m)
+
+    selected_node_ids = {n.id.hex for n in selected_nodes}
+
+    # Collect branches whose endpoints are fully selected
+    for m in selection:
+        if isinstance(m, CurvedBranch):
+            if m.start.id.hex in selected_node_ids and \
+                    m.end.id.hex in selected_node_ids:
+                selected_branches.append(m)
+
+    data = {
+        "nodes": [n.to_dict() for n in selected_nodes],
+        "branches": [b.to_dict() for b in selected_branches]
+    }
+
+    QApplication.clipboard().setText(json.dumps(data))
+
+
+def read_clipboard() -> Dict:
+    """
+    Read nodes and branches copied to the clipboard. Returns None if the
+    clipboard contains no nodes.
+    """
+    text = QApplication.clipboard().text()
+    if not text.strip():
+        return None  # clipboard empty
+
+    # Parse JSON
+    try:
+        data = json.loads(text)
+    except Exception:
+        return None  # invalid JSON
+
+    if not data.get("nodes", []):
+        return None  # no nodes, nothing to paste
+
+    return data
+
+
+def paste(controller: MainController,
+          command_handler: CommandHandler,
+          data: Dict,
+          x: int,
+          y: int) -> List[LabeledObject]:
+    """
+    Create the nodes and branches read from the clipboard, moved so the
+    top left node lands on x, y. Returns the created nodes and branches.
+    """
+    nodes_data = data.get("nodes", [])
+    branches_data = data.get("branches", [])
+
+    # Compute bounding box of copied nodes
+    min_x = min(n["x"] for n in nodes_data)
+    min_y = min(n["y"] for n in nodes_data)
+
+    # Offset so min_x/min_y lands at the given position
+    dx = x - min_x
+    dy = y - min_y
+
+    id_map = {}
+    new_branches = []
+
+    command_handler.start_script()
+    try:
+        # Paste nodes
+        for nd in nodes_data:
+            new_x = nd["x"] + dx
+            new_y = nd["y"] + dy
+
+            new_node = controller.create_node(new_x, new_y)
+
+            # Restore node name if present
+            name = nd.get("name")
+            if name:
+                controller.set_node_name(new_node, name)
+
+            id_map[nd["id"]] = new_node
+
+        # Paste branches
+        for bd in branches_data:
+            sid = bd["start"]
+            eid = bd["end"]
+
+            if sid not in id_map or eid not in id_map:
+                continue  # skip branches if nodes not pasted
+
+            start_node = id_map[sid]
+            end_node = id_map[eid]
+
+            s1x = bd.get("spline1_x", 0) + dx
+            s1y = bd.get("spline1_y", 0) + dy
+            s2x = bd.get("spline2_x", 0) + dx
+            s2y = bd.get("spline2_y", 0) + dy
+            label_dx = bd.get("label_dx", 0)
+            label_dy = bd.get("label_dy", 0)
+            weight = bd.get("weight", "")
+
+            branch = controller.create_branch(
+                start_node, end_node,
+                s1x, s1y, s2x, s2y,
+                label_dx, label_dy,
+                weight
+            )
+            new_branches.append(branch)
+
+    finally:
+        command_handler.end_script()
+
+    return list(id_map.values()) + new_branches
@@ -1,4 +1,6 @@
+import math
 from PySide6.QtCore import QPoint, QPointF
+from PySide6.QtGui import QPainterPath
 from signalflowgrapher.common.geometry import rotate
 
 
@@ -16,3 +18,138 @@ def rotate_pointF(origin: QPointF, point: QPointF, angle: QPointF):
     """
     [x, y] = rotate([origin.x(), origin.y()], [point.x(), point.y()], angle)
     return QPointF(x, y)
+
+
+def bezier_middle(bezier: QPainterPath) -> QPointF:
+    """
+    Get the point in the middle of a bezier curve.
+    """
+    percent_middle = bezier.percentAtLength(
+        bezier.length() / 2)
+    return bezier.pointAtPercent(percent_middle)
+
+
+def bezier_middle_angle(bezier: QPainterPath) -> float:
+    """
+    Get the angle in the middle of a bezier curve.
+    """
+    percent_middle = bezier.percentAtLength(
+        bezier.length() / 2)
+    return -math.radians(
+        bezier.angleAtPercent(percent_middle))
+
+
+def arrow_path(branch_middle: QPointF,
+               middle_angle: float,
+               arrow_height: float,
+               arrow_length: float,
+               side_spline_depth: float,
+               back_spline_depth: float) -> QPainterPath:
+    """
+    Calculate the QPainterPath of an arrow consisting
+    of three Bézier curves
+    """
+    # Calculate the edge positions of the triangle
+    head_edge_not_rotated = QPointF(branch_middle.x()
+                                    + (arrow_length / 2),
+                                    branch_middle.y())
+
+    head_edge = rotate_pointF(branch_middle,
+                              head_edge_not_rotated,
+                              middle_angle)
+
+    top_edge = rotate_pointF(branch_middle,
+                             QPointF(head_edge_not_rotated.x() -
+                                     arrow_length,
+                                     head_edge_not_rotated.y() -
+                                     arrow_height),
+                             middle_angle)
+    bottom_edge = rotate_pointF(branch_middle,
+                                QPointF(head_edge_not_rotated.x() -
+                                        arrow_length,
+                                        head_edge_not_rotated.y() +
+                                        arrow_height),
+                                middle_angle)
+
+    # Calculate the angle of the top of the arrow
+    arrow_top_angle = math.tanh(arrow_height / arrow_length)
+
+    # Calculate the position of the splines for the sides
+    # The splines are positioned at the middle of the sides
+    # with a defined right-angled spacing
+    arrow_side_length = math.sqrt(math.pow(arrow_length, 2) +
+                                  math.pow(arrow_height, 2))
+    side_spline_angle = math.tanh(side_spline_depth /
+                                  (arrow_side_length / 2))
+    side_spline_length = (arrow_side_length / 2) / math.cos(
+        side_spline_angle)
+
+    # Rotate point arround heade_edge for reaching the calculated position
+    # then rotate it around the arrow angle
+    top_spline = rotate_pointF(branch_middle,
+                               rotate_pointF(
+                                   head_edge_not_rotated,
+                                   QPointF(head_edge_not_rotated.x()
+                                           - side_spline_length,
+                                           head_edge_not_rotated.y()),
+                                   arrow_top_angle -
+                                   side_spline_angle),
+                               middle_angle)
+
+    bottom_spline = rotate_pointF(branch_middle,
+                                  rotate_pointF(
+                                      head_edge_not_rotated,
+                                      QPointF(head_edge_not_rotated.x()
+                                              - side_spline_length,
+                                              head_edge_not_rotated.y()),
+                                      -(arrow_top_angle -
+                                        side_spline_angle)),
+                                  middle_angle)
+
+    back_spline = rotate_pointF(branch_middle,
+                                QPointF(head_edge_not_rotated.x() -
+                                        arrow_length + back_spline_depth,
+                                        head_edge_not_rotated.y()),
+                                middle_angle)
+
+    # Build path for drawing arrow
+    arrow = QPainterPath()
+    arrow.moveTo(head_edge)
+    arrow.cubicTo(top_spline,
+                  top_spline,
+                  top_edge)
+    arrow.cubicTo(back_spline,
+                  back_spline,
+                  bottom_edge)
+    arrow.cubicTo(bottom_spline,
+                  bottom_spline,
+                  head_edge)
+
+    return arrow
+
+
+class ViewOffset(object):
+    """
+    Offset of the view to the model coordinates, shared by the graph field
+    and its widgets. Panning changes the offset instead of the model.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__offset = QPoint()
+
+    def get(self) -> QPoint:
+        """Get the offset."""
+        return QPoint(self.__offset)
+
+    def set(self, offset: QPoint):
+        """Set the offset."""
+        self.__offset = QPoint(offset)
+
+    def to_view(self, point: QPoint) -> QPoint:
+        """Map a point in model coordinates to view coordinates."""
+        return point + self.__offset
+
+    def to_model(self, point: QPoint) -> QPoint:
+        """Map a point in view coordinates to model coordinates."""
+        return point - self.__offset
@@ -1,28 +1,30 @@
 from PySide6 import QtCore, QtGui
 from PySide6.QtCore import Qt, QPoint, QRect, QSize
 from PySide6.QtGui import QMouseEvent, QCursor, QResizeEvent
-from PySide6.QtWidgets import QWidget, QApplication, QMessageBox, QRubberBand
+from PySide6.QtWidgets import QWidget, QMessageBox, QRubberBand
 from signalflowgrapher.gui.grid import FixedGrid, NoneGrid
 from signalflowgrapher.gui.fixed_grid_widget import FixedGridWidget
+from signalflowgrapher.gui.geometry import ViewOffset
 from signalflowgrapher.gui.branch_widget import (
     BranchWidget, Spline1HandleWidget, Spline2HandleWidget,
     SplineHandleWidgetMoveEvent, SplineHandleWidgetPressEvent,
     SplineHandleWidgetReleaseEvent, WidgetClickEvent)
 from signalflowgrapher.commands.command_handler import CommandHandler
 from signalflowgrapher.model.model import (
-    Model, CurvedBranchAddedEvent, CurvedBranchRemovedEvent,
+    Model, BatchEvent, CurvedBranchAddedEvent, CurvedBranchRemovedEvent,
     CurvedBranchTransformedEvent, GraphChangedEvent, GraphMovedEvent,
     LabelChangedTextEvent, LabelMovedEvent,
     LabeledObject, PositionedNodeAddedEvent,
-    PositionedNodeMovedEvent, PositionedNodeRemovedEvent,
-    PositionedNode, CurvedBranch)
+    PositionedNodeMovedEvent, PositionedNodeRemovedEvent)
 from signalflowgrapher.gui.node_widget import NodeWidget
 from signalflowgrapher.controllers.main_controller import MainController
 from signalflowgrapher.gui.label_widget import LabelWidget
 from signalflowgrapher.gui.graph_item import (
     WidgetMoveEvent, WidgetPressEvent, WidgetReleaseEvent, GraphItem)
+from signalflowgrapher.gui.clipboard import (
+    copy_to_clipboard, read_clipboard, paste)
 from signalflowgrapher.common.observable import ValueObservable
-import json
+from signalflowgrapher.common.spatial_index import GridIndex
 import logging
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,15 @@ class GraphField(QWidget):
         self.__widget_model_map = {}
         self.__model_label_map = {}
         self.__label_model_map = {}
+        # Branch widgets incident to a node, the widgets to notify on node
+        # events besides the node widget and its label
+        self.__node_branch_widgets = {}
+        # Nodes a branch widget is registered at, the branch has no nodes
+        # anymore when its removal is notified
+        self.__branch_widget_nodes = {}
+        # Geometry of the node and branch widgets in model coordinates,
+        # finds the widgets in the rubber band without visiting all widgets
+        self.__spatial_index = GridIndex()
         self.__mouse_press_pos: QPoint = None
         self.__selection_rect = None
         self.__grid_size = 30
@@ -53,6 +64,8 @@ class GraphField(QWidget):
         self.__grid_widget.resize(self.size())
         self.__grid_widget.show()
         self.__grid_offset = QPoint()
+        # Panning moves the view, not the model
+        self.__view_offset = ViewOffset()
         self.__rubber_band: QRubberBand = QRubberBand(
             QRubberBand.Rectangle, self)
 
@@ -96,13 +109,36 @@ class GraphField(QWidget):
         dx = viewport_center_x - graph_center_x
         dy = viewport_center_y - graph_center_y
 
-        # Move graph and update grid offset
-        self.__model.move_graph_relative(dx, dy)
+        self.__pan(dx, dy)
+
+    def normalize_view(self):
+        """
+        Apply the offset of the view to the model coordinates, e.g. before
+        saving, so the saved coordinates are the visible ones. The graph
+        does not move on the screen.
+        """
+        offset = self.__view_offset.get()
+        if offset.isNull():
+            return
+
+        self.__view_offset.set(QPoint())
+        self.__scroll_widgets(-offset.x(), -offset.y())
+        self.__model.move_graph_relative(offset.x(), offset.y())
+
+    def __pan(self, dx: int, dy: int):
+        # Move the view and the grid, the model is not changed
+        self.__view_offset.set(self.__view_offset.get() + QPoint(dx, dy))
         self.__grid_offset += QtCore.QPoint(dx, dy)
         self.__grid.set_offset(self.__grid_offset)
         self.__grid_widget.set_offset(self.__grid_offset)
+        self.__scroll_widgets(dx, dy)
         self.__grid_widget.repaint()
 
+    def __scroll_widgets(self, dx: int, dy: int):
+        # Qt moves all child widgets, the grid widget keeps covering the
+        # whole field
+        self.scroll(dx, dy)
+        self.__grid_widget.move(0, 0)
 
     def __selection_changed(self):
         self.selection.set(tuple(self.__widget_model_map.get(widget)
@@ -133,7 +169,8 @@ class GraphField(QWidget):
 
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
-            grid_pos = self.__grid.get_grid_position(event.position().toPoint())
+            grid_pos = self.__view_offset.to_model(
+                self.__grid.get_grid_position(event.position().toPoint()))
             self.__controller.create_node(grid_pos.x(), grid_pos.y())
 
     def mouseMoveEvent(self, event: QMouseEvent):
@@ -142,25 +179,36 @@ class GraphField(QWidget):
             global_position = event.globalPosition().toPoint()
             diff = global_position - self.__mouse_press_pos
             if self.__rubber_band.isVisible():
-                self.__rubber_band.setGeometry(
-                    QRect(self.mapFromGlobal(self.__mouse_press_pos),
-                        event.position().toPoint()).normalized())
-                # Add to selection if inside rubber band remove otherwise
-                for widget in self.__model_widget_map.values():
-                    if self.__rubber_band.geometry().contains(
-                            widget.geometry()):
-                        self.__add_selection(widget)
-                    else:
-                        self.__remove_selection(widget)
+                rect = QRect(self.mapFromGlobal(self.__mouse_press_pos),
+                             event.position().toPoint()).normalized()
+                self.__rubber_band.setGeometry(rect)
+                self.__select_in(rect)
             else:
                 self.setCursor(QCursor(Qt.ClosedHandCursor))
-                self.__grid_offset += diff
-                self.__grid.set_offset(self.__grid_offset)
-                self.__grid_widget.set_offset(self.__grid_offset)
-                self.__grid_widget.repaint()
-                self.__model.move_graph_relative(diff.x(), diff.y())
+                self.__pan(diff.x(), diff.y())
                 self.__mouse_press_pos = global_position
 
+    def __select_in(self, rect: QRect):
+        # Select the widgets inside the rectangle, only the widgets found
+        # in the spatial index are tested
+        model_rect = rect.translated(-self.__view_offset.get())
+        candidates = self.__spatial_index.query(
+            (model_rect.x(), model_rect.y(),
+             model_rect.x() + model_rect.width(),
+             model_rect.y() + model_rect.height()))
+        self.__set_selection([widget for widget in candidates
+                              if rect.contains(widget.geometry())])
+
+    def __index_widgets(self, widgets):
+        # Register the geometry of widgets in model coordinates, so
+        # panning does not change the index
+        offset = self.__view_offset.get()
+        for widget in widgets:
+            rect = widget.geometry().translated(-offset)
+            self.__spatial_index.insert(
+                widget, (rect.x(), rect.y(),
+                         rect.x() + rect.width(), rect.y() + rect.height()))
+
     def __on_label_click(self, event):
         if isinstance(event, WidgetPressEvent):
             if event.mouse_event.button() == Qt.LeftButton:
@@ -232,13 +280,18 @@ class GraphField(QWidget):
                 event.dy,
                 event.widget)
 
-            for widget in self.__selection:
-                if isinstance(widget, NodeWidget):
-                    node = self.__widget_model_map[widget]
-                    if grid_move.x() != 0 or grid_move.y() != 0:
-                        self.__controller.move_node(node,
-                                                    grid_move.x(),
-                                                    grid_move.y())
+            # Move all selected nodes with one update of the widgets
+            self.__model.begin_batch()
+            try:
+                for widget in self.__selection:
+                    if isinstance(widget, NodeWidget):
+                        node = self.__widget_model_map[widget]
+                        if grid_move.x() != 0 or grid_move.y() != 0:
+                            self.__controller.move_node(node,
+                                                        grid_move.x(),
+                                                        grid_move.y())
+            finally:
+                self.__model.end_batch()
 
     def __on_branch_click(self, event: WidgetPressEvent):
         if isinstance(event, WidgetPressEvent):
@@ -293,9 +346,8 @@ class GraphField(QWidget):
         return self.__selection.copy()
 
     def select_all(self):
-        self.__clear_selection()
-        for widget in self.__model_widget_map.values():
-            self.__add_selection(widget)
+        self.__clear_handles()
+        self.__set_selection(list(self.__model_widget_map.values()))
 
     def __clear_handles(self):
         # Remove all handles for next selection
@@ -316,6 +368,32 @@ class GraphField(QWidget):
         self.update()
         self.__selection_changed()
 
+    def __set_selection(self, widgets):
+        # Replace the selection with one notification, widgets which stay
+        # selected keep their order
+        new_widgets = set(widgets)
+        old_widgets = set(self.__selection)
+        for widget in self.__selection:
+            if widget not in new_widgets:
+                widget.unselect()
+                widget.update()
+                self.__model_label_map[
+                    self.__widget_model_map[widget]].unselect()
+
+        selection = [w for w in self.__selection if w in new_widgets]
+        selection.extend(w for w in widgets if w not in old_widgets)
+        for number, widget in enumerate(selection, 1):
+            if not widget.selected or \
+                    widget.get_selection_number() != number:
+                widget.select(number)
+                widget.update()
+                self.__model_label_map[
+                    self.__widget_model_map[widget]].select(number)
+
+        if selection != self.__selection:
+            self.__selection = selection
+            self.__selection_changed()
+
     def __add_selection(self, widget):
         if (widget not in self.__selection):
             self.__selection.append(widget)
@@ -361,6 +439,8 @@ class GraphField(QWidget):
 
             self.__model_widget_map.pop(event.node)
             self.__widget_model_map.pop(widget)
+            self.__node_branch_widgets.pop(event.node, None)
+            self.__spatial_index.remove(widget)
 
             self.__remove_label_relative(event.node)
             return
@@ -376,23 +456,32 @@ class GraphField(QWidget):
 
             self.__model_widget_map.pop(event.branch)
             self.__widget_model_map.pop(widget)
+            self.__spatial_index.remove(widget)
+            for node in self.__branch_widget_nodes.pop(widget):
+                branch_widgets = self.__node_branch_widgets.get(node, [])
+                if widget in branch_widgets:
+                    branch_widgets.remove(widget)
 
             self.__remove_label_relative(event.branch)
             return
         if isinstance(event, PositionedNodeMovedEvent):
-            # Propagate event to nodes, branches
-            for widget in self.__model_widget_map.values():
-                if isinstance(widget, NodeWidget):
-                    widget.node_moved_event(event)
-                elif isinstance(widget, BranchWidget):
-                    widget.node_moved_event(event)
+            # Propagate event to the node and its incident branches
+            widget = self.__model_widget_map.get(event.node)
+            if widget is not None:
+                widget.node_moved_event(event)
+                self.__index_widgets([widget])
+            for widget in self.__node_branch_widgets.get(event.node, ()):
+                widget.node_moved_event(event)
+            self.__index_widgets(self.__node_branch_widgets.get(event.node,
+                                                                ()))
 
             # Propagate event to active handles
             for handle in self.__handles:
                 handle.node_moved_event(event)
 
-            # Propagate event to labels
-            for label in self.__model_label_map.values():
+            # Propagate event to the label of the node
+            label = self.__model_label_map.get(event.node)
+            if label is not None:
                 label.node_moved_event(event)
             return
         if isinstance(event, CurvedBranchTransformedEvent):
@@ -400,15 +489,20 @@ class GraphField(QWidget):
             for handle in self.__handles:
                 handle.branch_transformed_event(event)
 
-            # Propagate event to branches
-            for widget in self.__model_widget_map.values():
-                if isinstance(widget, BranchWidget):
-                    widget.branch_transformed_event(event)
+            # Propagate event to the branch
+            widget = self.__model_widget_map.get(event.branch)
+            if widget is not None:
+                widget.branch_transformed_event(event)
+                self.__index_widgets([widget])
 
-            # Propagate event to labels
-            for label in self.__model_label_map.values():
+            # Propagate event to the label of the branch
+            label = self.__model_label_map.get(event.branch)
+            if label is not None:
                 label.branch_transformed_event(event)
             return
+        if isinstance(event, BatchEvent):
+            self.__handle_batch(event)
+            return
         if isinstance(event, LabelChangedTextEvent):
             logger.debug("LabelChangedTextEvent received")
             label = self.__model_label_map[event.labeled_obj]
@@ -433,10 +527,11 @@ class GraphField(QWidget):
             self.__widget_model_map.clear()
             self.__label_model_map.clear()
             self.__model_label_map.clear()
-            for node in event.nodes:
-                self.__add_node(node)
-            for branch in event.branches:
-                self.__add_branch(branch)
+            self.__node_branch_widgets.clear()
+            self.__branch_widget_nodes.clear()
+            self.__spatial_index.clear()
+            self.__view_offset.set(QPoint())
+            self.__add_graph(event.nodes, event.branches)
 
             grid_offset_ = self.__model.get_grid_position()
             self.__grid_offset = QPoint(grid_offset_[0], grid_offset_[1])
@@ -454,47 +549,129 @@ class GraphField(QWidget):
             for widget in self.__handles:
                 widget.graph_moved_event(event)
 
+            self.__index_widgets(self.__model_widget_map.values())
+
+    def __handle_batch(self, event: BatchEvent):
+        # Apply the coalesced changes, every affected widget updates its
+        # geometry once
+        node_events = [e for e in event.events
+                       if isinstance(e, PositionedNodeMovedEvent)]
+        branch_events = [e for e in event.events
+                         if isinstance(e, CurvedBranchTransformedEvent)]
+
+        # Move the nodes and collect the affected branches
+        branch_widgets = dict()
+        for node_event in node_events:
+            widget = self.__model_widget_map.get(node_event.node)
+            if widget is not None:
+                widget.node_moved_event(node_event)
+                self.__index_widgets([widget])
+            for branch_widget in self.__node_branch_widgets.get(
+                    node_event.node, ()):
+                branch_widgets[branch_widget] = None
+        for branch_event in branch_events:
+            widget = self.__model_widget_map.get(branch_event.branch)
+            if widget is not None:
+                branch_widgets[widget] = None
+
+        for widget in branch_widgets:
+            widget.batch_event(event)
+        self.__index_widgets(branch_widgets)
+
+        # Propagate events to active handles
+        for handle in self.__handles:
+            for node_event in node_events:
+                handle.node_moved_event(node_event)
+            for branch_event in branch_events:
+                handle.branch_transformed_event(branch_event)
+
+        # Reposition labels after their owners
+        for node_event in node_events:
+            label = self.__model_label_map.get(node_event.node)
+            if label is not None:
+                label.node_moved_event(node_event)
+        for branch_event in branch_events:
+            label = self.__model_label_map.get(branch_event.branch)
+            if label is not None:
+                label.branch_transformed_event(branch_event)
+
     def __add_node(self, node):
+        widget = self.__create_node_widget(node)
+        widget.show()
+        self.__initalize_label(node)
+        self.__clear_selection()
+        self.__add_selection(widget)
+
+    def __add_branch(self, branch):
+        widget = self.__create_branch_widget(branch)
+        widget.show()
+
+        # Lower branch to ensure it is behind its nodes
+        widget.lower()
+
+        # Lower grid widget to keep it behind the branches
+        self.__grid_widget.lower()
+
+        self.__initalize_label(branch)
+        self.__clear_selection()
+        self.__add_selection(widget)
+
+    def __add_graph(self, nodes, branches):
+        # Create the widgets of a whole graph with updates disabled and
+        # without selecting them, the field is repainted once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            # Widgets are stacked in order of creation, branches first to
+            # be behind the nodes and labels last to be in front
+            widgets = [self.__create_branch_widget(branch)
+                       for branch in branches]
+            widgets.extend(self.__create_node_widget(node) for node in nodes)
+            for widget in widgets:
+                widget.show()
+            self.__grid_widget.lower()
+
+            for labeled_object in branches:
+                self.__initalize_label(labeled_object)
+            for labeled_object in nodes:
+                self.__initalize_label(labeled_object)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def __create_node_widget(self, node) -> NodeWidget:
         widget = NodeWidget(node, parent=self)
         # Set initial position centered to given point
-        widget.move(QPoint(int(node.x - widget.width() / 2),
-                           int(node.y - widget.height() / 2)))
+        widget.move(self.__view_offset.to_view(
+            QPoint(int(node.x - widget.width() / 2),
+                   int(node.y - widget.height() / 2))))
         widget.observe(self.__on_node_click)
         self.__model_widget_map[node] = widget
         self.__widget_model_map[widget] = node
-        widget.show()
-        self.__initalize_label(node) ###
-        self.__clear_selection()
-        self.__add_selection(widget)
+        self.__index_widgets([widget])
+        return widget
 
-    def __add_branch(self, branch):
+    def __create_branch_widget(self, branch) -> BranchWidget:
+        # The paths of the branch, which the label is positioned on, are
+        # calculated on creation
         widget = BranchWidget(branch,
                               QPoint(int(branch.spline1_x),
                                      int(branch.spline1_y)),
                               QPoint(int(branch.spline2_x),
                                      int(branch.spline2_y)),
+                              view_offset=self.__view_offset,
                               parent=self)
 
         self.__model_widget_map[branch] = widget
         self.__widget_model_map[widget] = branch
-        widget.show()
-
-        # Lower branch to ensure it is behind its nodes
-        widget.lower()
-
-        # Lower grid widget to keep it behind the branches
-        self.__grid_widget.lower()
+        self.__index_widgets([widget])
+        self.__node_branch_widgets.setdefault(branch.start, []).append(widget)
+        if branch.end is not branch.start:
+            self.__node_branch_widgets.setdefault(branch.end,
+                                                  []).append(widget)
+        self.__branch_widget_nodes[widget] = (branch.start, branch.end)
 
         # Register click listener for widget
         widget.observe(self.__on_branch_click)
-
-        # Paint widget explicit
-        # because the label positioning needs an existing
-        # Bézier curve
-        widget.repaint()
-        self.__initalize_label(branch)
-        self.__clear_selection()
-        self.__add_selection(widget)
+        return widget
 
     def __initalize_label(self, labeled_object: LabeledObject):
         widget = self.__model_widget_map[labeled_object]
@@ -524,32 +701,8 @@ class GraphField(QWidget):
         self.__grid_widget.setVisible(not self.__grid_widget.isVisible())
 
     def copy_to_clipboard(self):
-        selection = [self.__widget_model_map[w] for w in self.__selection]
-
-        selected_nodes = []
-        selected_branches = []
-
-        # Collect nodes
-        for m in selection:
-            if isinstance(m, PositionedNode):
-                selected_nodes.append(m)
-
-        selected_node_ids = {n.id.hex for n in selected_nodes}
-
-        # Collect branches whose endpoints are fully selected
-        for m in selection:
-            if isinstance(m, CurvedBranch):
-                if m.start.id.hex in selected_node_ids and \
-                m.end.id.hex in selected_node_ids:
-                    selected_branches.append(m)
-
-        data = {
-            "nodes": [n.to_dict() for n in selected_nodes],
-            "branches": [b.to_dict() for b in selected_branches]
-        }
-
-        QApplication.clipboard().setText(json.dumps(data))
-
+        copy_to_clipboard([self.__widget_model_map[w]
+                           for w in self.__selection])
 
     def cut_to_clipboard(self):
         self.copy_to_clipboard()
@@ -557,22 +710,9 @@ class GraphField(QWidget):
         self.__controller.remove_nodes_and_branches(models)
 
     def paste_from_clipboard(self):
-        text = QApplication.clipboard().text()
-        if not text.strip():
-            return  # clipboard empty
-
-        # Parse JSON
-        try:
-            data = json.loads(text)
-        except Exception:
-            return  # invalid JSON
-
-        nodes_data = data.get("nodes", [])
-        branches_data = data.get("branches", [])
-
-        if not nodes_data:
-            return  # no nodes, nothing to paste
-
+        data = read_clipboard()
+        if data is None:
+            return
 
         # Check mouse inside GraphField
         global_pos = QtGui.QCursor.pos()
@@ -587,71 +727,14 @@ class GraphField(QWidget):
         # Snap to grid
         grid_x = int(self.__grid_size*round((mouse_x-2) / self.__grid_size))
         grid_y = int(self.__grid_size*round((mouse_y-2) / self.__grid_size))
+        grid_pos = self.__view_offset.to_model(QPoint(grid_x, grid_y))
 
-        # Compute bounding box of copied nodes
-        min_x = min(n["x"] for n in nodes_data)
-        min_y = min(n["y"] for n in nodes_data)
-
-        # Offset so min_x/min_y lands at nearest grid cell
-        dx = grid_x - min_x
-        dy = grid_y - min_y
-
-        id_map = {}
-        new_branches = []
-
-        self.__command_handler.start_script()
-        try:
-            # Paste nodes
-            for nd in nodes_data:
-                new_x = nd["x"] + dx
-                new_y = nd["y"] + dy
-
-                new_node = self.__controller.create_node(new_x, new_y)
-
-                # Restore node name if present
-                name = nd.get("name")
-                if name:
-                    self.__controller.set_node_name(new_node, name)
-
-                id_map[nd["id"]] = new_node
-
-            # Paste branches
-            for bd in branches_data:
-                sid = bd["start"]
-                eid = bd["end"]
-
-                if sid not in id_map or eid not in id_map:
-                    continue  # skip branches if nodes not pasted
-
-                start_node = id_map[sid]
-                end_node = id_map[eid]
-
-                s1x = bd.get("spline1_x", 0) + dx
-                s1y = bd.get("spline1_y", 0) + dy
-                s2x = bd.get("spline2_x", 0) + dx
-                s2y = bd.get("spline2_y", 0) + dy
-                label_dx = bd.get("label_dx", 0)
-                label_dy = bd.get("label_dy", 0)
-                weight = bd.get("weight", "")
-
-                branch = self.__controller.create_branch(
-                    start_node, end_node,
-                    s1x, s1y, s2x, s2y,
-                    label_dx, label_dy,
-                    weight
-                )
-                new_branches.append(branch)
-
-        finally:
-            self.__command_handler.end_script()
+        models = paste(self.__controller, self.__command_handler, data,
+                       grid_pos.x(), grid_pos.y())
 
         # Select pasted items
         self.__clear_selection()
-        for node in id_map.values():
-            widget = self.__model_widget_map.get(node)
+        for model in models:
+            widget = self.__model_widget_map.get(model)
             if widget:
                 self.__add_selection(widget)
-        for branch in new_branches:
-            widget = self.__model_widget_map.get(branch)
-            if widget:
-                self.__add_selection(widget)
\ No newline at end of file
@@ -0,0 +1,650 @@
+import math
+from PySide6 import QtCore, QtGui
+from PySide6.QtCore import Qt, QPoint, QPointF, QRect, QRectF, QLineF
+from PySide6.QtGui import (
+    QMouseEvent, QPainter, QPaintDevice, QPen, QWheelEvent)
+from PySide6.QtWidgets import (
+    QApplication, QFrame, QGraphicsScene, QGraphicsView, QMessageBox,
+    QRubberBand, QWidget)
+from signalflowgrapher.gui.grid import FixedGrid, NoneGrid
+from signalflowgrapher.gui.scene_items import (
+    BranchItem, LabelItem, NodeItem, SceneItem, SplineHandleItem)
+from signalflowgrapher.gui.clipboard import (
+    copy_to_clipboard, read_clipboard, paste)
+from signalflowgrapher.commands.command_handler import CommandHandler
+from signalflowgrapher.controllers.main_controller import MainController
+from signalflowgrapher.model.model import (
+    Model, BatchEvent, CurvedBranchAddedEvent, CurvedBranchRemovedEvent,
+    CurvedBranchTransformedEvent, GraphChangedEvent, GraphMovedEvent,
+    LabelChangedTextEvent, LabelMovedEvent, LabeledObject,
+    PositionedNodeAddedEvent, PositionedNodeMovedEvent,
+    PositionedNodeRemovedEvent)
+from signalflowgrapher.common.observable import ValueObservable
+import logging
+logger = logging.getLogger(__name__)
+
+# Half of the width and height of the area the view can be panned in
+VIEW_EXTENT = 1000000
+
+# Bounds of the zoom
+MIN_SCALE = 0.05
+MAX_SCALE = 4
+
+# Smallest distance of grid lines on the screen, a denser grid is hidden
+MIN_GRID_SPACING = 6
+
+
+class GraphView(QGraphicsView):
+    """
+    Graph field drawn with a QGraphicsScene instead of one widget per node,
+    branch and label, for graphs with thousands of branches. Has the same
+    interface and interaction as GraphField and can zoom with the mouse
+    wheel. Scene coordinates are model coordinates.
+    """
+
+    def __init__(self,
+                 controller: MainController,
+                 model: Model,
+                 command_handler: CommandHandler):
+        super().__init__()
+        self.__controller = controller
+        self.__model = model
+        self.__command_handler = command_handler
+
+        self.__model.observe(self.__handle_model_change)
+        self.__selection = list()
+        self.selection = ValueObservable(())
+        self.__handles = list()
+        self.__model_item_map = {}
+        self.__model_label_map = {}
+        # Branch items incident to a node
+        self.__node_branch_items = {}
+        # Nodes a branch item is registered at, the branch has no nodes
+        # anymore when its removal is notified
+        self.__branch_item_nodes = {}
+        # Press position and last position in view coordinates, item
+        # under the mouse at press
+        self.__mouse_press_pos: QPoint = None
+        self.__mouse_move_pos: QPoint = None
+        self.__press_item = None
+        # Rest of the mouse move which was not applied to the model yet
+        self.__move_rest = QPointF()
+        self.__grid_size = 30
+        self.__grid = FixedGrid(self.__grid_size)
+        self.__grid_offset = QPoint()
+        self.__grid_visible = True
+
+        # The BSP tree of the scene finds the items in a region without
+        # visiting all items, e.g. for painting and hit testing
+        self.__scene = QGraphicsScene(self)
+        self.__scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.setScene(self.__scene)
+        self.setSceneRect(-VIEW_EXTENT, -VIEW_EXTENT,
+                          2 * VIEW_EXTENT, 2 * VIEW_EXTENT)
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setRenderHint(QPainter.Antialiasing)
+        # Key events are handled by the main window
+        self.setFocusPolicy(Qt.NoFocus)
+
+        self.__rubber_band: QRubberBand = QRubberBand(
+            QRubberBand.Rectangle, self.viewport())
+
+        self.setMinimumSize(800, 600)
+        self.__scroll_to(QPointF())
+
+    def on_esc_press(self):
+        self.__clear_selection()
+
+    def on_ctrl_press(self):
+        self.__grid = NoneGrid()
+
+    def on_ctrl_release(self):
+        self.__grid = FixedGrid(self.__grid_size)
+        self.__grid.set_offset(self.__grid_offset)
+
+    def center_graph(self):
+        """Center the whole graph inside the view."""
+        if not self.__model_item_map:
+            return  # Nothing to center
+
+        self.centerOn(self.__scene.itemsBoundingRect().center())
+
+    def normalize_view(self):
+        """
+        Move the model so the top left corner of the view is the origin
+        of the model coordinates, e.g. before saving, so the saved
+        coordinates are the visible ones. The graph does not move on the
+        screen.
+        """
+        top_left = self.mapToScene(QPoint())
+        dx, dy = -round(top_left.x()), -round(top_left.y())
+        if dx == 0 and dy == 0:
+            return
+
+        self.__model.move_graph_relative(dx, dy)
+        self.__scroll_to(top_left + QPointF(dx, dy))
+
+    def __scroll_to(self, point: QPointF):
+        # Scroll so the point in scene coordinates is at the top left
+        # corner of the view
+        self.__scroll(-self.mapFromScene(point))
+
+    def __scroll(self, delta: QPoint):
+        # Move the content of the view by delta in view coordinates
+        horizontal = self.horizontalScrollBar()
+        vertical = self.verticalScrollBar()
+        horizontal.setValue(horizontal.value() - delta.x())
+        vertical.setValue(vertical.value() - delta.y())
+
+    def __selection_changed(self):
+        self.selection.set(tuple(item.owner for item in self.__selection))
+
+    def __item_at(self, pos: QPoint):
+        # Topmost node, branch, label or handle at a position of the view
+        for item in self.items(pos):
+            if isinstance(item, (SceneItem, LabelItem, SplineHandleItem)):
+                return item
+        return None
+
+    def mousePressEvent(self, event: QMouseEvent):
+        logger.debug("MousePressEvent")
+        if event.button() != Qt.LeftButton:
+            return
+
+        position = event.position().toPoint()
+        item = self.__item_at(position)
+        if isinstance(item, BranchItem):
+            # Select branch and show its handles, branches are not moved
+            self.__handle_item_release(item, event)
+            if len(self.__selection) == 1 and item in self.__selection:
+                self.__show_handles(item)
+            return
+
+        self.__mouse_press_pos = position
+        self.__mouse_move_pos = position
+        self.__press_item = item
+        self.__move_rest = QPointF()
+        self.__command_handler.start_script()
+
+        if item is not None:
+            self.__grid.start_move()
+        elif event.modifiers() == Qt.AltModifier:
+            self.__rubber_band.setGeometry(QRect(position, position))
+            self.__rubber_band.show()
+            self.__clear_selection()
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        logger.debug("MouseReleaseEvent")
+        if event.button() != Qt.LeftButton or \
+                self.__mouse_press_pos is None:
+            return
+
+        item = self.__press_item
+        press_pos = self.__mouse_press_pos
+        self.__mouse_press_pos = None
+        self.__press_item = None
+        self.__command_handler.end_script()
+        self.viewport().unsetCursor()
+
+        if self.__rubber_band.isVisible():
+            self.__rubber_band.hide()
+
+        if isinstance(item, NodeItem):
+            self.__on_node_release(item, press_pos, event)
+        elif isinstance(item, LabelItem):
+            self.__handle_item_release(
+                self.__model_item_map[item.owner], event)
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent):
+        if event.button() != Qt.LeftButton:
+            return
+
+        position = event.position().toPoint()
+        if self.__item_at(position) is not None:
+            self.mousePressEvent(event)
+            return
+
+        scene_pos = self.mapToScene(position)
+        grid_pos = self.__grid.get_grid_position(
+            QPoint(round(scene_pos.x()), round(scene_pos.y())))
+        self.__controller.create_node(grid_pos.x(), grid_pos.y())
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        if self.__mouse_press_pos is None:
+            # Let the scene update the cursor of the items
+            super().mouseMoveEvent(event)
+            return
+
+        position = event.position().toPoint()
+        item = self.__press_item
+        if item is None:
+            if self.__rubber_band.isVisible():
+                rect = QRect(self.__mouse_press_pos, position).normalized()
+                self.__rubber_band.setGeometry(rect)
+                self.__select_in(rect)
+            else:
+                self.viewport().setCursor(Qt.ClosedHandCursor)
+                self.__scroll(position - self.__mouse_move_pos)
+                self.__mouse_move_pos = position
+            return
+
+        self.viewport().setCursor(Qt.ClosedHandCursor)
+
+        # Move in model coordinates, the rest of the zoomed move is kept
+        # for the next move
+        scale = self.transform().m11()
+        diff = QPointF(position - self.__mouse_move_pos) / scale \
+            + self.__move_rest
+        self.__mouse_move_pos = position
+        dx, dy = int(diff.x()), int(diff.y())
+        self.__move_rest = diff - QPointF(dx, dy)
+        if dx == 0 and dy == 0:
+            return
+
+        if isinstance(item, NodeItem):
+            self.__move_nodes(item, dx, dy)
+        elif isinstance(item, LabelItem):
+            self.__move_label(item, dx, dy)
+        elif isinstance(item, SplineHandleItem):
+            self.__move_handle(item, dx, dy)
+
+    def wheelEvent(self, event: QWheelEvent):
+        # Zoom around the mouse position
+        factor = math.pow(1.0015, event.angleDelta().y())
+        scale = self.transform().m11()
+        factor = min(max(factor, MIN_SCALE / scale), MAX_SCALE / scale)
+        self.scale(factor, factor)
+
+    def __select_in(self, rect: QRect):
+        # The BSP tree finds the items inside the rubber band
+        items = [item for item in reversed(self.items(
+                     rect, Qt.ContainsItemBoundingRect))
+                 if isinstance(item, SceneItem)]
+        self.__set_selection(items)
+
+    def __on_node_release(self, item: NodeItem, press_pos: QPoint,
+                          event: QMouseEvent):
+        # Do not modify selection after move
+        if not press_pos == event.position().toPoint():
+            return
+
+        if event.modifiers() == Qt.ControlModifier:
+            if len(self.__selection) == 1 and \
+                    isinstance(self.__selection[0], NodeItem):
+                start = self.__selection[0].owner
+                end = item.owner
+                if start == end:
+                    self.__controller.create_self_loop(start)
+                else:
+                    self.__controller.create_branch_auto_pos(start, end)
+
+                self.__clear_selection()
+                self.__add_selection(item)
+                return
+
+        self.__handle_item_release(item, event)
+
+    def __move_nodes(self, item: NodeItem, dx: int, dy: int):
+        if item not in self.__selection:
+            self.__clear_selection()
+            self.__add_selection(item)
+
+        grid_move = self.__grid.relative_move(dx, dy, item)
+        if grid_move.x() == 0 and grid_move.y() == 0:
+            return
+
+        # Move all selected nodes with one update of the items
+        self.__model.begin_batch()
+        try:
+            for selected in self.__selection:
+                if isinstance(selected, NodeItem):
+                    self.__controller.move_node(selected.owner,
+                                                grid_move.x(),
+                                                grid_move.y())
+        finally:
+            self.__model.end_batch()
+
+    def __move_label(self, label: LabelItem, dx: int, dy: int):
+        grid_move = self.__grid.relative_move(dx, dy, label)
+        self.__controller.move_label_relative(label.owner,
+                                              grid_move.x(),
+                                              grid_move.y())
+        item = self.__model_item_map[label.owner]
+        if item not in self.__selection:
+            self.__clear_selection()
+            self.__add_selection(item)
+
+    def __move_handle(self, handle: SplineHandleItem, dx: int, dy: int):
+        dx1, dy1, dx2, dy2 = 0, 0, 0, 0
+        grid_move = self.__grid.relative_move(dx, dy, handle)
+        if handle.first:
+            dx1, dy1 = grid_move.x(), grid_move.y()
+        else:
+            dx2, dy2 = grid_move.x(), grid_move.y()
+        self.__controller.transform_branch(
+            handle.get_branch(), -dx1, -dy1, -dx2, -dy2)
+
+    def __handle_item_release(self,
+                              item: SceneItem,
+                              mouse_event: QMouseEvent):
+        if not mouse_event.modifiers() == Qt.ShiftModifier:
+            self.__clear_selection()
+
+        # Clear visible handles
+        self.__clear_handles()
+
+        if item in self.__selection:
+            self.__remove_selection(item)
+        else:
+            self.__add_selection(item)
+
+    def __show_handles(self, item: BranchItem):
+        for first in (True, False):
+            handle = SplineHandleItem(item.owner, first)
+            self.__scene.addItem(handle)
+            self.__handles.append(handle)
+
+    def get_selection(self):
+        return self.__selection.copy()
+
+    def select_all(self):
+        self.__clear_handles()
+        self.__set_selection(list(self.__model_item_map.values()))
+
+    def __clear_handles(self):
+        # Remove all handles for next selection
+        for handle in self.__handles:
+            self.__scene.removeItem(handle)
+        self.__handles.clear()
+
+    def __clear_selection(self):
+        self.__clear_handles()
+
+        for item in self.__selection:
+            item.unselect()
+            self.__model_label_map[item.owner].unselect()
+
+        self.__selection.clear()
+        self.__selection_changed()
+
+    def __set_selection(self, items):
+        # Replace the selection, selected items keep their order, with a
+        # single notification
+        new_items = set(items)
+        old_items = set(self.__selection)
+        for item in self.__selection:
+            if item not in new_items:
+                item.unselect()
+                self.__model_label_map[item.owner].unselect()
+
+        selection = [item for item in self.__selection if item in new_items]
+        selection.extend(item for item in items if item not in old_items)
+        for number, item in enumerate(selection, 1):
+            if not item.selected or item.get_selection_number() != number:
+                item.select(number)
+                self.__model_label_map[item.owner].select(number)
+
+        if selection != self.__selection:
+            self.__selection = selection
+            self.__selection_changed()
+
+    def __add_selection(self, item: SceneItem):
+        if (item not in self.__selection):
+            self.__selection.append(item)
+            item.select(len(self.__selection))
+            self.__model_label_map[item.owner].select(len(self.__selection))
+            self.__selection_changed()
+
+    def __remove_selection(self, item: SceneItem):
+        if item in self.__selection:
+            remove_selection_number = item.get_selection_number()
+            self.__selection.remove(item)
+            item.unselect()
+            self.__model_label_map[item.owner].unselect()
+
+            # Adjust selection index for other items
+            for sel in self.__selection:
+                if sel.get_selection_number() > remove_selection_number:
+                    sel.select(sel.get_selection_number() - 1)
+                    self.__model_label_map[sel.owner].select(
+                        sel.get_selection_number())
+
+            self.__selection_changed()
+
+    def __handle_model_change(self, event):
+        if isinstance(event, PositionedNodeAddedEvent):
+            logger.debug("PositionedNodeAddedEvent received")
+            item = self.__add_node(event.node)
+            self.__clear_selection()
+            self.__add_selection(item)
+            return
+        if isinstance(event, PositionedNodeRemovedEvent):
+            logger.debug("PositionedNodeRemovedEvent received")
+            self.__clear_selection()
+            self.__scene.removeItem(self.__model_item_map.pop(event.node))
+            self.__node_branch_items.pop(event.node, None)
+            self.__remove_label(event.node)
+            return
+        if isinstance(event, CurvedBranchAddedEvent):
+            logger.debug("CurvedBranchAddedEvent received")
+            item = self.__add_branch(event.branch)
+            self.__clear_selection()
+            self.__add_selection(item)
+            return
+        if isinstance(event, CurvedBranchRemovedEvent):
+            logger.debug("CurvedBranchRemovedEvent received")
+            self.__clear_selection()
+            item = self.__model_item_map.pop(event.branch)
+            self.__scene.removeItem(item)
+            for node in self.__branch_item_nodes.pop(item):
+                branch_items = self.__node_branch_items.get(node, [])
+                if item in branch_items:
+                    branch_items.remove(item)
+            self.__remove_label(event.branch)
+            return
+        if isinstance(event, PositionedNodeMovedEvent):
+            self.__update_items([event.node], [])
+            return
+        if isinstance(event, CurvedBranchTransformedEvent):
+            self.__update_items([], [event.branch])
+            return
+        if isinstance(event, BatchEvent):
+            self.__update_items(
+                [e.node for e in event.events
+                 if isinstance(e, PositionedNodeMovedEvent)],
+                [e.branch for e in event.events
+                 if isinstance(e, CurvedBranchTransformedEvent)])
+            return
+        if isinstance(event, LabelChangedTextEvent):
+            logger.debug("LabelChangedTextEvent received")
+            self.__model_label_map[event.labeled_obj].set_text(
+                event.new_text)
+            return
+        if isinstance(event, LabelMovedEvent):
+            self.__model_label_map[event.labeled_obj].reposition()
+            return
+        if isinstance(event, GraphChangedEvent):
+            logger.debug("GraphChangedEvent received")
+            self.__clear_selection()
+            self.__scene.clear()
+            self.__model_item_map.clear()
+            self.__model_label_map.clear()
+            self.__node_branch_items.clear()
+            self.__branch_item_nodes.clear()
+            for node in event.nodes:
+                self.__add_node(node)
+            for branch in event.branches:
+                self.__add_branch(branch)
+
+            self.resetTransform()
+            self.__scroll_to(QPointF())
+            self.__update_grid_offset()
+            return
+        if isinstance(event, GraphMovedEvent):
+            for item in self.__model_item_map.values():
+                if isinstance(item, NodeItem):
+                    item.update_position()
+                else:
+                    item.update_geometry()
+            for label in self.__model_label_map.values():
+                label.reposition()
+            for handle in self.__handles:
+                handle.update_geometry()
+            self.__update_grid_offset()
+
+    def __update_items(self, nodes, branches):
+        # Update the items of moved nodes and transformed branches, every
+        # affected branch is updated once
+        branch_items = dict()
+        for node in nodes:
+            item = self.__model_item_map.get(node)
+            if item is not None:
+                item.update_position()
+            for branch_item in self.__node_branch_items.get(node, ()):
+                branch_items[branch_item] = None
+        for branch in branches:
+            item = self.__model_item_map.get(branch)
+            if item is not None:
+                branch_items[item] = None
+
+        for item in branch_items:
+            item.update_geometry()
+
+        for handle in self.__handles:
+            handle.update_geometry()
+
+        # Reposition labels after their owners
+        for node in nodes:
+            label = self.__model_label_map.get(node)
+            if label is not None:
+                label.reposition()
+        for item in branch_items:
+            self.__model_label_map[item.owner].reposition()
+
+    def __add_node(self, node) -> NodeItem:
+        item = NodeItem(node)
+        self.__scene.addItem(item)
+        self.__model_item_map[node] = item
+        self.__add_label(node)
+        return item
+
+    def __add_branch(self, branch) -> BranchItem:
+        item = BranchItem(branch)
+        self.__scene.addItem(item)
+        self.__model_item_map[branch] = item
+        self.__node_branch_items.setdefault(branch.start, []).append(item)
+        if branch.end is not branch.start:
+            self.__node_branch_items.setdefault(branch.end, []).append(item)
+        self.__branch_item_nodes[item] = (branch.start, branch.end)
+        self.__add_label(branch)
+        return item
+
+    def __add_label(self, labeled_object: LabeledObject):
+        label = LabelItem(labeled_object,
+                          self.__model_item_map[labeled_object])
+        self.__scene.addItem(label)
+        self.__model_label_map[labeled_object] = label
+
+    def __remove_label(self, labeled_object: LabeledObject):
+        self.__scene.removeItem(self.__model_label_map.pop(labeled_object))
+
+    def __update_grid_offset(self):
+        grid_offset_ = self.__model.get_grid_position()
+        self.__grid_offset = QPoint(grid_offset_[0], grid_offset_[1])
+        self.__grid.set_offset(self.__grid_offset)
+        self.resetCachedContent()
+        self.viewport().update()
+
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        painter.fillRect(rect, self.palette().window())
+        size = self.__grid_size
+        if not self.__grid_visible or \
+                size * self.transform().m11() < MIN_GRID_SPACING:
+            return
+
+        scheme = QApplication.instance().styleHints().colorScheme()
+        if scheme == Qt.ColorScheme.Dark:
+            color = '#444444'
+        else:
+            color = '#cccccc'
+        pen = QPen(QtGui.QColor(color))
+        pen.setWidth(0)
+        painter.setPen(pen)
+
+        # Grid lines inside the exposed rect, the grid is fixed to the
+        # model coordinates
+        offset_x = self.__grid_offset.x() % size
+        offset_y = self.__grid_offset.y() % size
+        left = math.floor((rect.left() - offset_x) / size) * size + offset_x
+        top = math.floor((rect.top() - offset_y) / size) * size + offset_y
+        lines = []
+        x = left
+        while x < rect.right():
+            lines.append(QLineF(x, rect.top(), x, rect.bottom()))
+            x += size
+        y = top
+        while y < rect.bottom():
+            lines.append(QLineF(rect.left(), y, rect.right(), y))
+            y += size
+        painter.drawLines(lines)
+
+    def changeEvent(self, event: QtCore.QEvent):
+        # Cached pixmaps are painted with the old palette
+        if event.type() in (QtCore.QEvent.PaletteChange,
+                            QtCore.QEvent.ApplicationPaletteChange):
+            self.resetCachedContent()
+            for item in self.__scene.items():
+                item.update()
+        super().changeEvent(event)
+
+    def render(self, target, *args, **kwargs):
+        # Render to a paint device like GraphField, e.g. to save a PNG
+        if isinstance(target, QPaintDevice):
+            return QWidget.render(self, target, *args, **kwargs)
+        return super().render(target, *args, **kwargs)
+
+    def toggle_grid_visibility(self):
+        self.__grid_visible = not self.__grid_visible
+        self.resetCachedContent()
+        self.viewport().update()
+
+    def copy_to_clipboard(self):
+        copy_to_clipboard([item.owner for item in self.__selection])
+
+    def cut_to_clipboard(self):
+        self.copy_to_clipboard()
+        models = [item.owner for item in self.__selection]
+        self.__controller.remove_nodes_and_branches(models)
+
+    def paste_from_clipboard(self):
+        data = read_clipboard()
+        if data is None:
+            return
+
+        # Check mouse inside the view
+        local_pos = self.viewport().mapFromGlobal(QtGui.QCursor.pos())
+        if not self.viewport().rect().contains(local_pos):
+            QMessageBox.warning(self, "Paste error",
+                                "Mouse pointer is outside the graph area.")
+            return
+
+        # Snap to grid
+        scene_pos = self.mapToScene(local_pos)
+        grid = FixedGrid(self.__grid_size)
+        grid.set_offset(self.__grid_offset)
+        grid_pos = grid.get_grid_position(
+            QPoint(round(scene_pos.x()), round(scene_pos.y())))
+
+        models = paste(self.__controller, self.__command_handler, data,
+                       grid_pos.x(), grid_pos.y())
+
+        # Select pasted items
+        self.__set_selection([self.__model_item_map[model]
+                              for model in models
+                              if model in self.__model_item_map])
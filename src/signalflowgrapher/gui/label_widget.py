@@ -1,3 +1,4 @@
+from functools import lru_cache
 from importlib import resources
 from PySide6.QtWidgets import QLabel
 from PySide6.QtGui import QFont, QFontDatabase, QCursor, QPalette
@@ -14,9 +15,30 @@ from signalflowgrapher.gui.graph_item import (
     WidgetPressEvent, WidgetMoveEvent, WidgetReleaseEvent
 )
 
-# Load font using importlib.resources
-with resources.path("signalflowgrapher.resources", "HeptaSlab-Regular.ttf") as font_path:
-    roman_font = str(font_path)
+
+# Point size of the label font
+LABEL_FONT_SIZE = 13
+
+
+def _roman_font_path() -> str:
+    # Resolve the font file on first use instead of at import time
+    with resources.path("signalflowgrapher.resources",
+                        "HeptaSlab-Regular.ttf") as font_path:
+        return str(font_path)
+
+
+@lru_cache(maxsize=None)
+def label_font() -> QFont:
+    """
+    Font of all labels. The font file is registered at the application
+    font database once per process and the resulting font is shared by
+    all labels. Raises IOError if the font can not be loaded.
+    """
+    font_id = QFontDatabase.addApplicationFont(_roman_font_path())
+    if (font_id == -1):
+        raise IOError("Font could not be loaded")
+    font_name = QFontDatabase.applicationFontFamilies(font_id)[0]
+    return QFont(font_name, LABEL_FONT_SIZE)
 
 
 class LabelWidget(QLabel, ObjectObservable):
@@ -40,13 +62,7 @@ class LabelWidget(QLabel, ObjectObservable):
         self.__owner = owner
         self.__owner_widget = owner_widget
 
-        font_database = QFontDatabase()
-        font_id = font_database.addApplicationFont(roman_font)
-        if (font_id == -1):
-            raise IOError("Font could not be loaded")
-        font_name = QFontDatabase.applicationFontFamilies(font_id)[0]
-        font = QFont(font_name, 13)
-        self.setFont(font)
+        self.setFont(label_font())
         self.adjustSize()
         self.__reposition()
 
@@ -122,6 +122,7 @@ class MainWindow(QMainWindow):
             self.__save_as()
         else:
             try:
+                self.__graph_field.normalize_view()
                 self.__io_controller.save_graph(self.__file_path)
             except Exception:
                 logger.exception("Exception while saving to path: %s",
@@ -139,10 +140,11 @@ class MainWindow(QMainWindow):
             self,
             QCoreApplication.translate("main_window",
                                        "Save Signal-flow Graph"),
-            filter="SFG (*.sfg);;JSON (*.json)")
+            filter="SFG (*.sfg);;JSON (*.json);;Compact SFG (*.sfgc)")
 
         if result[0]:
             try:
+                self.__graph_field.normalize_view()
                 self.__io_controller.save_graph(result[0])
                 self.__file_path = result[0]
                 self.__set_title()
@@ -181,8 +183,8 @@ class MainWindow(QMainWindow):
             self,
             QCoreApplication.translate("main_window",
                                        "Open Signal-flow Graph"),
-            filter=("SFG / JSON (*.json *.sfg);;"
-                    "JSON (*.json);;SFG (*.sfg)"))
+            filter=("SFG / JSON (*.json *.sfg *.sfgc);;"
+                    "JSON (*.json);;SFG (*.sfg);;Compact SFG (*.sfgc)"))
 
         if result[0]:
             self.load_file(result[0])
@@ -0,0 +1,361 @@
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import (
+    QBrush, QCursor, QPainter, QPainterPath, QPainterPathStroker, QPen,
+    QPalette)
+from PySide6.QtWidgets import (
+    QGraphicsItem, QGraphicsSimpleTextItem, QStyleOptionGraphicsItem)
+from signalflowgrapher.gui.geometry import (
+    arrow_path, bezier_middle, bezier_middle_angle)
+from signalflowgrapher.gui.label_widget import label_font
+from signalflowgrapher.model.model import (
+    CurvedBranch, LabeledObject, PositionedNode)
+
+# Level of detail (scale of the view) below which arrows, labels and
+# selection numbers are not drawn
+DETAIL_LEVEL = 0.5
+
+# Stacking order of the items
+BRANCH_Z = 0
+NODE_Z = 1
+LABEL_Z = 2
+HANDLE_Z = 3
+
+
+def level_of_detail(painter: QPainter) -> float:
+    """
+    Get the level of detail (scale) an item is painted with.
+    """
+    return QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+        painter.worldTransform())
+
+
+class SceneItem(QGraphicsItem):
+    """
+    Item of a node or branch on the graph view, the counterpart of
+    GraphItem. Scene coordinates are model coordinates.
+    """
+
+    def __init__(self, owner: LabeledObject, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._owner = owner
+        self._selected = False
+        self._selection_number = 0
+        self.setCursor(QCursor(Qt.PointingHandCursor))
+        # Painted once to a pixmap, which is reused while only the
+        # position of the item changes
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    @property
+    def owner(self) -> LabeledObject:
+        return self._owner
+
+    @property
+    def selected(self):
+        return self._selected
+
+    def get_selection_number(self):
+        return self._selection_number
+
+    def select(self, number):
+        self._selected = True
+        self._selection_number = number
+        self.update()
+
+    def unselect(self):
+        self._selected = False
+        self.update()
+
+    def get_center(self) -> QPointF:
+        return self.pos()
+
+    def _color(self):
+        palette = self.scene().palette()
+        if self.selected:
+            return palette.highlight().color()
+        return palette.text().color()
+
+
+class NodeItem(SceneItem):
+    def __init__(self, owner: PositionedNode, *args, **kwargs):
+        super().__init__(owner, *args, **kwargs)
+        self.__radius = 8
+        self.__circle_width = 3
+        size = self.__radius * 2 + self.__circle_width * 2
+        self.__bounds = QRectF(-size / 2, -size / 2, size, size)
+        self.setZValue(NODE_Z)
+        self.update_position()
+
+    def update_position(self):
+        """
+        Move the item to the position of its node.
+        """
+        self.setPos(self._owner.x, self._owner.y)
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(self.__bounds)
+
+    def shape(self) -> QPainterPath:
+        path = QPainterPath()
+        path.addEllipse(self.__bounds)
+        return path
+
+    def paint(self, painter: QPainter, option, widget=None):
+        color = self._color()
+        if level_of_detail(painter) < DETAIL_LEVEL:
+            # Filled circle only
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawEllipse(self.__bounds)
+            return
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        pen = QPen(color)
+        pen.setWidth(self.__circle_width)
+        painter.setPen(pen)
+        painter.setBrush(self.scene().palette().window())
+        painter.drawEllipse(QPointF(), self.__radius, self.__radius)
+
+        if self.selected:
+            painter.drawText(self.__bounds, Qt.AlignCenter,
+                             str(self.get_selection_number()))
+
+
+class BranchItem(SceneItem):
+    def __init__(self, owner: CurvedBranch, *args, **kwargs):
+        super().__init__(owner, *args, **kwargs)
+        self.__pen_width = 3
+        # Arrow dimensions, see BranchWidget
+        self.__arrow_height = 9
+        self.__arrow_length = 27
+        self.__arrow_side_spline_depth = 2
+        self.__arrow_back_spline_depth = 5.5
+        # Width of the stroke along the branch that reacts to the mouse
+        self.__hit_width = 8
+        # Paths are relative to the start node. If only the position of the
+        # branch changes, the paths and the cached pixmap are reused and
+        # the item is moved.
+        self.__shape = None
+        self.__branch = QPainterPath()
+        self.__arrow = QPainterPath()
+        self.__hit_shape = QPainterPath()
+        self.__middle = QPointF()
+        self.__bounds = QRectF()
+        self.setZValue(BRANCH_Z)
+        self.update_geometry()
+
+    def update_geometry(self):
+        """
+        Update the paths and the position from the branch.
+        """
+        owner = self._owner
+        start = QPointF(owner.start.x, owner.start.y)
+        shape = (owner.end.x - start.x(), owner.end.y - start.y(),
+                 owner.spline1_x - start.x(), owner.spline1_y - start.y(),
+                 owner.spline2_x - start.x(), owner.spline2_y - start.y())
+
+        if shape != self.__shape:
+            self.prepareGeometryChange()
+            branch = QPainterPath()
+            branch.moveTo(QPointF())
+            branch.cubicTo(QPointF(shape[2], shape[3]),
+                           QPointF(shape[4], shape[5]),
+                           QPointF(shape[0], shape[1]))
+
+            self.__middle = bezier_middle(branch)
+            self.__arrow = arrow_path(
+                self.__middle,
+                bezier_middle_angle(branch),
+                self.__arrow_height,
+                self.__arrow_length,
+                self.__arrow_side_spline_depth,
+                self.__arrow_back_spline_depth)
+
+            stroker = QPainterPathStroker()
+            stroker.setWidth(self.__hit_width)
+            self.__hit_shape = stroker.createStroke(branch).united(
+                self.__arrow)
+
+            margin = self.__hit_width / 2
+            self.__bounds = branch.boundingRect().united(
+                self.__arrow.boundingRect()).adjusted(
+                    -margin, -margin, margin, margin)
+            self.__branch = branch
+            self.__shape = shape
+            self.update()
+
+        self.setPos(start)
+
+    def get_center(self) -> QPointF:
+        """
+        Get the middle of the branch.
+        """
+        return self.pos() + self.__middle
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(self.__bounds)
+
+    def shape(self) -> QPainterPath:
+        return self.__hit_shape
+
+    def paint(self, painter: QPainter, option, widget=None):
+        color = self._color()
+        painter.setRenderHint(QPainter.Antialiasing)
+        pen = QPen(color)
+        pen.setWidth(self.__pen_width)
+        painter.setPen(pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(self.__branch)
+
+        if level_of_detail(painter) < DETAIL_LEVEL:
+            return
+
+        pen.setWidth(1)
+        painter.setPen(pen)
+        painter.setBrush(color)
+        painter.drawPath(self.__arrow)
+
+
+class LabelItem(QGraphicsSimpleTextItem):
+    """
+    Label of a node or branch, placed relative to the center of the item
+    of its owner.
+    """
+
+    def __init__(self, owner: LabeledObject, owner_item: SceneItem,
+                 *args, **kwargs):
+        super().__init__(owner.label_text, *args, **kwargs)
+        self.__owner = owner
+        self.__owner_item = owner_item
+        self._selected = False
+        self._selection_number = 0
+        self.setFont(label_font())
+        self.setCursor(QCursor(Qt.PointingHandCursor))
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.setZValue(LABEL_Z)
+        self.reposition()
+
+    @property
+    def owner(self) -> LabeledObject:
+        return self.__owner
+
+    @property
+    def selected(self):
+        return self._selected
+
+    def get_selection_number(self):
+        return self._selection_number
+
+    def select(self, number):
+        self._selected = True
+        self._selection_number = number
+        self.update()
+
+    def unselect(self):
+        self._selected = False
+        self.update()
+
+    def get_center(self) -> QPointF:
+        return self.pos() + self.boundingRect().center()
+
+    def set_text(self, text: str):
+        self.setText(text)
+        self.reposition()
+
+    def reposition(self):
+        """
+        Reposition based on own size and the center of the owner item.
+        """
+        center = self.__owner_item.get_center()
+        rect = self.boundingRect()
+        self.setPos(center.x() + self.__owner.label_dx - rect.width() / 2,
+                    center.y() + self.__owner.label_dy - rect.height() / 2)
+
+    def paint(self, painter: QPainter, option, widget=None):
+        if level_of_detail(painter) < DETAIL_LEVEL:
+            return
+
+        palette = self.scene().palette()
+        if self.selected:
+            color = palette.color(QPalette.Highlight)
+        else:
+            color = palette.color(QPalette.WindowText)
+
+        painter.setFont(self.font())
+        painter.setPen(color)
+        painter.drawText(self.boundingRect(), Qt.AlignLeft | Qt.AlignTop,
+                         self.text())
+
+
+class SplineHandleItem(QGraphicsItem):
+    """
+    Handle to bend a branch, placed opposite of the spline point of the
+    branch relative to the start (first handle) or end node.
+    """
+
+    def __init__(self, branch: CurvedBranch, first: bool, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__branch = branch
+        self.__first = first
+        self.__radius = 5
+        self.__circle_width = 2
+        # Position of the node relative to the handle
+        self.__origin = QPointF()
+        self.setCursor(QCursor(Qt.PointingHandCursor))
+        self.setZValue(HANDLE_Z)
+        self.update_geometry()
+
+    @property
+    def first(self) -> bool:
+        return self.__first
+
+    def get_branch(self) -> CurvedBranch:
+        return self.__branch
+
+    def get_node(self) -> PositionedNode:
+        if self.__first:
+            return self.__branch.start
+        return self.__branch.end
+
+    def get_center(self) -> QPointF:
+        return self.pos()
+
+    def update_geometry(self):
+        """
+        Update the position from the node and the spline of the branch.
+        """
+        node = self.get_node()
+        if self.__first:
+            spline = QPointF(self.__branch.spline1_x, self.__branch.spline1_y)
+        else:
+            spline = QPointF(self.__branch.spline2_x, self.__branch.spline2_y)
+        origin = QPointF(node.x, node.y)
+        handle = origin * 2 - spline
+
+        self.prepareGeometryChange()
+        self.__origin = origin - handle
+        self.setPos(handle)
+
+    def boundingRect(self) -> QRectF:
+        size = self.__radius + self.__circle_width
+        return QRectF(QPointF(), self.__origin).normalized().united(
+            QRectF(-size, -size, 2 * size, 2 * size))
+
+    def shape(self) -> QPainterPath:
+        size = self.__radius + self.__circle_width
+        path = QPainterPath()
+        path.addEllipse(QPointF(), size, size)
+        return path
+
+    def paint(self, painter: QPainter, option, widget=None):
+        palette = self.scene().palette()
+        pen = QPen(palette.text().color())
+        pen.setWidth(self.__circle_width)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(pen)
+
+        # Paint line to origin
+        painter.drawLine(QPointF(), self.__origin)
+
+        # Paint circle
+        painter.setBrush(QBrush(palette.window()))
+        painter.drawEllipse(QPointF(), self.__radius, self.__radius)
@@ -9,7 +9,6 @@ from PySide6.QtGui import QValidator, QKeyEvent, QPalette
 
 from signalflowgrapher.gui.sympy_expression_validator import (
     SympyExpressionValidator)
-from signalflowgrapher.gui.mason_window import MasonWindow
 from signalflowgrapher.gui.graph_field import GraphField
 from signalflowgrapher.model.model import (
     Model, CurvedBranch, LabelChangedTextEvent, PositionedNode)
@@ -297,7 +296,9 @@ class SideWidget(QWidget):
             msg.exec_()
             return
 
-        # Pass content and open window
+        # Pass content and open window, the window (and SymPy printing)
+        # is imported on first use to keep the application startup fast
+        from signalflowgrapher.gui.mason_window import MasonWindow
         window = MasonWindow()
         window.set_content(mason_result)
         window.exec()  # Wait until window is closed
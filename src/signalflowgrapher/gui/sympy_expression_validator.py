@@ -1,7 +1,6 @@
 from PySide6.QtGui import QValidator
 from PySide6.QtCore import Signal
-from sympy.parsing.sympy_parser import parse_expr, TokenError
-from sympy.abc import _clash
+from signalflowgrapher.common.utils import parse_expression
 
 
 class SympyExpressionValidator(QValidator):
@@ -14,11 +13,13 @@ class SympyExpressionValidator(QValidator):
         """
         Validate SymPyExpression and emit validation changed signal.
         """
+        from sympy.parsing.sympy_parser import TokenError
+
         state = QValidator.Intermediate
 
         try:
             if s != "":
-                parse_expr(s, local_dict=_clash)
+                parse_expression(s)
                 # If no exception occurs the expression is valid
                 state = QValidator.Acceptable
         except (TokenError, SyntaxError, AttributeError, TypeError):
@@ -0,0 +1,295 @@
+from array import array
+from typing import Dict, List, Tuple
+import json
+import logging
+import mmap
+import struct
+import sys
+import uuid
+import zlib
+from signalflowgrapher.common.json_dict import JSONDict
+logger = logging.getLogger(__name__)
+
+# Extension of graph files in the columnar format
+COLUMNAR_FILE_EXTENSION = ".sfgc"
+
+# File starts with magic, format version and size of the header, the
+# header is json and describes the compressed columns that follow it
+MAGIC = b"SFGC"
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct("<4sHI")
+
+# Numeric fields of nodes and branches, stored as float64 columns with a
+# bit per field that marks integers to write them back as in json. The
+# fields are in the order of the json graph file.
+NODE_NUMBERS = ("label_dx", "label_dy", "x", "y")
+BRANCH_NUMBERS = ("label_dx", "label_dy", "spline1_x", "spline1_y",
+                  "spline2_x", "spline2_y")
+
+# Largest integer a float64 column holds exactly
+MAX_EXACT_INTEGER = 2 ** 53
+
+ID_SIZE = 16
+
+
+def is_columnar_file(path: str) -> bool:
+    """
+    Check if the file at path is a columnar graph file by its extension.
+    """
+    return path.lower().endswith(COLUMNAR_FILE_EXTENSION)
+
+
+class ColumnarExport(object):
+    """
+    ColumnarExport allows to write a graph to a compact file. Nodes and
+    branches are stored as struct of arrays: ids, numbers and node
+    indices in typed columns and names and weights in a string table,
+    every column compressed.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+    def write_as_columnar(self, data: JSONDict, grid_pos, path: str):
+        """
+        Write data to file at path.
+        """
+        data_dict = data.to_dict()
+        data_dict["grid_pos"] = grid_pos
+        data_dict["version"] = "2.0"
+        self.write_dict(data_dict, path)
+
+    def write_dict(self, data: Dict, path: str):
+        """
+        Write graph dict as read from a json graph file to file at path.
+        Raises ValueError if a branch references an unknown node or a
+        number can not be stored.
+        """
+        logger.info("Write columnar graph to file %s", path)
+        nodes = data["nodes"]
+        branches = data["branches"]
+        strings = _StringTable()
+
+        node_index = dict()
+        node_ids = bytearray()
+        for index, node in enumerate(nodes):
+            node_id = uuid.UUID(node["id"])
+            node_index[node_id.hex] = index
+            node_ids += node_id.bytes
+        node_numbers, node_integers = _numbers(nodes, NODE_NUMBERS)
+
+        branch_ids = bytearray()
+        starts = array('q')
+        ends = array('q')
+        try:
+            for branch in branches:
+                branch_ids += uuid.UUID(branch["id"]).bytes
+                starts.append(node_index[uuid.UUID(branch["start"]).hex])
+                ends.append(node_index[uuid.UUID(branch["end"]).hex])
+        except KeyError as e:
+            raise ValueError("Branch references unknown node %s" % e)
+        branch_numbers, branch_integers = _numbers(branches, BRANCH_NUMBERS)
+
+        columns = [("node_id", array('B', node_ids)),
+                   ("node_name", strings.indices(
+                       node["name"] for node in nodes)),
+                   ("node_integers", node_integers),
+                   ("branch_id", array('B', branch_ids)),
+                   ("branch_weight", strings.indices(
+                       branch["weight"] for branch in branches)),
+                   ("branch_start", starts),
+                   ("branch_end", ends),
+                   ("branch_integers", branch_integers)]
+        columns.extend(("node_" + name, column)
+                       for name, column in zip(NODE_NUMBERS, node_numbers))
+        columns.extend(("branch_" + name, column)
+                       for name, column in zip(BRANCH_NUMBERS,
+                                               branch_numbers))
+        columns.extend(strings.columns())
+
+        # Everything else, like grid position and version, is kept as is
+        header = {"node_count": len(nodes),
+                  "branch_count": len(branches),
+                  "properties": {key: value for key, value in data.items()
+                                 if key not in ("nodes", "branches")},
+                  "columns": dict()}
+        payload = list()
+        offset = 0
+        for name, column in columns:
+            compressed = zlib.compress(_to_little_endian(column))
+            header["columns"][name] = [column.typecode, offset,
+                                       len(compressed)]
+            payload.append(compressed)
+            offset += len(compressed)
+
+        header_data = json.dumps(header).encode("utf8")
+        try:
+            with open(path, "wb") as f:
+                f.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION,
+                                      len(header_data)))
+                f.write(header_data)
+                for compressed in payload:
+                    f.write(compressed)
+        except IOError as e:
+            logger.error("IO error while writing to file %s: %s",
+                         path,
+                         str(e))
+            raise
+
+
+class ColumnarImport(object):
+    """
+    ColumnarImport allows to read a graph from a compact file. The file is
+    memory mapped, only the decompressed columns are held in memory.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+    def read_from_columnar(self, path: str) -> Dict:
+        """
+        Read graph dict from file at path, the same dict as read from the
+        json graph file. Raises ValueError if the file is invalid.
+        """
+        logger.info("Read columnar graph from file %s", path)
+        try:
+            with open(path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                with memoryview(data) as view:
+                    header, columns = self.__read_columns(view)
+            return self.__to_dict(header, columns)
+        except IOError as e:
+            logger.error("IO error while reading from file %s: %s",
+                         path,
+                         str(e))
+            raise
+        except (ValueError, KeyError, IndexError, TypeError, struct.error,
+                zlib.error) as e:
+            logger.error("File %s is no valid columnar graph: %s",
+                         path,
+                         str(e))
+            raise ValueError("Invalid columnar graph file %s" % path)
+
+    def __read_columns(self, view: memoryview) -> Tuple[Dict, Dict]:
+        magic, format_version, header_size = PREAMBLE.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError("Unknown file type")
+        if format_version != FORMAT_VERSION:
+            raise ValueError("Unsupported format version %s"
+                             % format_version)
+
+        start = PREAMBLE.size + header_size
+        header = json.loads(bytes(view[PREAMBLE.size:start]))
+        columns = dict()
+        for name, (typecode, offset, size) in header["columns"].items():
+            if start + offset + size > len(view):
+                raise ValueError("Column %s exceeds file" % name)
+            column = array(typecode)
+            column.frombytes(zlib.decompress(
+                view[start + offset:start + offset + size]))
+            if sys.byteorder == "big":
+                column.byteswap()
+            columns[name] = column
+        return header, columns
+
+    def __to_dict(self, header: Dict, columns: Dict) -> Dict:
+        node_count = header["node_count"]
+        branch_count = header["branch_count"]
+        strings = _StringTable.read(columns["strings"],
+                                    columns["string_offsets"])
+        lengths = [len(columns["node_id"]), len(columns["branch_id"])]
+        if lengths != [ID_SIZE * node_count, ID_SIZE * branch_count]:
+            raise ValueError("Invalid columnar graph, wrong column sizes")
+
+        node_ids = bytes(columns["node_id"])
+        node_names = columns["node_name"]
+        node_numbers = _from_numbers(
+            [columns["node_" + name] for name in NODE_NUMBERS],
+            columns["node_integers"])
+        node_hexes = [node_ids[i * ID_SIZE:(i + 1) * ID_SIZE].hex()
+                      for i in range(node_count)]
+        nodes = [{"id": node_hexes[i],
+                  "label_dx": label_dx,
+                  "label_dy": label_dy,
+                  "name": strings[node_names[i]],
+                  "x": x,
+                  "y": y}
+                 for i, (label_dx, label_dy, x, y) in enumerate(node_numbers)]
+
+        branch_ids = bytes(columns["branch_id"])
+        weights = columns["branch_weight"]
+        starts = columns["branch_start"]
+        ends = columns["branch_end"]
+        branch_numbers = _from_numbers(
+            [columns["branch_" + name] for name in BRANCH_NUMBERS],
+            columns["branch_integers"])
+        branches = [{"id": branch_ids[i * ID_SIZE:(i + 1) * ID_SIZE].hex(),
+                     "weight": strings[weights[i]],
+                     "start": node_hexes[starts[i]],
+                     "end": node_hexes[ends[i]],
+                     **dict(zip(BRANCH_NUMBERS, branch_numbers[i]))}
+                    for i in range(branch_count)]
+
+        return {"nodes": nodes, "branches": branches,
+                **header["properties"]}
+
+
+class _StringTable(object):
+    # Unique strings, stored as utf-8 data with the offsets of the strings
+
+    def __init__(self):
+        super().__init__()
+        self.__index: Dict[str, int] = dict()
+
+    def indices(self, strings) -> array:
+        index = self.__index
+        return array('q', (index.setdefault(string, len(index))
+                           for string in strings))
+
+    def columns(self) -> List[Tuple[str, array]]:
+        offsets = array('q', [0])
+        data = bytearray()
+        for string in self.__index:
+            data += string.encode("utf8")
+            offsets.append(len(data))
+        return [("strings", array('B', data)), ("string_offsets", offsets)]
+
+    @staticmethod
+    def read(data: array, offsets: array) -> List[str]:
+        data = data.tobytes()
+        return [data[offsets[i]:offsets[i + 1]].decode("utf8")
+                for i in range(len(offsets) - 1)]
+
+
+def _numbers(items: List[Dict],
+             fields: Tuple[str, ...]) -> Tuple[List[array], array]:
+    # Columns of the numeric fields and a bitmask of the integer fields
+    columns = [array('d') for _ in fields]
+    integers = array('B')
+    for item in items:
+        mask = 0
+        for bit, (field, column) in enumerate(zip(fields, columns)):
+            value = item[field]
+            if isinstance(value, int):
+                if abs(value) > MAX_EXACT_INTEGER:
+                    raise ValueError("Number %s is too large" % value)
+                mask |= 1 << bit
+            column.append(value)
+        integers.append(mask)
+    return columns, integers
+
+
+def _from_numbers(columns: List[array], integers: array) -> List[List]:
+    # Numbers per item, integers converted back to int
+    rows = list()
+    for row, mask in zip(zip(*columns), integers):
+        rows.append([int(value) if mask & (1 << bit) else value
+                     for bit, value in enumerate(row)])
+    return rows
+
+
+def _to_little_endian(column: array) -> bytes:
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
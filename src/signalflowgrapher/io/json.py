@@ -2,8 +2,6 @@ from signalflowgrapher.common.json_dict import JSONDict
 from typing import Dict, Any
 import json
 import logging
-import jsonschema
-from jsonschema.validators import validate
 from signalflowgrapher.io.file import write_file, read_file
 logger = logging.getLogger(__name__)
 
@@ -139,6 +137,10 @@ class JSONValidator(object):
         Validate data with graph schema. Raises validation error
         if validation fails.
         """
+        # jsonschema is imported on first use to keep the startup fast
+        import jsonschema
+        from jsonschema.validators import validate
+
         try:
             validate(instance=data, schema=self.__graph_schema)
         except jsonschema.exceptions.ValidationError as e:
@@ -0,0 +1,154 @@
+from typing import Dict, List
+from sympy import Expr, latex
+from sympy.printing.lambdarepr import lambdarepr
+from signalflowgrapher.algorithms.mason import MasonResult
+
+
+class MasonExport(object):
+    """
+    MasonExport creates text representations of a mason result.
+    """
+
+    def __init__(self, sympy_import_name: str = 'sp'):
+        super().__init__()
+        self.__sympy_import_name = sympy_import_name
+
+    def evaluate(self, result: MasonResult) -> Expr:
+        """
+        Create full transfer function by substitution of all interim
+        results, without simplifying.
+        """
+        T = result.transfer_function[0][0]
+        return T.subs(result.transfer_function) \
+            .subs(result.numerator) \
+            .subs(result.denominator) \
+            .subs(result.determinant) \
+            .subs(result.paths) \
+            .subs(result.loops)
+
+    def to_dict(self, result: MasonResult) -> Dict:
+        """
+        Create dict with string representation of all interim results
+        and the evaluated transfer function.
+        """
+        def to_strs(expressions):
+            return {str(symbol): str(expr) for symbol, expr in expressions}
+
+        return {"loops": to_strs(result.loops),
+                "paths": to_strs(result.paths),
+                "determinant": to_strs(result.determinant),
+                "numerator": to_strs(result.numerator),
+                "denominator": to_strs(result.denominator),
+                "transfer_function": to_strs(result.transfer_function),
+                "evaluated": str(self.evaluate(result))}
+
+    def to_latex(self, result: MasonResult) -> str:
+        """
+        Create LaTeX align environment with all interim results
+        and the evaluated transfer function.
+        """
+        lines = []
+        for expressions in [result.loops,
+                            result.determinant,
+                            result.paths,
+                            result.numerator,
+                            result.denominator,
+                            result.transfer_function]:
+            for symbol, expr in expressions:
+                lines.append("%s &= %s" % (latex(symbol), latex(expr)))
+
+        lines.append("%s &= %s" % (latex(result.transfer_function[0][0]),
+                                   latex(self.evaluate(result))))
+        return "\\begin{align*}\n" + " \\\\\n".join(lines) + \
+            "\n\\end{align*}\n"
+
+    def to_python(self, result: MasonResult) -> str:
+        """
+        Create python code calculating the transfer function with sympy.
+        """
+        # Build strings based on mason result
+        sympy_import_name = self.__sympy_import_name
+        interim_strs = {
+            'det': 'determinant = {}'.format(lambdarepr(
+                result.determinant)),
+            'paths': 'paths = {}'.format(lambdarepr(result.paths)),
+            'loops': 'loops = {}'.format(lambdarepr(result.loops)),
+            'numerator': 'numerator = {}'.format(
+                lambdarepr(result.numerator)),
+            'denominator': 'denominator = {}'.format(
+                lambdarepr(result.denominator)),
+            'transfer_function': 'transfer_function = {}'.format(
+                lambdarepr(result.transfer_function))
+        }
+
+        free_symbols = set()
+        for _, _L in result.loops:
+            free_symbols.update(_L.free_symbols)
+        free_symbols.update(self.evaluate(result).free_symbols)
+
+        # Combine all symbols to be on top for combined output, except the
+        # symbols of the forward paths
+        combined_symbols = ''
+        combined_symbols += self.__get_symbols_str_from_interim_res(
+            result.determinant, sympy_import_name)
+        combined_symbols += self.__get_symbols_str_from_interim_res(
+            result.loops, sympy_import_name)
+        combined_symbols += self.__get_symbols_str_from_interim_res(
+            result.numerator, sympy_import_name)
+        combined_symbols += self.__get_symbols_str_from_interim_res(
+            result.denominator, sympy_import_name)
+        combined_symbols += self.__get_symbols_str_from_interim_res(
+            result.transfer_function, sympy_import_name)
+        combined_symbols += self.__get_symbols(
+            list(map(lambda x: str(x), free_symbols)),
+            sympy_import_name)
+
+        # Symbols of the forward path
+        path_symbols = self.__get_symbols_str_from_interim_res(
+            result.paths, sympy_import_name)
+
+        # Now build the code
+        # .. Import of sympy
+        combined_output = 'import sympy as {}\n'.format(sympy_import_name)
+        # .. all symbol definitions except for forward path
+        combined_output += combined_symbols
+
+        # calculation of the graph determinant
+        interim_outputs = '\n{loops}\n{det}\n{denominator}'
+        combined_output += interim_outputs.format_map(interim_strs)
+
+        # calculation of the forward path
+        interim_outputs = '{paths}\n{numerator}'
+        combined_output += '\n\n'
+        combined_output += path_symbols
+        combined_output += interim_outputs.format_map(interim_strs)
+
+        # calculation of transfer function
+        interim_outputs = '\n\n{transfer_function}'
+        combined_output += interim_outputs.format_map(interim_strs)
+        combined_output += '\nT=' + str(result.transfer_function[0][0])
+        combined_output += '.subs(transfer_function).subs(numerator)'
+        combined_output += '.subs(denominator).subs(determinant).subs(paths)'
+        combined_output += '.subs(loops)     #optional: add .simplify() to simplify the result'
+        combined_output += '\ndisplay(T)'
+        return combined_output
+
+    def __get_symbols_str_from_interim_res(self,
+                                           expressions,
+                                           sympy_import_name) -> str:
+        # Create a sympy symbols command for interim result
+        if len(expressions) == 0:
+            return ''
+
+        symbols = list(map(lambda e: lambdarepr(e[0]), expressions))
+        return self.__get_symbols(symbols, sympy_import_name)
+
+    def __get_symbols(self, symbols: List[str], sympy_import_name) -> str:
+        # Create sympy symbols command for given symbols
+        if len(symbols) == 0:
+            return ''
+
+        joined = ','.join(symbols)
+        return '{} = {}.symbols(\'{}\')\n'.format(joined,
+                                                  sympy_import_name,
+                                                  joined)
@@ -3,7 +3,6 @@ from signalflowgrapher.model.model import Branch, Node
 from signalflowgrapher.io.file import write_file, read_file
 from os.path import dirname, join, isfile
 from shutil import copyfile
-from sympy import latex
 from signalflowgrapher.common.utils import parse_weight, parse_nodename
 from importlib import resources
 import logging
@@ -115,6 +114,7 @@ class TikZExport(object):
         return code
 
     def __latex_name_node(self, name: str) -> str:
+        from sympy import latex
         if name == "":
             latex_notation = ""
         else:
@@ -122,6 +122,7 @@ class TikZExport(object):
         return (latex_notation)
 
     def __latex_name_branch(self, weight: str, branch) -> str:
+        from sympy import latex
         if weight == "":
             latex_notation = ""
         else:
@@ -1,7 +1,7 @@
 from signalflowgrapher.algorithms.graph import Graph, Node, Branch
 from signalflowgrapher.common.json_dict import JSONDict
 from signalflowgrapher.common.observable import ObjectObservable
-from typing import Dict, List
+from typing import Dict, Iterable, List, Mapping, Tuple, Union
 import uuid
 import abc
 
@@ -11,10 +11,10 @@ class LabeledObject(JSONDict, abc.ABC):
     Object with an attached label that has a relative position.
     """
 
-    def __init__(self, dx, dy, *args):
+    def __init__(self, dx, dy, *args, **kwargs):
         self._dx = dx
         self._dy = dy
-        super().__init__(*args)
+        super().__init__(*args, **kwargs)
 
     @property
     def label_dx(self):
@@ -60,13 +60,13 @@ class CurvedBranch(LabeledObject, Branch):
 
     def __init__(self, start_node, end_node, spline1_x,
                  spline1_y, spline2_x, spline2_y,
-                 label_dx, label_dy, weight: str = "", *args):
+                 label_dx, label_dy, weight: str = "", *args, **kwargs):
         self.__spline1_x = spline1_x
         self.__spline1_y = spline1_y
         self.__spline2_x = spline2_x
         self.__spline2_y = spline2_y
         super().__init__(label_dx, label_dy,
-                         start_node, end_node, weight, *args)
+                         start_node, end_node, weight, *args, **kwargs)
 
     @property
     def spline1_x(self) -> int:
@@ -132,15 +132,18 @@ class CurvedBranch(LabeledObject, Branch):
                 "label_dy": self._dy}
 
     @classmethod
-    def from_dict(cls, dict: Dict, nodes: List[Node]):
+    def from_dict(cls,
+                  dict: Dict,
+                  nodes: Union[Iterable[Node], Dict[str, Node]]):
         """
-        Create branch from dict.
+        Create branch from dict. The nodes are given as collection or as
+        dict by id hex, which avoids the mapping for every branch.
         """
         # Map ids of start and end to objects
-        start_id = dict["start"]
-        end_id = dict["end"]
-        start = next(node for node in nodes if node.id.hex == start_id)
-        end = next(node for node in nodes if node.id.hex == end_id)
+        if not isinstance(nodes, Mapping):
+            nodes = {node.id.hex: node for node in nodes}
+        start = nodes[dict["start"]]
+        end = nodes[dict["end"]]
 
         branch = cls(start,
                      end,
@@ -149,9 +152,9 @@ class CurvedBranch(LabeledObject, Branch):
                      dict["spline2_x"],
                      dict["spline2_y"],
                      dict["label_dx"],
-                     dict["label_dy"])
-        branch._id = uuid.UUID(dict["id"])
-        branch._weight = dict["weight"]
+                     dict["label_dy"],
+                     dict["weight"],
+                     id=uuid.UUID(dict["id"]))
         return branch
 
     @property
@@ -173,11 +176,12 @@ class PositionedNode(LabeledObject, Node):
                  y: int,
                  label_dx: int,
                  label_dy: int,
-                 *args):
+                 *args,
+                 **kwargs):
         self.__x = x
         self.__y = y
         self.__name = ""
-        super().__init__(label_dx, label_dy, graph, *args)
+        super().__init__(label_dx, label_dy, graph, *args, **kwargs)
 
     def move(self, dx, dy):
         """
@@ -239,8 +243,8 @@ class PositionedNode(LabeledObject, Node):
                    dict["x"],
                    dict["y"],
                    dict["label_dx"],
-                   dict["label_dy"])
-        node._id = uuid.UUID(dict["id"])
+                   dict["label_dy"],
+                   id=uuid.UUID(dict["id"]))
         node.__name = dict["name"]
         return node
 
@@ -253,9 +257,77 @@ class PositionedNode(LabeledObject, Node):
 
 
 class ObservableGraph(Graph, ObjectObservable):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, persistent: bool = False):
+        super().__init__(persistent=persistent)
         self.__change_listeners = list()
+        # Nesting level of begin_batch and the coalesced deltas of the
+        # moved nodes and transformed branches of the current batch
+        self.__batch_level = 0
+        self.__batch_node_moves = dict()
+        self.__batch_branch_transforms = dict()
+        # Set while the graph is created from a dict, no changes are
+        # notified
+        self.__loading = False
+
+    def begin_batch(self):
+        """
+        Begin a batch of changes. Until the matching end_batch, node moves
+        and branch transformations are coalesced per node and branch and
+        notified as one BatchEvent. Other changes are notified immediately
+        after the coalesced changes so far. Batches can be nested.
+        """
+        self.__batch_level += 1
+
+    def end_batch(self):
+        """
+        End a batch of changes, the outermost end_batch notifies the
+        coalesced changes.
+        """
+        if self.__batch_level == 0:
+            raise Exception("No batch to end.")
+
+        self.__batch_level -= 1
+        if self.__batch_level == 0:
+            self.__flush_batch()
+
+    def _notify(self, value):
+        if self.__loading:
+            return
+
+        if self.__batch_level > 0:
+            if isinstance(value, PositionedNodeMovedEvent):
+                delta = self.__batch_node_moves.setdefault(value.node, [0, 0])
+                delta[0] += value.dx
+                delta[1] += value.dy
+                return
+            if isinstance(value, CurvedBranchTransformedEvent):
+                delta = self.__batch_branch_transforms.setdefault(
+                    value.branch, [0, 0, 0, 0])
+                delta[0] += value.spline1_dx
+                delta[1] += value.spline1_dy
+                delta[2] += value.spline2_dx
+                delta[3] += value.spline2_dy
+                return
+
+            # Keep the order of the coalesced and other changes
+            self.__flush_batch()
+
+        super()._notify(value)
+
+    def __flush_batch(self):
+        if not self.__batch_node_moves and \
+                not self.__batch_branch_transforms:
+            return
+
+        events = list()
+        for node, (dx, dy) in self.__batch_node_moves.items():
+            events.append(PositionedNodeMovedEvent(node, dx, dy))
+        for branch, deltas in self.__batch_branch_transforms.items():
+            events.append(CurvedBranchTransformedEvent(branch, *deltas))
+
+        self.__batch_node_moves = dict()
+        self.__batch_branch_transforms = dict()
+        super()._notify(BatchEvent(events))
 
     def add_node(self, node: PositionedNode):
         """
@@ -344,17 +416,111 @@ class ObservableGraph(Graph, ObjectObservable):
         )
 
     @classmethod
-    def from_dict(cls, dict):
+    def from_dict(cls, dict, persistent: bool = False):
+        """
+        Create the graph from dictionary. Nodes and branches are added
+        without notifications, setting the graph on the model notifies
+        them as one GraphChangedEvent.
+        """
+        graph = cls(persistent=persistent)
+        graph.__loading = True
+        try:
+            # Nodes by id hex to resolve start and end of the branches
+            nodes = {}
+            for node in dict["nodes"]:
+                node['graph'] = graph
+                node = PositionedNode.from_dict(node)
+                nodes[node.id.hex] = node
+            for branch in dict["branches"]:
+                CurvedBranch.from_dict(branch, nodes)
+        finally:
+            graph.__loading = False
+        return graph
+
+
+class GraphBuilder(JSONDict):
+    """
+    Builder of large graphs from Python. Nodes and branches are collected
+    with constant time validation and created in one step by build, which
+    avoids the per member notifications of the observable graph.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Node and branch dicts as in a graph file, nodes by id hex
+        self.__nodes: Dict[str, Dict] = dict()
+        self.__branches: List[Dict] = list()
+
+    def add_node(self,
+                 x: int,
+                 y: int,
+                 name: str = "",
+                 label_dx: int = 0,
+                 label_dy: int = 30) -> str:
+        """
+        Add a node at the given position and get its id hex.
+        """
+        id = uuid.uuid4().hex
+        self.__nodes[id] = {"id": id,
+                            "name": name,
+                            "x": x,
+                            "y": y,
+                            "label_dx": label_dx,
+                            "label_dy": label_dy}
+        return id
+
+    def add_branch(self,
+                   start: str,
+                   end: str,
+                   weight: str = "",
+                   spline1: Tuple[int, int] = None,
+                   spline2: Tuple[int, int] = None,
+                   label_dx: int = 0,
+                   label_dy: int = -20) -> str:
+        """
+        Add a branch between the nodes with the given id hexes and get its
+        id hex. Without splines the branch is a straight line, self loops
+        need both splines.
+        """
+        start_node = self.__nodes.get(start)
+        end_node = self.__nodes.get(end)
+        if start_node is None or end_node is None:
+            raise ValueError("Start or end node is not part of the builder.")
+
+        if spline1 is None or spline2 is None:
+            if start == end:
+                raise ValueError("Self loop needs spline positions.")
+            middle = ((start_node["x"] + end_node["x"]) / 2,
+                      (start_node["y"] + end_node["y"]) / 2)
+            spline1 = spline1 or middle
+            spline2 = spline2 or middle
+
+        id = uuid.uuid4().hex
+        self.__branches.append({"id": id,
+                                "weight": weight,
+                                "start": start,
+                                "end": end,
+                                "spline1_x": spline1[0],
+                                "spline1_y": spline1[1],
+                                "spline2_x": spline2[0],
+                                "spline2_y": spline2[1],
+                                "label_dx": label_dx,
+                                "label_dy": label_dy})
+        return id
+
+    def build(self) -> ObservableGraph:
+        """
+        Create the graph with all added nodes and branches.
+        """
+        return ObservableGraph.from_dict(self.to_dict())
+
+    def to_dict(self) -> Dict:
         """
-        Create the graph from dictionary.
+        Create dict as of the graph, which can be written as graph file.
         """
-        graph = cls()
-        for node in dict["nodes"]:
-            node['graph'] = graph
-            PositionedNode.from_dict(node)
-        for branch in dict["branches"]:
-            CurvedBranch.from_dict(branch, graph.nodes)
-        return graph
+        return {**super().to_dict(),
+                "nodes": [dict(node) for node in self.__nodes.values()],
+                "branches": [dict(branch) for branch in self.__branches]}
 
 
 class Model(ObjectObservable):
@@ -414,6 +580,18 @@ class Model(ObjectObservable):
 
         self._notify(GraphMovedEvent(nodes, branches, dx, dy))
 
+    def begin_batch(self):
+        """
+        Begin a batch of changes of the graph, see ObservableGraph.
+        """
+        self.__graph.begin_batch()
+
+    def end_batch(self):
+        """
+        End a batch of changes of the graph, see ObservableGraph.
+        """
+        self.__graph.end_batch()
+
     def set_grid_position(self, grid_pos):
         """
         Set the grid position of the graph.
@@ -543,3 +721,16 @@ class GraphMovedEvent(GraphEvent):
         super().__init__(nodes, branches, **kwargs)
         self.dx = dx
         self.dy = dy
+
+
+class BatchEvent(object):
+    """
+    Occurs at the end of a batch of changes. Holds one
+    PositionedNodeMovedEvent per moved node followed by one
+    CurvedBranchTransformedEvent per transformed branch with the summed
+    deviations of the batch.
+    """
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
@@ -0,0 +1,94 @@
+import pickle
+import unittest
+from signalflowgrapher.algorithms.graph import Graph, Branch, Node
+from signalflowgrapher.algorithms.compact_graph import CompactGraph
+
+
+class TestCompactGraph(unittest.TestCase):
+
+    def test_compact_graph(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        node_3 = Node(graph)
+
+        branch_a = Branch(node_1, node_2, "a")
+        branch_b = Branch(node_2, node_3, "b")
+        branch_c = Branch(node_2, node_3, "c")
+        branch_d = Branch(node_3, node_3, "d")
+
+        compact = CompactGraph(graph)
+
+        self.assertEqual(3, compact.node_count)
+        self.assertEqual(4, compact.branch_count)
+        self.assertCountEqual([node_1, node_2, node_3], compact.nodes)
+        self.assertCountEqual([branch_a, branch_b, branch_c, branch_d],
+                              compact.branches)
+
+        for node in [node_1, node_2, node_3]:
+            index = compact.node_index(node)
+            self.assertIs(node, compact.nodes[index])
+            self.assertCountEqual(
+                node.outgoing,
+                [compact.branches[b] for b in compact.outgoing(index)])
+            self.assertCountEqual(
+                node.ingoing,
+                [compact.branches[b] for b in compact.ingoing(index)])
+
+        for branch in [branch_a, branch_b, branch_c, branch_d]:
+            index = compact.branch_index(branch)
+            self.assertIs(branch, compact.branches[index])
+            self.assertEqual(branch.weight, compact.weights[index])
+            self.assertIs(branch.start,
+                          compact.nodes[compact.starts[index]])
+            self.assertIs(branch.end,
+                          compact.nodes[compact.ends[index]])
+
+    def test_snapshot_not_changed(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        branch_a = Branch(node_1, node_2, "a")
+
+        compact = CompactGraph(graph)
+        Node(graph)
+        branch_a.remove()
+
+        self.assertEqual(2, compact.node_count)
+        self.assertEqual((branch_a,), compact.branches)
+        self.assertEqual(1, len(compact.outgoing(
+            compact.node_index(node_1))))
+
+    def test_read_only(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        Branch(node_1, node_2, "a")
+
+        compact = CompactGraph(graph)
+
+        with self.assertRaises(TypeError):
+            compact.starts[0] = 1
+        with self.assertRaises(TypeError):
+            compact.outgoing(compact.node_index(node_1))[0] = 1
+
+    def test_pickle(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        branch_a = Branch(node_1, node_2, "a")
+
+        compact = CompactGraph(graph)
+        unpickled = pickle.loads(pickle.dumps(compact))
+
+        index_1 = compact.node_index(node_1)
+        self.assertEqual(2, unpickled.node_count)
+        self.assertEqual(1, unpickled.branch_count)
+        self.assertEqual(("a",), unpickled.weights)
+        self.assertEqual([compact.branch_index(branch_a)],
+                         list(unpickled.outgoing(index_1)))
+        self.assertIsNone(unpickled.nodes)
@@ -1,6 +1,6 @@
 import unittest
 from signalflowgrapher.algorithms.graph import Graph, Branch, Node
-from signalflowgrapher.algorithms.find_paths import find_paths
+from signalflowgrapher.algorithms.find_paths import find_paths, iter_paths
 
 
 class TestGraph(unittest.TestCase):
@@ -166,3 +166,32 @@ class TestGraph(unittest.TestCase):
             [branch_a, branch_b, branch_c, branch_d, branch_e, branch_f],
             [branch_a, branch_k, branch_f]
         ], paths)
+
+    def test_iter_paths_pruned(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        node_3 = Node(graph)
+        node_4 = Node(graph)
+
+        branch_a = Branch(node_1, node_2, "a")
+        branch_b = Branch(node_2, node_3, "b")
+        # Dead end that can not reach node_3
+        Branch(node_1, node_4, "c")
+        Branch(node_4, node_4, "d")
+
+        paths = iter_paths(node_1, node_3)
+
+        self.assertEqual([branch_a, branch_b], next(paths))
+        self.assertEqual([], list(paths))
+        self.assertEqual([], find_paths(node_3, node_1))
+
+    def test_find_paths_long_chain(self):
+        graph = Graph()
+
+        nodes = [Node(graph) for _ in range(5000)]
+        branches = [Branch(start, end, "a")
+                    for start, end in zip(nodes, nodes[1:])]
+
+        self.assertEqual([branches], find_paths(nodes[0], nodes[-1]))
@@ -213,6 +213,57 @@ class TestGraph(TestCase):
         return True
 
 
+class TestGraphSnapshot(TestCase):
+    def setUp(self):
+        self.graph = Graph(persistent=True)
+        self.node_1 = Node(self.graph)
+        self.node_2 = Node(self.graph)
+        self.branch = Branch(self.node_1, self.node_2, "a")
+
+    def test_snapshot(self):
+        snapshot = self.graph.snapshot()
+
+        # Change the graph after the snapshot
+        self.branch.weight = "b"
+        node_3 = Node(self.graph)
+        branch_2 = Branch(self.node_2, node_3, "c")
+        self.node_1.remove()
+
+        self.assertEqual({self.node_1, self.node_2}, set(snapshot.nodes))
+        self.assertEqual({self.branch}, set(snapshot.branches))
+        self.assertEqual((self.node_1, self.node_2, "a"),
+                         snapshot.branch_state(self.branch))
+
+        snapshot = self.graph.snapshot()
+        self.assertEqual({self.node_2, node_3}, set(snapshot.nodes))
+        self.assertEqual({branch_2}, set(snapshot.branches))
+        self.assertEqual((self.node_2, node_3, "c"),
+                         snapshot.branch_state(branch_2))
+
+    def test_snapshot_subgraph(self):
+        node_3 = Node(self.graph)
+        Branch(self.node_2, node_3)
+        self.graph.subgraph({self.node_1, self.node_2})
+
+        snapshot = self.graph.snapshot()
+        self.assertEqual({node_3}, set(snapshot.nodes))
+        self.assertEqual(set(), set(snapshot.branches))
+
+    def test_snapshot_not_persistent(self):
+        graph = Graph()
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        branch = Branch(node_1, node_2, "a")
+        self.assertFalse(graph.persistent)
+        self.assertTrue(self.graph.persistent)
+
+        snapshot = graph.snapshot()
+        branch.weight = "b"
+        self.assertEqual({node_1, node_2}, set(snapshot.nodes))
+        self.assertEqual((node_1, node_2, "a"),
+                         snapshot.branch_state(branch))
+
+
 class TestBranch(TestCase):
     def test_properties(self):
         node1 = MagicMock(Node)
@@ -1,7 +1,8 @@
 from typing import List
 import unittest
 from signalflowgrapher.algorithms.johnson import \
-    simple_cycles, strongly_connected_components
+    simple_cycles, simple_cycle_indices, strongly_connected_components
+from signalflowgrapher.algorithms.compact_graph import CompactGraph
 from signalflowgrapher.algorithms.graph import Branch, Graph, Node
 
 
@@ -231,6 +232,49 @@ class TestGraph(unittest.TestCase):
              [branch_a.id, branch_b.id, branch_c.id],
              [branch_f.id], [branch_g.id], [branch_h.id]], cycles))
 
+    def test_compact_graph(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        node_3 = Node(graph)
+
+        branch_a = Branch(node_1, node_2, "a")
+        branch_b = Branch(node_2, node_1, "b")
+        branch_c = Branch(node_2, node_3, "c")
+        branch_d = Branch(node_3, node_1, "d")
+        branch_e = Branch(node_3, node_3, "e")
+
+        compact = CompactGraph(graph)
+        cycles = [[compact.branches[branch].id for branch in cycle]
+                  for cycle in simple_cycle_indices(compact)]
+
+        self.assertTrue(self.__check_loop_order(
+            [[branch_a.id, branch_b.id],
+             [branch_a.id, branch_c.id, branch_d.id],
+             [branch_e.id]], cycles))
+
+        # Original graph is not altered
+        self.assertCountEqual([node_1, node_2, node_3], graph.nodes)
+        self.assertCountEqual([branch_a, branch_b, branch_c,
+                               branch_d, branch_e], graph.branches)
+        self.assertCountEqual([branch_b, branch_d], node_1.ingoing)
+
+    def test_lazy(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+
+        branch_a = Branch(node_1, node_1, "a")
+        branch_b = Branch(node_2, node_2, "b")
+
+        cycles = simple_cycles(graph)
+        first = next(cycles)
+
+        self.assertIn(first, [[branch_a], [branch_b]])
+        self.assertEqual(1, len(list(cycles)))
+
     def __check_loop_order(self, expected_loops, actual_loops):
         """ Method for comparing two lists with loops.
             Each loop must have a defined order, but the start of the loop
@@ -100,3 +100,24 @@ class TestGraph(unittest.TestCase):
         ]
 
         self.assertCountEqual(expected, loops)
+
+    def test_methods_equal(self):
+        graph = Graph()
+
+        nodes = [Node(graph) for _ in range(8)]
+        loops = []
+        for i in range(len(nodes) - 1):
+            loops.append([Branch(nodes[i], nodes[i + 1], "a"),
+                          Branch(nodes[i + 1], nodes[i], "b")])
+            loops.append([Branch(nodes[i], nodes[i], "c")])
+
+        bitset = [(loopGroup.loops, loopGroup.nodes) for loopGroup
+                  in find_loop_groups(loops, "bitset")]
+        list_ = [(loopGroup.loops, loopGroup.nodes) for loopGroup
+                 in find_loop_groups(loops, "list")]
+
+        self.assertEqual(list_, bitset)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            find_loop_groups([], "unknown")
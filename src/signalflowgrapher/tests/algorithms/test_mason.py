@@ -1,7 +1,9 @@
 import unittest
 from signalflowgrapher.algorithms.graph import Graph, Branch, Node
-from signalflowgrapher.algorithms.mason import loop_to_expression, mason
-from sympy import Mul, Symbol, srepr
+from signalflowgrapher.algorithms.mason import (
+    loop_to_expression, mason, mason_many)
+from signalflowgrapher.model.model import GraphBuilder, ObservableGraph
+from sympy import Add, Integer, Mul, Symbol, srepr
 
 
 class TestMason(unittest.TestCase):
@@ -212,3 +214,101 @@ class TestMason(unittest.TestCase):
             .subs(result.loops)
 
         self.assertEqual(expected_num, str(actual_num))
+
+    def test_mason_200_branches(self):
+        # Chain of 101 nodes with a feedback branch from every node to the
+        # first node, all 100 loops touch each other and the forward path
+        graph = Graph()
+
+        nodes = [Node(graph) for _ in range(101)]
+        for i, (start, end) in enumerate(zip(nodes, nodes[1:])):
+            Branch(start, end, "a%s" % i)
+            Branch(end, nodes[0], "b%s" % i)
+
+        result = mason(graph, nodes[0], nodes[-1])
+
+        self.assertEqual(100, len(result.loops))
+        self.assertEqual(2, len(result.paths))
+        self.assertEqual(Integer(1), result.paths[1][1])
+        self.assertEqual(
+            Mul(*[Symbol("a%s" % i) for i in range(100)]),
+            result.paths[0][1])
+        self.assertEqual(
+            1 - Add(*[symbol for symbol, _ in result.loops]),
+            result.determinant[0][1])
+
+    def test_mason_many(self):
+        # Create graph
+        graph = Graph()
+
+        node_x = Node(graph)  # input node
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        node_3 = Node(graph)
+        node_z = Node(graph)  # output node
+
+        Branch(node_x, node_1, "a")
+        Branch(node_1, node_2, "b")
+        Branch(node_2, node_3, "c")
+        Branch(node_3, node_z, "d")
+        Branch(node_2, node_1, "e")
+        Branch(node_3, node_3, "f")
+        Branch(node_1, node_3, "g")
+
+        ends = [node_1, node_2, node_3, node_z]
+        for max_workers in [1, 2]:
+            results = mason_many(graph, node_x, ends, max_workers)
+
+            self.assertCountEqual(ends, results.keys())
+            for end in ends:
+                expected = mason(graph, node_x, end)
+                actual = results[end]
+                self.assertEqual(expected.loops, actual.loops)
+                self.assertEqual(expected.paths, actual.paths)
+                self.assertEqual(expected.determinant, actual.determinant)
+                self.assertEqual(expected.numerator, actual.numerator)
+
+    def test_mason_snapshot(self):
+        graph = Graph(persistent=True)
+
+        node_x = Node(graph)  # input node
+        node_1 = Node(graph)
+        node_z = Node(graph)  # output node
+
+        branch_a = Branch(node_x, node_1, "a")
+        Branch(node_1, node_z, "b")
+        Branch(node_1, node_1, "c")
+        expected = mason(graph, node_x, node_z)
+
+        # Change the graph after the snapshot
+        snapshot = graph.snapshot()
+        branch_a.weight = "d"
+        Branch(node_z, node_1, "e")
+
+        actual = mason(snapshot, node_x, node_z)
+        self.assertEqual(expected.loops, actual.loops)
+        self.assertEqual(expected.paths, actual.paths)
+        self.assertEqual(expected.determinant, actual.determinant)
+
+    def test_mason_snapshot_removed_invalid_branch(self):
+        # Invalid weights on a loop and on the forward path
+        for loop_weight, path_weight in (("c+", "b"), ("c", "b+")):
+            builder = GraphBuilder()
+            x = builder.add_node(0, 0, "x")
+            n = builder.add_node(100, 0, "n")
+            z = builder.add_node(200, 0, "z")
+            builder.add_branch(x, n, "a")
+            builder.add_branch(n, z, path_weight)
+            builder.add_branch(n, n, loop_weight,
+                               spline1=(80, -50), spline2=(120, -50))
+            graph = ObservableGraph.from_dict(builder.to_dict(),
+                                              persistent=True)
+            nodes = {node.name: node for node in graph.nodes}
+
+            # Remove the branches from the graph after the snapshot
+            snapshot = graph.snapshot()
+            for branch in list(graph.branches):
+                branch.remove()
+
+            with self.assertRaisesRegex(ValueError, "n → "):
+                mason(snapshot, nodes["x"], nodes["z"])
@@ -0,0 +1,143 @@
+import unittest
+from importlib import resources
+from itertools import permutations
+from sympy import expand
+from signalflowgrapher.algorithms.graph import Graph, Branch, Node
+from signalflowgrapher.algorithms.mason import mason
+from signalflowgrapher.algorithms.mason_matrix import mason_matrix
+from signalflowgrapher.io.json import JSONImport
+from signalflowgrapher.model.model import GraphBuilder, ObservableGraph
+
+examples = resources.files(
+    "signalflowgrapher.resources.examples.SC_analysis__schmid18")
+
+
+class TestMasonMatrix(unittest.TestCase):
+    def test_mason_matrix_1(self):
+        # Same graph as TestMason.test_mason_1
+        graph = Graph()
+
+        node_x = Node(graph)  # input node
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        node_3 = Node(graph)
+        node_4 = Node(graph)
+        node_5 = Node(graph)
+        node_z = Node(graph)  # output node
+
+        Branch(node_x, node_1, "a")
+        Branch(node_1, node_2, "b")
+        Branch(node_2, node_3, "c")
+        Branch(node_3, node_4, "d")
+        Branch(node_4, node_5, "e")
+        Branch(node_5, node_z, "f")
+        Branch(node_5, node_4, "g")
+        Branch(node_3, node_2, "h")
+        Branch(node_3, node_1, "j")
+        Branch(node_1, node_5, "k")
+
+        result = mason_matrix(graph, node_x, node_z)
+
+        numerator = result.numerator[0][1]
+        determinant = result.determinant[0][1]
+        self.assertEqual(
+            expand("a*b*c*d*e*f + a*f*k*(-c*h + 1)"), expand(numerator))
+        self.assertEqual(
+            expand("b*c*e*g*j - b*c*j + c*e*g*h - c*h - e*g + 1"),
+            expand(determinant))
+
+    def test_snapshot(self):
+        graph = Graph(persistent=True)
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+
+        branch = Branch(node_1, node_2, "a")
+        Branch(node_2, node_2, "c")
+        snapshot = graph.snapshot()
+        expected = mason_matrix(graph, node_1, node_2)
+
+        # Change the graph after the snapshot
+        branch.weight = "b"
+        Branch(node_2, node_1, "d")
+
+        actual = mason_matrix(snapshot, node_1, node_2)
+        self.assertEqual(expected.numerator, actual.numerator)
+        self.assertEqual(expected.determinant, actual.determinant)
+
+    def test_snapshot_removed_invalid_branch(self):
+        builder = GraphBuilder()
+        x = builder.add_node(0, 0, "x")
+        z = builder.add_node(100, 0, "z")
+        builder.add_branch(x, z, "a+")
+        graph = ObservableGraph.from_dict(builder.to_dict(), persistent=True)
+        nodes = {node.name: node for node in graph.nodes}
+
+        # Remove the branch from the graph after the snapshot
+        snapshot = graph.snapshot()
+        next(iter(graph.branches)).remove()
+
+        with self.assertRaisesRegex(ValueError, "x → z"):
+            mason_matrix(snapshot, nodes["x"], nodes["z"])
+
+    def test_parallel_branches_and_self_loop(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+
+        Branch(node_1, node_2, "a")
+        Branch(node_1, node_2, "b")
+        Branch(node_2, node_2, "c")
+
+        self.__assert_equal_to_mason(graph, node_1, node_2)
+
+    def test_no_path(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+
+        Branch(node_2, node_1, "a")
+        Branch(node_1, node_1, "b")
+
+        result = mason_matrix(graph, node_1, node_2)
+
+        self.assertEqual(0, result.numerator[0][1])
+        self.assertEqual(expand("1 - b"),
+                         expand(result.determinant[0][1]))
+
+    def test_schmid18_examples(self):
+        # Cross check against loop based mason for all pairs of nodes
+        for name in ["fig_01.sfg", "fig_02.sfg", "fig_04.sfg", "fig_08.sfg"]:
+            graph = self.__load_example(name)
+            for start, end in permutations(graph.nodes, 2):
+                self.__assert_equal_to_mason(graph, start, end)
+
+    def test_schmid18_fig_12(self):
+        # Larger example, only check from input node to all other nodes
+        graph = self.__load_example("fig_12.sfg")
+        start = next(node for node in graph.nodes if node.name == "Vin")
+        for end in graph.nodes:
+            if end is not start:
+                self.__assert_equal_to_mason(graph, start, end)
+
+    def __load_example(self, name: str) -> ObservableGraph:
+        with resources.as_file(examples.joinpath(name)) as path:
+            return ObservableGraph.from_dict(
+                JSONImport().read_from_json(str(path)))
+
+    def __assert_equal_to_mason(self, graph: Graph, start: Node, end: Node):
+        expected = mason(graph, start, end)
+        actual = mason_matrix(graph, start, end)
+
+        expected_numerator = expected.numerator[0][1] \
+            .subs(expected.paths) \
+            .subs(expected.loops)
+        expected_determinant = expected.determinant[0][1] \
+            .subs(expected.loops)
+
+        self.assertEqual(0, expand(expected_numerator -
+                                   actual.numerator[0][1]))
+        self.assertEqual(0, expand(expected_determinant -
+                                   actual.determinant[0][1]))
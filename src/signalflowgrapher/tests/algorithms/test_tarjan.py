@@ -0,0 +1,99 @@
+import unittest
+from signalflowgrapher.algorithms.graph import Graph, Branch, Node
+from signalflowgrapher.algorithms.compact_graph import CompactGraph
+from signalflowgrapher.algorithms.tarjan import (
+    SccSearch, strongly_connected_components,
+    strongly_connected_component_indices)
+
+
+class TestTarjan(unittest.TestCase):
+
+    def test_strongly_connected_components(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        node_3 = Node(graph)
+        node_4 = Node(graph)
+
+        Branch(node_1, node_2, "a")
+        Branch(node_2, node_1, "b")
+        Branch(node_2, node_3, "c")
+        Branch(node_3, node_4, "d")
+        Branch(node_4, node_4, "e")
+
+        components = strongly_connected_components(graph)
+
+        self.assertCountEqual([{node_1, node_2}, {node_3}, {node_4}],
+                              [set(component) for component in components])
+
+    def test_compact_graph_subset(self):
+        graph = Graph()
+
+        node_1 = Node(graph)
+        node_2 = Node(graph)
+        node_3 = Node(graph)
+
+        Branch(node_1, node_2, "a")
+        Branch(node_2, node_3, "b")
+        Branch(node_3, node_1, "c")
+        Branch(node_2, node_1, "d")
+
+        compact = CompactGraph(graph)
+        index_1 = compact.node_index(node_1)
+        index_2 = compact.node_index(node_2)
+        index_3 = compact.node_index(node_3)
+
+        self.assertCountEqual(
+            [{index_1, index_2, index_3}],
+            [set(c) for c in strongly_connected_component_indices(compact)])
+        self.assertCountEqual(
+            [{index_2}, {index_3}],
+            [set(c) for c in strongly_connected_component_indices(
+                compact, [index_2, index_3])])
+
+    def test_scc_search_reused(self):
+        graph = Graph()
+
+        # Cycle 1 -> 2 -> 3 -> 4 -> 1 and branch 2 -> 1
+        nodes = [Node(graph) for _ in range(4)]
+        for start, end in zip(nodes, nodes[1:] + nodes[:1]):
+            Branch(start, end, "a")
+        Branch(nodes[1], nodes[0], "b")
+
+        compact = CompactGraph(graph)
+        index_1, index_2, index_3, index_4 = [compact.node_index(node)
+                                              for node in nodes]
+        search = SccSearch(compact)
+
+        # Every search starts from a clean state
+        for _ in range(2):
+            self.assertCountEqual(
+                [{index_1, index_2, index_3, index_4}],
+                [set(c) for c in search.components()])
+            self.assertCountEqual(
+                [{index_1, index_2}, {index_3}],
+                [set(c) for c in search.components(
+                    [index_1, index_2, index_3])])
+            self.assertCountEqual(
+                [{index_2}, {index_3}, {index_4}],
+                [set(c) for c in search.components(
+                    [index_2, index_3, index_4])])
+
+    def test_long_chain(self):
+        # Recursive implementation exceeds the recursion limit
+        graph = Graph()
+
+        nodes = [Node(graph) for _ in range(10000)]
+        for start, end in zip(nodes, nodes[1:]):
+            Branch(start, end, "a")
+
+        components = strongly_connected_components(graph)
+        self.assertEqual(10000, len(components))
+
+        # Close chain to a single loop
+        Branch(nodes[-1], nodes[0], "b")
+
+        components = strongly_connected_components(graph)
+        self.assertEqual(1, len(components))
+        self.assertCountEqual(nodes, components[0])
@@ -0,0 +1,46 @@
+from unittest import TestCase
+from signalflowgrapher.common.spatial_index import GridIndex
+
+
+class TestGridIndex(TestCase):
+    def setUp(self):
+        self.index = GridIndex(cell_size=100)
+        self.index.insert("a", (10, 10, 30, 30))
+        self.index.insert("b", (250, 10, 270, 30))
+        # Spans several cells
+        self.index.insert("c", (-150, 150, 350, 170))
+
+    def test_query(self):
+        self.assertEqual(["a"], self.index.query((0, 0, 50, 50)))
+        self.assertEqual(["b", "c"], self.index.query((240, 0, 260, 160)))
+        self.assertEqual([], self.index.query((40, 40, 200, 140)))
+
+    def test_query_touching(self):
+        self.assertEqual(["a"], self.index.query((30, 30, 40, 40)))
+
+    def test_query_keeps_insertion_order(self):
+        self.index.insert("a", (0, 160, 10, 170))
+        self.assertEqual(["a", "b", "c"],
+                         self.index.query((-1000, -1000, 1000, 1000)))
+
+    def test_query_large_rect(self):
+        self.assertEqual(["a", "b", "c"],
+                         self.index.query((-1e6, -1e6, 1e6, 1e6)))
+
+    def test_move(self):
+        self.index.insert("a", (500, 500, 520, 520))
+        self.assertEqual([], self.index.query((0, 0, 50, 50)))
+        self.assertEqual(["a"], self.index.query((490, 490, 500, 500)))
+        self.assertEqual((500, 500, 520, 520), self.index.get_rect("a"))
+
+    def test_remove(self):
+        self.index.remove("c")
+        self.index.remove("unknown")
+        self.assertEqual(2, len(self.index))
+        self.assertNotIn("c", self.index)
+        self.assertEqual([], self.index.query((-150, 150, 350, 170)))
+
+    def test_clear(self):
+        self.index.clear()
+        self.assertEqual(0, len(self.index))
+        self.assertEqual([], self.index.query((-1e6, -1e6, 1e6, 1e6)))
@@ -0,0 +1,28 @@
+from unittest import TestCase
+from sympy import Symbol
+from signalflowgrapher.common.utils import (
+    parse_cache_info, parse_expression, parse_weight)
+
+
+class TestUtils(TestCase):
+
+    def test_parse_cache(self):
+        info = parse_cache_info()
+        expression = parse_expression("cache_test_a*cache_test_b")
+        self.assertEqual(info.misses + 1, parse_cache_info().misses)
+
+        info = parse_cache_info()
+        self.assertIs(expression,
+                      parse_expression("cache_test_a*cache_test_b"))
+        self.assertEqual(info.hits + 1, parse_cache_info().hits)
+        self.assertEqual(Symbol("cache_test_a") * Symbol("cache_test_b"),
+                         expression)
+
+    def test_parse_weight_invalid(self):
+        branch = type("Branch", (), {})()
+        branch.start = type("Node", (), {"name": "a"})()
+        branch.end = type("Node", (), {"name": "b"})()
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                parse_weight("a+", branch)
@@ -5,7 +5,9 @@ from signalflowgrapher.commands.command_handler import CommandHandler
 from signalflowgrapher.controllers.io_controller import IOController
 from signalflowgrapher.io.tikz import TikZExport
 from signalflowgrapher.io.json import JSONExport, JSONImport
+from signalflowgrapher.io.columnar import ColumnarExport, ColumnarImport
 from signalflowgrapher.algorithms.mason import mason
+from signalflowgrapher.algorithms.mason_matrix import mason_matrix
 from signalflowgrapher.algorithms.graph import Graph, Node, Branch
 
 
@@ -40,6 +42,21 @@ class TestIOController(TestCase):
             "Path to save graph to")
         command_handler.reset.assert_called_once()
 
+    def test_save_graph_columnar(self):
+        model = MagicMock(Model)
+        command_handler = MagicMock(CommandHandler)
+        columnar_export = MagicMock(ColumnarExport)
+
+        with patch("signalflowgrapher.controllers.io_controller."
+                   "ColumnarExport",
+                   MagicMock(return_value=columnar_export)):
+            controller = IOController(model, command_handler)
+            controller.save_graph("graph.sfgc")
+
+        columnar_export.write_as_columnar.assert_called_once_with(
+            model.graph, model.get_grid_position(), "graph.sfgc")
+        command_handler.reset.assert_called_once()
+
     def test_new_graph(self):
         model = MagicMock(Model)
         command_handler = MagicMock(CommandHandler)
@@ -75,6 +92,31 @@ class TestIOController(TestCase):
         self.assertEqual(observable_graph.from_dict(), model.graph)
         command_handler.reset.assert_called_once()
 
+    def test_load_graph_columnar(self):
+        model = MagicMock(Model)
+        command_handler = MagicMock(CommandHandler)
+        observable_graph = MagicMock(ObservableGraph)
+        columnar_import = MagicMock(ColumnarImport)
+        columnar_import.read_from_columnar.return_value = {
+            "nodes": [], "branches": [], "grid_pos": [10, 20]}
+
+        with patch("signalflowgrapher.controllers.io_controller."
+                   "ObservableGraph",
+                   observable_graph):
+            with patch("signalflowgrapher.controllers.io_controller."
+                       "ColumnarImport",
+                       MagicMock(return_value=columnar_import)):
+                controller = IOController(model, command_handler)
+                controller.load_graph("graph.sfgc")
+
+        columnar_import.read_from_columnar.assert_called_once_with(
+            "graph.sfgc")
+        model.set_grid_position.assert_called_once_with((10, 20))
+        observable_graph.from_dict.assert_called_once_with(
+            {"nodes": [], "branches": []})
+        self.assertEqual(observable_graph.from_dict(), model.graph)
+        command_handler.reset.assert_called_once()
+
     def test_generate_mason(self):
         model = MagicMock(Model)
         command_handler = MagicMock(CommandHandler)
@@ -101,3 +143,29 @@ class TestIOController(TestCase):
         self.assertEqual("a", branch1.weight)
         self.assertEqual(None, branch2.weight)
         self.assertEqual("", branch3.weight)
+
+    def test_generate_mason_matrix(self):
+        model = MagicMock(Model)
+        command_handler = MagicMock(CommandHandler)
+        mason_matrix_mock = MagicMock(mason_matrix)
+
+        graph = MagicMock(Graph)
+        start = MagicMock(Node)
+        end = MagicMock(Node)
+
+        with patch("signalflowgrapher.controllers.io_controller."
+                   "mason_matrix",
+                   mason_matrix_mock):
+            controller = IOController(model, command_handler)
+            controller.generate_mason(graph, start, end, "matrix")
+
+        mason_matrix_mock.assert_called_once_with(graph, start, end)
+
+    def test_generate_mason_unknown_method(self):
+        model = MagicMock(Model)
+        command_handler = MagicMock(CommandHandler)
+
+        controller = IOController(model, command_handler)
+        with self.assertRaises(ValueError):
+            controller.generate_mason(MagicMock(Graph), MagicMock(Node),
+                                      MagicMock(Node), "unknown")
@@ -16,7 +16,8 @@ from signalflowgrapher.commands.change_node_name_command \
 from signalflowgrapher.commands.create_branch_command \
     import CreateBranchCommand
 from signalflowgrapher.model.model \
-    import PositionedNode, CurvedBranch, LabeledObject
+    import PositionedNode, CurvedBranch, LabeledObject, \
+    CurvedBranchAddedEvent, GraphChangedEvent
 
 
 class TestMainController(TestCase):
@@ -125,6 +126,8 @@ class TestMainController(TestCase):
                                           0)
 
         self.assertEqual(3, self.command_handler.add_command.call_count)
+        self.model.begin_batch.assert_called_once_with()
+        self.model.end_batch.assert_called_once_with()
 
     def test_move_label_relative(self):
         labeled_object = MagicMock(LabeledObject)
@@ -353,6 +356,61 @@ class TestMainController(TestCase):
         command.assert_called_once_with(self.model.graph,
                                         branch(), self.model)
 
+    def __near_branch(self):
+        existing_branch = MagicMock(CurvedBranch)
+        existing_branch.spline1_x = 55
+        existing_branch.spline1_y = 10
+        existing_branch.spline2_x = 55
+        existing_branch.spline2_y = 10
+        existing_branch.start.x = 10
+        existing_branch.start.y = 10
+        existing_branch.end.x = 100
+        existing_branch.end.y = 10
+        return existing_branch
+
+    def __create_branch_auto_pos(self):
+        start_node = MagicMock(PositionedNode)
+        start_node.x = 10
+        start_node.y = 10
+        end_node = MagicMock(PositionedNode)
+        end_node.x = 100
+        end_node.y = 10
+        branch = MagicMock(CurvedBranch)
+
+        with patch("signalflowgrapher.controllers.main_controller."
+                   "CreateBranchCommand"):
+            with patch("signalflowgrapher.controllers.main_controller."
+                       "CurvedBranch",
+                       branch):
+                self.controller.create_branch_auto_pos(start_node,
+                                                       end_node,
+                                                       "Weight Test")
+        return branch.call_args[0][2:6]
+
+    def test_create_branch_auto_pos_bounded_search(self):
+        self.model.graph.branches = {self.__near_branch()}
+        with patch("signalflowgrapher.controllers.main_controller."
+                   "MAX_SPLINE_OFFSET_TRIES", 0):
+            splines = self.__create_branch_auto_pos()
+
+        # Search stops with the overlapping straight branch
+        self.assertEqual((55, 10, 55, 10), splines)
+
+    def test_create_branch_auto_pos_added_branch(self):
+        self.model.graph.branches = set()
+        self.assertEqual((55, 10, 55, 10), self.__create_branch_auto_pos())
+
+        # Branches added later are found in the index
+        observer = self.model.observe.call_args[0][0]
+        observer(CurvedBranchAddedEvent(self.__near_branch()))
+        self.assertEqual((9.999999999999995, -35, 100, -35),
+                         self.__create_branch_auto_pos())
+
+        # Removed branches are not found
+        self.model.graph.branches = set()
+        observer(GraphChangedEvent(set(), set()))
+        self.assertEqual((55, 10, 55, 10), self.__create_branch_auto_pos())
+
     def test_create_self_loop(self):
         start_node = MagicMock(PositionedNode)
         start_node.x = 10
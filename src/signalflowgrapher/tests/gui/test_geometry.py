@@ -0,0 +1,50 @@
+from unittest import TestCase
+import math
+from PySide6.QtCore import QPoint, QPointF
+from PySide6.QtGui import QPainterPath
+from signalflowgrapher.gui.geometry import (
+    ViewOffset, arrow_path, bezier_middle, bezier_middle_angle)
+
+
+class TestViewOffset(TestCase):
+    def test_identity(self):
+        view_offset = ViewOffset()
+        self.assertEqual(QPoint(3, 4), view_offset.to_view(QPoint(3, 4)))
+        self.assertEqual(QPoint(3, 4), view_offset.to_model(QPoint(3, 4)))
+
+    def test_offset(self):
+        view_offset = ViewOffset()
+        view_offset.set(QPoint(10, -5))
+        self.assertEqual(QPoint(13, -1), view_offset.to_view(QPoint(3, 4)))
+        self.assertEqual(QPoint(3, 4), view_offset.to_model(QPoint(13, -1)))
+
+    def test_get_returns_copy(self):
+        view_offset = ViewOffset()
+        offset = view_offset.get()
+        offset.setX(10)
+        self.assertEqual(QPoint(), view_offset.get())
+
+
+class TestBezier(TestCase):
+    def setUp(self):
+        # Symmetric curve from (0, 0) to (100, 0) bent upwards
+        self.bezier = QPainterPath()
+        self.bezier.moveTo(QPointF(0, 0))
+        self.bezier.cubicTo(QPointF(0, -40), QPointF(100, -40),
+                            QPointF(100, 0))
+
+    def test_middle(self):
+        middle = bezier_middle(self.bezier)
+        self.assertAlmostEqual(50, middle.x(), places=1)
+        self.assertAlmostEqual(-30, middle.y(), places=1)
+
+    def test_middle_angle(self):
+        self.assertAlmostEqual(0, math.sin(bezier_middle_angle(self.bezier)))
+
+    def test_arrow_around_middle(self):
+        middle = bezier_middle(self.bezier)
+        arrow = arrow_path(middle, 0, 9, 27, 2, 5.5)
+        rect = arrow.boundingRect()
+        self.assertAlmostEqual(middle.x(), rect.center().x(), delta=3)
+        self.assertAlmostEqual(middle.y(), rect.center().y(), delta=0.5)
+        self.assertAlmostEqual(27, rect.width(), delta=1)
@@ -0,0 +1,53 @@
+from unittest import TestCase
+import os
+from PySide6.QtWidgets import QApplication
+from signalflowgrapher.commands.command_handler import CommandHandler
+from signalflowgrapher.controllers.main_controller import MainController
+from signalflowgrapher.gui.graph_field import GraphField
+from signalflowgrapher.model.model import BatchEvent, Model, ObservableGraph
+
+
+class TestGraphField(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Widgets are not shown, no display is needed
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = Model()
+        command_handler = CommandHandler()
+        self.controller = MainController(self.model, command_handler)
+        self.graph_field = GraphField(self.controller, self.model,
+                                      command_handler)
+        self.model.graph = ObservableGraph()
+        self.start = self.controller.create_node(0, 0)
+        self.end = self.controller.create_node(100, 0)
+        self.branch = self.controller.create_branch(
+            self.start, self.end, 30, 10, 70, 10, 0, -20, "a")
+
+    def tearDown(self):
+        self.graph_field.deleteLater()
+
+    def test_move_node_after_branch_removed(self):
+        node_branch_widgets = \
+            self.graph_field._GraphField__node_branch_widgets
+        self.assertEqual(1, len(node_branch_widgets[self.start]))
+
+        self.controller.remove_nodes_and_branches([self.branch])
+        self.controller.move_node(self.start, 5, 5)
+        self.controller.move_node(self.end, 5, 5)
+
+        self.assertEqual([], node_branch_widgets[self.start])
+        self.assertEqual([], node_branch_widgets[self.end])
+        self.assertEqual({}, self.graph_field._GraphField__branch_widget_nodes)
+
+    def test_batch_after_branch_removed(self):
+        widget = self.graph_field._GraphField__model_widget_map[self.branch]
+        geometry = widget.geometry()
+        self.branch.remove()
+
+        # The widget of a removed branch ignores batches
+        widget.batch_event(BatchEvent([]))
+
+        self.assertEqual(geometry, widget.geometry())
@@ -0,0 +1,42 @@
+from unittest import TestCase
+import os
+from PySide6.QtWidgets import QApplication
+from signalflowgrapher.commands.command_handler import CommandHandler
+from signalflowgrapher.controllers.main_controller import MainController
+from signalflowgrapher.gui.graph_view import GraphView
+from signalflowgrapher.model.model import Model, ObservableGraph
+
+
+class TestGraphView(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Items are not shown, no display is needed
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = Model()
+        command_handler = CommandHandler()
+        self.controller = MainController(self.model, command_handler)
+        self.graph_view = GraphView(self.controller, self.model,
+                                    command_handler)
+        self.model.graph = ObservableGraph()
+        self.start = self.controller.create_node(0, 0)
+        self.end = self.controller.create_node(100, 0)
+        self.branch = self.controller.create_branch(
+            self.start, self.end, 30, 10, 70, 10, 0, -20, "a")
+
+    def tearDown(self):
+        self.graph_view.deleteLater()
+
+    def test_move_node_after_branch_removed(self):
+        node_branch_items = self.graph_view._GraphView__node_branch_items
+        self.assertEqual(1, len(node_branch_items[self.start]))
+
+        self.controller.remove_nodes_and_branches([self.branch])
+        self.controller.move_node(self.start, 5, 5)
+        self.controller.move_node(self.end, 5, 5)
+
+        self.assertEqual([], node_branch_items[self.start])
+        self.assertEqual([], node_branch_items[self.end])
+        self.assertEqual({}, self.graph_view._GraphView__branch_item_nodes)
@@ -0,0 +1,117 @@
+from unittest import TestCase
+from os import path
+import json
+import shutil
+import tempfile
+import signalflowgrapher.resources.examples.SC_analysis__schmid18 as examples
+from signalflowgrapher.io.columnar import (ColumnarExport, ColumnarImport,
+                                           is_columnar_file)
+from signalflowgrapher.model.model import GraphBuilder, ObservableGraph
+
+
+class TestColumnar(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = path.join(self.directory, "graph.sfgc")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def __round_trip(self, data):
+        ColumnarExport().write_dict(data, self.path)
+        return ColumnarImport().read_from_columnar(self.path)
+
+    def test_is_columnar_file(self):
+        self.assertTrue(is_columnar_file("graph.sfgc"))
+        self.assertTrue(is_columnar_file("GRAPH.SFGC"))
+        self.assertFalse(is_columnar_file("graph.sfg"))
+        self.assertFalse(is_columnar_file("graph.json"))
+
+    def test_round_trip_example(self):
+        example = path.join(path.dirname(examples.__file__), "fig_01.sfg")
+        with open(example) as f:
+            content = f.read()
+
+        data = self.__round_trip(json.loads(content))
+
+        self.assertEqual(content.strip(),
+                         json.dumps(data, indent=4).strip())
+
+    def test_round_trip_numbers_and_strings(self):
+        data = {"nodes": [{"id": "0" * 31 + "1",
+                           "label_dx": 0,
+                           "label_dy": 30.5,
+                           "name": "V_{in} µ",
+                           "x": -2 ** 40,
+                           "y": 0.1},
+                          {"id": "0" * 31 + "2",
+                           "label_dx": 0,
+                           "label_dy": 30,
+                           "name": "",
+                           "x": 1e300,
+                           "y": -0.0}],
+                "branches": [{"id": "0" * 31 + "3",
+                              "weight": "V_{in} µ",
+                              "start": "0" * 31 + "1",
+                              "end": "0" * 31 + "2",
+                              "label_dx": 0,
+                              "label_dy": -20,
+                              "spline1_x": 1.5,
+                              "spline1_y": 2,
+                              "spline2_x": 3,
+                              "spline2_y": 4.25}],
+                "grid_pos": [10, 20],
+                "version": "2.0"}
+
+        result = self.__round_trip(data)
+
+        self.assertEqual(data, result)
+        self.assertEqual(json.dumps(data), json.dumps(result))
+
+    def test_write_as_columnar(self):
+        builder = GraphBuilder()
+        start = builder.add_node(0, 0, "start")
+        end = builder.add_node(100, 0, "end")
+        builder.add_branch(start, end, "a")
+        builder.add_branch(end, start, "b")
+
+        ColumnarExport().write_as_columnar(builder, (5, 5), self.path)
+        data = ColumnarImport().read_from_columnar(self.path)
+
+        self.assertEqual((5, 5), tuple(data.pop("grid_pos")))
+        self.assertEqual("2.0", data.pop("version"))
+        self.assertEqual(builder.to_dict(), data)
+        graph = ObservableGraph.from_dict(data)
+        self.assertEqual(2, len(graph.nodes))
+        self.assertEqual({"a", "b"},
+                         {branch.weight for branch in graph.branches})
+
+    def test_write_unknown_node(self):
+        builder = GraphBuilder()
+        start = builder.add_node(0, 0)
+        end = builder.add_node(100, 0)
+        builder.add_branch(start, end)
+        data = builder.to_dict()
+        data["nodes"].pop()
+
+        with self.assertRaises(ValueError):
+            ColumnarExport().write_dict(data, self.path)
+
+    def test_read_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a columnar graph file")
+
+        with self.assertRaises(ValueError):
+            ColumnarImport().read_from_columnar(self.path)
+
+    def test_read_truncated_file(self):
+        builder = GraphBuilder()
+        builder.add_node(0, 0, "node")
+        ColumnarExport().write_dict(builder.to_dict(), self.path)
+        with open(self.path, "rb") as f:
+            content = f.read()
+        with open(self.path, "wb") as f:
+            f.write(content[:-4])
+
+        with self.assertRaises(ValueError):
+            ColumnarImport().read_from_columnar(self.path)
@@ -1,6 +1,10 @@
+import json
 from unittest import TestCase
 from unittest.mock import MagicMock
-from signalflowgrapher.model.model import CurvedBranch, PositionedNode
+from signalflowgrapher.model.model import (
+    BatchEvent, CurvedBranch, CurvedBranchTransformedEvent, GraphBuilder,
+    LabelChangedTextEvent, ObservableGraph, PositionedNode,
+    PositionedNodeMovedEvent)
 
 
 class TestCurvedBranch(TestCase):
@@ -122,6 +126,28 @@ class TestCurvedBranch(TestCase):
         self.assertEqual(model.label_dy, 10)
         self.assertEqual(model.id.hex, '3a2e4e76baac4b408c49e79be48ce4e1')
 
+    def test_from_dict_nodes_by_id(self):
+        graph = ObservableGraph()
+        start_node = PositionedNode(graph, 0, 0, 0, 0)
+        end_node = PositionedNode(graph, 10, 0, 0, 0)
+        dict = {'id': '3a2e4e76baac4b408c49e79be48ce4e1',
+                'weight': 'test',
+                'start': start_node.id.hex,
+                'end': end_node.id.hex,
+                'label_dx': 5,
+                'label_dy': 10,
+                'spline1_x': 10,
+                'spline1_y': 20,
+                'spline2_x': 30,
+                'spline2_y': 40}
+
+        model = CurvedBranch.from_dict(dict,
+                                       {start_node.id.hex: start_node,
+                                        end_node.id.hex: end_node})
+        self.assertIs(start_node, model.start)
+        self.assertIs(end_node, model.end)
+        self.assertEqual(model.label_text, "test")
+
 
 class PositionedNodeTest(TestCase):
     def test_properties(self):
@@ -181,3 +207,160 @@ class PositionedNodeTest(TestCase):
         self.assertEqual(15, model.label_dx)
         self.assertEqual(20, model.label_dy)
         self.assertEqual("test name", model.name)
+
+
+class TestObservableGraph(TestCase):
+    def setUp(self):
+        self.graph = ObservableGraph()
+        self.node_1 = PositionedNode(self.graph, 0, 0, 0, 0)
+        self.node_2 = PositionedNode(self.graph, 10, 0, 0, 0)
+        self.branch = CurvedBranch(self.node_1, self.node_2,
+                                   0, 0, 10, 0, 0, 0, "a")
+        self.events = []
+        self.graph.observe(self.events.append)
+
+    def test_batch_coalesces_moves(self):
+        self.graph.begin_batch()
+        self.graph.move_node_relative(self.node_1, 1, 2)
+        self.graph.transform_branch(self.branch, 1, 2, 0, 0)
+        self.graph.move_node_relative(self.node_2, 5, 5)
+        self.graph.move_node_relative(self.node_1, 3, 4)
+        self.graph.transform_branch(self.branch, 3, 4, 0, 0)
+        self.assertEqual([], self.events)
+        self.graph.end_batch()
+
+        self.assertEqual(1, len(self.events))
+        self.assertIsInstance(self.events[0], BatchEvent)
+        node_1_event, node_2_event, branch_event = self.events[0].events
+
+        self.assertIsInstance(node_1_event, PositionedNodeMovedEvent)
+        self.assertIs(self.node_1, node_1_event.node)
+        self.assertEqual((4, 6), (node_1_event.dx, node_1_event.dy))
+        self.assertIs(self.node_2, node_2_event.node)
+        self.assertEqual((5, 5), (node_2_event.dx, node_2_event.dy))
+
+        self.assertIsInstance(branch_event, CurvedBranchTransformedEvent)
+        self.assertIs(self.branch, branch_event.branch)
+        self.assertEqual((4, 6, 0, 0), (branch_event.spline1_dx,
+                                        branch_event.spline1_dy,
+                                        branch_event.spline2_dx,
+                                        branch_event.spline2_dy))
+
+    def test_nested_batch(self):
+        self.graph.begin_batch()
+        self.graph.begin_batch()
+        self.graph.move_node_relative(self.node_1, 1, 2)
+        self.graph.end_batch()
+        self.assertEqual([], self.events)
+        self.graph.end_batch()
+
+        self.assertEqual(1, len(self.events))
+        self.assertEqual(1, len(self.events[0].events))
+
+    def test_batch_keeps_order_of_other_events(self):
+        self.graph.begin_batch()
+        self.graph.move_node_relative(self.node_1, 1, 2)
+        self.graph.set_node_name(self.node_1, "x")
+        self.graph.move_node_relative(self.node_1, 1, 2)
+        self.graph.end_batch()
+
+        # The name change is notified between the two batches
+        self.assertIsInstance(self.events[0], BatchEvent)
+        self.assertIsInstance(self.events[1], LabelChangedTextEvent)
+        self.assertIsInstance(self.events[-1], BatchEvent)
+        self.assertEqual(1, len(self.events[-1].events))
+
+    def test_no_batch(self):
+        self.graph.move_node_relative(self.node_1, 1, 2)
+        self.assertIsInstance(self.events[0], PositionedNodeMovedEvent)
+
+    def test_from_dict(self):
+        self.node_1.name = "x"
+        dict = json.loads(json.dumps(self.graph.to_dict()))
+        graph = ObservableGraph.from_dict(dict)
+        self.assertEqual(sorted(self.graph.to_dict()["nodes"],
+                                key=lambda node: node["id"]),
+                         sorted(graph.to_dict()["nodes"],
+                                key=lambda node: node["id"]))
+        self.assertEqual(self.graph.to_dict()["branches"],
+                         graph.to_dict()["branches"])
+
+        branch, = graph.branches
+        self.assertEqual(self.node_1.id, branch.start.id)
+        self.assertEqual(self.node_2.id, branch.end.id)
+        self.assertEqual({branch}, branch.start.outgoing)
+        self.assertEqual({branch}, branch.end.ingoing)
+
+        # Changes after loading are notified
+        events = []
+        graph.observe(events.append)
+        graph.move_node_relative(branch.start, 1, 2)
+        self.assertIsInstance(events[0], PositionedNodeMovedEvent)
+
+    def test_end_batch_without_begin(self):
+        self.assertRaises(Exception, self.graph.end_batch)
+
+
+class TestGraphBuilder(TestCase):
+    def setUp(self):
+        self.builder = GraphBuilder()
+        self.start = self.builder.add_node(0, 0, "in")
+        self.end = self.builder.add_node(100, 20, "out")
+
+    def test_build(self):
+        branch_id = self.builder.add_branch(self.start, self.end, "a")
+        loop_id = self.builder.add_branch(self.end, self.end, "b",
+                                          (90, -80), (110, -80), 0, -40)
+        graph = self.builder.build()
+
+        nodes = {node.id.hex: node for node in graph.nodes}
+        self.assertEqual({self.start, self.end}, set(nodes))
+        self.assertEqual("in", nodes[self.start].name)
+        self.assertEqual((100, 20), (nodes[self.end].x, nodes[self.end].y))
+
+        branches = {branch.id.hex: branch for branch in graph.branches}
+        branch = branches[branch_id]
+        self.assertIs(nodes[self.start], branch.start)
+        self.assertIs(nodes[self.end], branch.end)
+        self.assertEqual("a", branch.weight)
+        # Straight line without splines
+        self.assertEqual((50, 10, 50, 10), (branch.spline1_x,
+                                            branch.spline1_y,
+                                            branch.spline2_x,
+                                            branch.spline2_y))
+
+        loop = branches[loop_id]
+        self.assertIs(nodes[self.end], loop.start)
+        self.assertEqual((90, -80, 110, -80), (loop.spline1_x,
+                                               loop.spline1_y,
+                                               loop.spline2_x,
+                                               loop.spline2_y))
+        self.assertEqual(-40, loop.label_dy)
+
+    def test_build_twice(self):
+        self.builder.add_branch(self.start, self.end)
+        graph_1 = self.builder.build()
+        graph_2 = self.builder.build()
+        self.assertEqual(2, len(graph_2.nodes))
+        self.assertEqual(1, len(graph_2.branches))
+        self.assertTrue(graph_1.nodes.isdisjoint(graph_2.nodes))
+
+    def test_add_branch_unknown_node(self):
+        self.assertRaises(ValueError, self.builder.add_branch,
+                          self.start, "unknown")
+        self.assertEqual([], self.builder.to_dict()["branches"])
+
+    def test_add_self_loop_without_splines(self):
+        self.assertRaises(ValueError, self.builder.add_branch,
+                          self.start, self.start)
+
+    def test_to_dict(self):
+        self.builder.add_branch(self.start, self.end, "a")
+        dict = self.builder.to_dict()
+        graph = ObservableGraph.from_dict(json.loads(json.dumps(dict)))
+        self.assertEqual(sorted(self.builder.to_dict()["nodes"],
+                                key=lambda node: node["id"]),
+                         sorted(graph.to_dict()["nodes"],
+                                key=lambda node: node["id"]))
+        self.assertEqual(self.builder.to_dict()["branches"],
+                         graph.to_dict()["branches"])
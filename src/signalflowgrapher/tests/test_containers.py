@@ -0,0 +1,18 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+
+class TestContainers(TestCase):
+    def test_no_sympy_import(self):
+        # SymPy and jsonschema are imported on first use, not at startup
+        code = ("import sys\n"
+                "import signalflowgrapher.containers\n"
+                "print(any(m.split('.')[0] in ('sympy', 'jsonschema')\n"
+                "          for m in sys.modules))")
+        # The child interpreter finds the package like the test runner
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run([sys.executable, "-c", code], env=env,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual("False", output.stdout.strip())
@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from importlib import resources
+from io import StringIO
+from unittest import TestCase
+from signalflowgrapher.tools.mason import main, find_graph_files
+
+examples = resources.files(
+    "signalflowgrapher.resources.examples.SC_analysis__schmid18")
+
+
+class TestMason(TestCase):
+
+    def test_json(self):
+        with resources.as_file(examples.joinpath("fig_02.sfg")) as path:
+            exit_code, stdout, _ = self.__run(
+                [str(path), "--start", "V_in",
+                 "--end", "V_out", "--end", "V_2", "--workers", "1"])
+
+        self.assertEqual(0, exit_code)
+        results = json.loads(stdout)
+        self.assertEqual(["V_out", "V_2"],
+                         [result["end"] for result in results])
+        self.assertEqual("-A*G*Z_2/(A*C*Z_2*s + 1)",
+                         results[0]["result"]["evaluated"])
+
+    def test_methods_equal(self):
+        with resources.as_file(examples.joinpath("fig_02.sfg")) as path:
+            outputs = [self.__run([str(path), "--start", "V_in",
+                                   "--end", "V_out", "--method", method])
+                       for method in ["loops", "matrix"]]
+
+        evaluated = [json.loads(stdout)[0]["result"]["evaluated"]
+                     for _, stdout, _ in outputs]
+        self.assertEqual(evaluated[0], evaluated[1])
+
+    def test_directory(self):
+        with resources.as_file(examples) as directory:
+            files = find_graph_files([str(directory)])
+            exit_code, stdout, stderr = self.__run(
+                [str(directory), "--start", "V_in", "--end", "V_out",
+                 "--format", "python", "--workers", "2"])
+
+        self.assertEqual(5, len(files))
+        # Only fig_02 has nodes with the given names
+        self.assertEqual(1, exit_code)
+        self.assertEqual(4, len(stderr.strip().splitlines()))
+        self.assertIn("import sympy as sp", stdout)
+
+    def test_no_gui_import(self):
+        code = ("import sys\n"
+                "from signalflowgrapher.tools.mason import main\n"
+                "print(any(m.startswith('PySide6') for m in sys.modules))")
+        # The child interpreter finds the package like the test runner
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run([sys.executable, "-c", code], env=env,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual("False", output.stdout.strip())
+
+    def __run(self, argv):
+        stdout = StringIO()
+        stderr = StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            exit_code = main(argv)
+        return exit_code, stdout.getvalue(), stderr.getvalue()
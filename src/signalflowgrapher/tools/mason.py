@@ -0,0 +1,151 @@
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from os import listdir, path
+from typing import Dict, List
+from signalflowgrapher.io.json import JSONImport
+from signalflowgrapher.io.columnar import (COLUMNAR_FILE_EXTENSION,
+                                           ColumnarImport, is_columnar_file)
+from signalflowgrapher.io.mason_export import MasonExport
+from signalflowgrapher.model.model import ObservableGraph, PositionedNode
+from signalflowgrapher.algorithms.mason import mason_many
+from signalflowgrapher.algorithms.mason_matrix import mason_matrix
+
+# Extensions of graph files found in directories
+GRAPH_FILE_EXTENSIONS = ('.sfg', '.json', COLUMNAR_FILE_EXTENSION)
+
+
+def main(argv: List[str] = None):
+    """
+    Apply mason rule to graph files without starting the GUI.
+    """
+    parser = argparse.ArgumentParser(
+        prog="signalflowgrapher-mason",
+        description="Calculate transfer functions of .sfg/.json/.sfgc files "
+                    "using Mason's gain formula.")
+    parser.add_argument('paths', nargs='+', type=str,
+                        help='Graph files or directories containing '
+                             '.sfg/.json/.sfgc files')
+    parser.add_argument('--start', required=True, type=str,
+                        help='Name of the start node')
+    parser.add_argument('--end', required=True, type=str, action='append',
+                        help='Name of an end node, can be repeated')
+    parser.add_argument('--format', choices=['json', 'latex', 'python'],
+                        default='json', help='Output format')
+    parser.add_argument('--method', choices=['loops', 'matrix'],
+                        default='loops', help='Mason method')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of worker processes')
+    args = parser.parse_args(argv)
+
+    files = find_graph_files(args.paths)
+    analyse = partial(analyse_file,
+                      start=args.start,
+                      ends=args.end,
+                      output_format=args.format,
+                      method=args.method)
+
+    if args.workers == 1 or len(files) < 2:
+        outputs = list(map(analyse, files))
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            outputs = list(executor.map(analyse, files))
+
+    failed = False
+    results = []
+    for output in outputs:
+        if "error" in output:
+            failed = True
+            print("%s: %s" % (output["file"], output["error"]),
+                  file=sys.stderr)
+        else:
+            results.extend(output["results"])
+
+    if args.format == 'json':
+        print(json.dumps(results, indent=4))
+    else:
+        comment = '%' if args.format == 'latex' else '#'
+        for output in results:
+            print("%s %s: %s -> %s" % (comment, output["file"],
+                                       output["start"], output["end"]))
+            print(output["result"])
+            print()
+
+    return 1 if failed else 0
+
+
+def find_graph_files(paths: List[str]) -> List[str]:
+    """
+    Get graph files of the given paths, directories are replaced by
+    the graph files they contain.
+    """
+    files = []
+    for file_path in paths:
+        if path.isdir(file_path):
+            files.extend(sorted(
+                path.join(file_path, name) for name in listdir(file_path)
+                if path.splitext(name)[1].lower() in GRAPH_FILE_EXTENSIONS))
+        else:
+            files.append(file_path)
+    return files
+
+
+def analyse_file(file_path: str,
+                 start: str,
+                 ends: List[str],
+                 output_format: str,
+                 method: str) -> Dict:
+    """
+    Load graph from file and apply mason rule from start to all ends.
+    Returns dict with the results or an error message if the file
+    can not be analysed.
+    """
+    try:
+        if is_columnar_file(file_path):
+            data = ColumnarImport().read_from_columnar(file_path)
+        else:
+            data = JSONImport().read_from_json(file_path)
+        data.pop("grid_pos", None)
+        graph = ObservableGraph.from_dict(data)
+
+        start_node = __find_node(graph, start)
+        end_nodes = [__find_node(graph, end) for end in ends]
+
+        if method == 'matrix':
+            results = {end_node: mason_matrix(graph, start_node, end_node)
+                       for end_node in end_nodes}
+        else:
+            results = mason_many(graph, start_node, end_nodes, max_workers=1)
+    except Exception as e:
+        return {"file": file_path, "error": str(e) or type(e).__name__}
+
+    export = MasonExport()
+    outputs = []
+    for end, end_node in zip(ends, end_nodes):
+        result = results[end_node]
+        if output_format == 'json':
+            content = export.to_dict(result)
+        elif output_format == 'latex':
+            content = export.to_latex(result)
+        else:
+            content = export.to_python(result)
+
+        outputs.append({"file": file_path,
+                        "start": start,
+                        "end": end,
+                        "result": content})
+    return {"file": file_path, "results": outputs}
+
+
+def __find_node(graph: ObservableGraph, name: str) -> PositionedNode:
+    nodes = [node for node in graph.nodes if node.name == name]
+    if len(nodes) != 1:
+        raise ValueError("Expected exactly one node named '%s', found %s."
+                         % (name, len(nodes)))
+    return nodes[0]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,29 @@
+import argparse
+from signalflowgrapher.io.columnar import COLUMNAR_FILE_EXTENSION
+
+# Extensions of graph files that can be opened at startup
+STARTUP_FILE_EXTENSIONS = ('.sfg', '.json', COLUMNAR_FILE_EXTENSION)
+
+
+def argument_parser() -> argparse.ArgumentParser:
+    """
+    Parser of the command line arguments of the application, shared by its
+    entry points.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--language', type=str, help='Optional language name')
+    parser.add_argument(
+        '--renderer',
+        choices=['widgets', 'scene'],
+        default='widgets',
+        help='Draw the graph with one widget per element (default) or with '
+             'a graphics scene, which is faster for large graphs'
+    )
+    parser.add_argument(
+        'input_file',
+        nargs='?',
+        type=str,
+        help='Optional path to a .sfg, .json or %s file to open at startup'
+             % COLUMNAR_FILE_EXTENSION
+    )
+    return parser